@@ -1,17 +1,158 @@
-from datetime import datetime
+import asyncio
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+import functools
+import inspect
+import io
+import re
+import select
+import threading
 import time
-from typing import Optional, Any
+from typing import Callable, Iterator, Optional, Any, TypeVar
 import psycopg2
+import psycopg2.extras
 import os
 import configparser
 from dataclasses import dataclass
 
+import migrations
+from instrumentation import instrumented
+
 config = configparser.ConfigParser(interpolation=None)
 if os.path.exists("rleb_secrets.ini"):
     config.read("rleb_secrets.ini")
 else:
     config.read("rleb_secrets_sample.ini")
 
+# Connections kept warm, and the upper bound on concurrent connections.
+DB_POOL_MIN_SIZE = int(
+    os.environ.get("DB_POOL_MIN_SIZE")
+    or config.get("PostgreSQL", "DB_POOL_MIN_SIZE", fallback=None)
+    or 1
+)
+DB_POOL_MAX_SIZE = int(
+    os.environ.get("DB_POOL_MAX_SIZE")
+    or config.get("PostgreSQL", "DB_POOL_MAX_SIZE", fallback=None)
+    or 5
+)
+
+# Days of logs kept in postgres. Monthly log partitions older than this are dropped.
+LOG_RETENTION_DAYS = int(
+    os.environ.get("LOG_RETENTION_DAYS")
+    or config.get("PostgreSQL", "LOG_RETENTION_DAYS", fallback=None)
+    or 180
+)
+# Monthly log partitions created ahead of time, past the current month.
+LOG_PARTITION_MONTHS_AHEAD = 2
+# !logs and !logfind search this many recent days first, before older partitions.
+LOG_RECENT_DAYS = 31
+# Rows per INSERT statement when logs can't be written with COPY.
+LOG_INSERT_PAGE_SIZE = 500
+
+# !sql: rows per page, per-statement timeout, idle seconds before an open query is
+# closed, and the longest a single row is printed.
+YOLO_QUERY_PAGE_SIZE = 50
+YOLO_QUERY_TIMEOUT_MS = 10_000
+YOLO_QUERY_SESSION_SECONDS = 60 * 5
+YOLO_QUERY_MAX_ROW_CHARS = 500
+
+# SQL keywords !sql refuses to run, on top of the read-only transaction.
+YOLO_QUERY_BLOCKED_COMMANDS = [
+    # Write operations
+    "INSERT",
+    "UPDATE",
+    "DELETE",
+    "DROP",
+    "CREATE",
+    "ALTER",
+    "TRUNCATE",
+    "GRANT",
+    "REVOKE",
+    "EXECUTE",
+    "CALL",
+    "COPY",
+    # Esoteric and potentially dangerous commands
+    "DO",
+    "LOAD",
+    "VACUUM",
+    "LOCK",
+    "SET",
+    "PREPARE",
+    "REFRESH",
+    "REINDEX",
+    "CLUSTER",
+    "ANALYZE",
+    "COMMENT",
+    "CHECKPOINT",
+    "DISCARD",
+    "IMPORT",
+    "LISTEN",
+    "UNLISTEN",
+    "NOTIFY",
+]
+
+# Postgres NOTIFY channel that triggers publish changed table names on, see migrations.py.
+TABLE_CHANGES_CHANNEL = "rleb_table_changes"
+# Tables whose changes are published, mapped to the DataCache table they invalidate.
+WATCHED_TABLES: dict[str, Optional[str]] = {
+    "aliases": "aliases",
+    "dualflairs": "triflairs",
+    "auto_updates": None,
+}
+
+# Public DataStub methods that aren't timed by instrumentation, since they block on
+# purpose or only read in-process counters.
+UNINSTRUMENTED_METHODS = {"wait_for_table_changes", "pool_stats", "cache_stats"}
+
+T = TypeVar("T")
+
+
+def _add_months(month_start: datetime, months: int) -> datetime:
+    """Returns the first of the month `months` after `month_start`."""
+    month_index = month_start.year * 12 + month_start.month - 1 + months
+    return datetime(month_index // 12, month_index % 12 + 1, 1)
+
+
+def _reject_blocked_commands(sql: str, blocked_commands: list[str]) -> None:
+    """Raises a ValueError if `sql` contains any of `blocked_commands`."""
+    sql_upper = sql.upper()
+    for cmd in blocked_commands:
+        if cmd in sql_upper:
+            raise ValueError(
+                f"SQL command '{cmd}' is not allowed. Only SELECT queries are permitted."
+            )
+
+
+# Backslash escapes for COPY's text format. Backslash must be replaced first.
+_COPY_ESCAPES = [("\\", "\\\\"), ("\t", "\\t"), ("\n", "\\n"), ("\r", "\\r")]
+
+
+def _copy_escape(value: str) -> str:
+    for char, escaped in _COPY_ESCAPES:
+        value = value.replace(char, escaped)
+    return value
+
+
+def _copy_logs(cursor: Any, logs: list[tuple[datetime, str]]) -> None:
+    """Streams logs into public.logs with a single COPY FROM STDIN."""
+    buffer = io.StringIO()
+    for log_time, log in logs:
+        buffer.write(f"{log_time.isoformat()}\t{_copy_escape(log)}\n")
+    buffer.seek(0)
+    cursor.copy_expert("COPY public.logs (log_time, log) FROM STDIN", buffer)
+
+
+def _insert_logs(cursor: Any, logs: list[tuple[datetime, str]]) -> None:
+    """Inserts logs into public.logs with multi-row INSERT ... VALUES statements."""
+    psycopg2.extras.execute_values(
+        cursor,
+        "INSERT INTO public.logs (log_time, log) VALUES %s",
+        logs,
+        page_size=LOG_INSERT_PAGE_SIZE,
+    )
+
 
 @dataclass
 class UserStatistics:
@@ -44,9 +185,295 @@ class AutoUpdate:
     day_number: int  # represents first, second, third day (etc) of the tournament
 
 
+@dataclass
+class QueryPage:
+    """One page of !sql results."""
+
+    text: str
+    page_number: int
+    has_more: bool
+
+
+@dataclass
+class _YoloQuerySession:
+    """A !sql query whose rows are still on the server, behind a named cursor."""
+
+    connection: Any
+    cursor: Any
+    page_number: int
+    expires_at: float
+    # Row read past the end of the last page, to tell whether another page exists.
+    lookahead: Optional[tuple[Any, ...]] = None
+
+
+class ConnectionPool(object):
+    """Thread-safe pool of postgres connections shared by every Data query."""
+
+    def __init__(
+        self,
+        connect: Callable[[], Any],
+        min_size: int = 1,
+        max_size: int = 5,
+        checkout_timeout: float = 10,
+        healthcheck_seconds: float = 30,
+    ) -> None:
+        """
+        Params:
+            connect: Factory that opens a brand new postgres connection.
+            min_size: Connections opened up front and kept warm.
+            max_size: Upper bound on open connections (idle + checked out).
+            checkout_timeout: Seconds to wait for a free connection before giving up.
+            healthcheck_seconds: Idle connections older than this are pinged before reuse.
+        """
+        self._connect = connect
+        self.min_size = max(0, min_size)
+        self.max_size = max(1, max_size, self.min_size)
+        self.checkout_timeout = checkout_timeout
+        self.healthcheck_seconds = healthcheck_seconds
+
+        # Idle connections, paired with the time they were returned to the pool.
+        self._idle: list[tuple[Any, float]] = []
+        self._in_use = 0
+        self._closed = False
+        self._condition = threading.Condition()
+
+        self._stats = {
+            "created": 0,
+            "reused": 0,
+            "discarded": 0,
+            "checkouts": 0,
+            "waits": 0,
+        }
+
+        for _ in range(self.min_size):
+            self._idle.append((self._open(), time.time()))
+
+    def _open(self) -> Any:
+        connection = self._connect()
+        self._stats["created"] += 1
+        return connection
+
+    def _discard(self, connection: Any) -> None:
+        self._stats["discarded"] += 1
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+    def _is_healthy(self, connection: Any, idle_since: float) -> bool:
+        """Pings connections that sat idle long enough for postgres or the network to drop them."""
+        if time.time() - idle_since < self.healthcheck_seconds:
+            return True
+        try:
+            cursor = connection.cursor()
+            cursor.execute("SELECT 1;")
+            connection.rollback()
+            return True
+        except psycopg2.Error:
+            return False
+
+    def checkout(self) -> Any:
+        """
+        Returns a healthy connection, opening a new one if the pool has room.
+
+        The pool's lock is only held to reserve a slot. Opening or pinging the connection
+        happens after it's released, so one slow connect doesn't stall every other checkout
+        and checkin.
+        """
+        deadline = time.time() + self.checkout_timeout
+        while True:
+            connection, idle_since = self._reserve(deadline)
+            try:
+                if idle_since is None:
+                    connection = self._connect()
+                    healthy = True
+                else:
+                    healthy = self._is_healthy(connection, idle_since)
+            except BaseException:
+                self._release(connection)
+                raise
+
+            if healthy:
+                with self._condition:
+                    self._stats["created" if idle_since is None else "reused"] += 1
+                    self._stats["checkouts"] += 1
+                return connection
+            self._release(connection)
+
+    def _reserve(self, deadline: float) -> tuple[Any, Optional[float]]:
+        """
+        Takes a slot in the pool. Returns an idle connection and the time it was returned, or
+        (None, None) when the caller should open a new connection.
+        """
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise RuntimeError("Connection pool is closed.")
+                if self._idle:
+                    self._in_use += 1
+                    return self._idle.pop()
+                if self._in_use < self.max_size:
+                    self._in_use += 1
+                    return None, None
+
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    raise RuntimeError(
+                        f"Timed out waiting for a postgres connection ({self.max_size} in use)."
+                    )
+                self._stats["waits"] += 1
+                self._condition.wait(remaining)
+
+    def _release(self, connection: Any) -> None:
+        """Gives back a reserved slot whose connection failed to open or went bad."""
+        with self._condition:
+            self._in_use -= 1
+            if connection is not None:
+                self._discard(connection)
+            self._condition.notify()
+
+    def checkin(self, connection: Any, discard: bool = False) -> None:
+        """Returns a connection to the pool. Broken connections should be discarded."""
+        with self._condition:
+            self._in_use -= 1
+            if discard or self._closed:
+                self._discard(connection)
+            else:
+                self._idle.append((connection, time.time()))
+            self._condition.notify()
+
+    @contextmanager
+    def connection(self) -> Iterator[Any]:
+        """Checks out a connection for a single transaction, committing on success."""
+        connection = self.checkout()
+        discard = False
+        try:
+            with connection:
+                yield connection
+        except (psycopg2.OperationalError, psycopg2.InterfaceError):
+            discard = True
+            raise
+        finally:
+            self.checkin(connection, discard=discard)
+
+    def close(self) -> None:
+        """Closes every idle connection. Checked out connections are closed when returned."""
+        with self._condition:
+            self._closed = True
+            while self._idle:
+                connection, _ = self._idle.pop()
+                self._discard(connection)
+            self._condition.notify_all()
+
+    def stats(self) -> dict[str, int]:
+        with self._condition:
+            return {
+                **self._stats,
+                "in_use": self._in_use,
+                "idle": len(self._idle),
+                "max_size": self.max_size,
+            }
+
+
+class DataCache(object):
+    """
+    Bounded, read-through cache for Data reads.
+
+    Entries are grouped by table so a write can invalidate everything derived from
+    that table. Each table has its own TTL, and the least recently used entries are
+    evicted once max_entries is reached.
+    """
+
+    # Returned by get() on a miss, since None is a valid cached value.
+    MISS = object()
+
+    # Seconds before a cached read of each table is considered stale. Writes from any
+    # bot instance invalidate aliases and triflairs through TABLE_CHANGES_CHANNEL, so
+    # their TTL is only a backstop for a dropped listener connection.
+    TTLS: dict[str, float] = {
+        "aliases": 60 * 60 * 6,
+        "triflairs": 60 * 60 * 6,
+        "user_statistics": 60 * 5,
+    }
+    DEFAULT_TTL: float = 60
+
+    def __init__(self, max_entries: int = 512) -> None:
+        self.max_entries = max_entries
+
+        # Maps (table, key) to (expiry time, value), least recently used first.
+        self._entries: OrderedDict[tuple[str, str], tuple[float, Any]] = OrderedDict()
+        self._hits: dict[str, int] = {}
+        self._misses: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, table: str, key: str = "") -> Any:
+        """Returns the cached value, or DataCache.MISS if absent or expired."""
+        with self._lock:
+            entry = self._entries.get((table, key))
+            if entry is not None and entry[0] > time.time():
+                self._entries.move_to_end((table, key))
+                self._hits[table] = self._hits.get(table, 0) + 1
+                return entry[1]
+            if entry is not None:
+                del self._entries[(table, key)]
+            self._misses[table] = self._misses.get(table, 0) + 1
+            return DataCache.MISS
+
+    def put(self, table: str, value: Any, key: str = "") -> None:
+        ttl = DataCache.TTLS.get(table, DataCache.DEFAULT_TTL)
+        with self._lock:
+            self._entries[(table, key)] = (time.time() + ttl, value)
+            self._entries.move_to_end((table, key))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, table: str) -> None:
+        """Drops every entry read from `table`. Should be called after any write to it."""
+        with self._lock:
+            for entry_key in [k for k in self._entries if k[0] == table]:
+                del self._entries[entry_key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __contains__(self, table: str) -> bool:
+        with self._lock:
+            return any(k[0] == table for k in self._entries)
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """Returns hits, misses and live entries for each table, for !status."""
+        with self._lock:
+            tables = set(self._hits) | set(self._misses) | {k[0] for k in self._entries}
+            return {
+                table: {
+                    "hits": self._hits.get(table, 0),
+                    "misses": self._misses.get(table, 0),
+                    "entries": sum(1 for k in self._entries if k[0] == table),
+                }
+                for table in sorted(tables)
+            }
+
+
+def _instrument_methods(cls: type) -> None:
+    """Records every public method defined on `cls` in Instrumentation, as db.<method>."""
+    for attr, value in list(vars(cls).items()):
+        if (
+            attr.startswith("_")
+            or attr in UNINSTRUMENTED_METHODS
+            or not inspect.isfunction(value)
+        ):
+            continue
+        setattr(cls, attr, instrumented(f"db.{attr}")(value))
+
+
 class DataStub(object):
     _singleton: Optional["DataStub"] = None
-    _cache: dict[str, Any] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        # Times every backend the same way, whichever DATA_MODE picks.
+        super().__init_subclass__(**kwargs)
+        _instrument_methods(cls)
 
     def __init__(self) -> None:
         raise RuntimeError("Call singleton() instead")
@@ -57,8 +484,30 @@ class DataStub(object):
             cls._singleton = cls.__new__(cls)
         return cls._singleton
 
-    def yolo_query(self, sql: str) -> str:
-        return ""
+    def migrate(self) -> list[int]:
+        return []
+
+    def wait_for_table_changes(self, timeout: float) -> set[str]:
+        time.sleep(timeout)
+        return set()
+
+    def close(self) -> None:
+        pass
+
+    def pool_stats(self) -> dict[str, int]:
+        return {}
+
+    def cache_stats(self) -> dict[str, dict[str, int]]:
+        return {}
+
+    def yolo_query(self, sql: str, session_key: str = "") -> QueryPage:
+        return QueryPage("", 1, False)
+
+    def yolo_query_next(self, session_key: str = "") -> Optional[QueryPage]:
+        return None
+
+    def close_expired_yolo_sessions(self) -> None:
+        pass
 
     def get_db_tables(self) -> int:
         return 0
@@ -75,6 +524,9 @@ class DataStub(object):
     def increment_user_statistics_thanks_given(self, discord_username: str) -> None:
         pass
 
+    def flush_user_statistics(self) -> None:
+        pass
+
     def add_alias(self, long_name: str, short_name: str) -> None:
         pass
 
@@ -124,6 +576,9 @@ class DataStub(object):
     def delete_remindme(self, remindme_id: int) -> None:
         pass
 
+    def read_remindme(self, remindme_id: int) -> Optional[Remindme]:
+        return None
+
     def read_remindmes(self) -> list[Remindme]:
         return []
 
@@ -147,13 +602,28 @@ class DataStub(object):
     ) -> list[int]:
         return []
 
+    def write_already_warned_scheduled_posts(self, posts: list[tuple[int, int]]) -> None:
+        pass
+
+    def write_already_confirmed_scheduled_posts(
+        self, posts: list[tuple[int, int]]
+    ) -> None:
+        pass
+
     def write_to_logs(self, logs: list[tuple[datetime, str]]) -> None:
         pass
 
-    def read_logs(self, count: int = 10) -> list[tuple[datetime, str]]:
+    def maintain_log_partitions(self) -> tuple[list[str], list[str]]:
+        return [], []
+
+    def read_logs(
+        self, count: int = 10, before: Optional[datetime] = None
+    ) -> list[tuple[datetime, str]]:
         return []
 
-    def read_logs_matching(self, search_string: str, count: int = 10) -> list[tuple[datetime, str]]:
+    def read_logs_matching(
+        self, search_string: str, count: int = 10, before: Optional[datetime] = None
+    ) -> list[tuple[datetime, str]]:
         return []
 
     def add_triflair(self, flair_to_add: str) -> None:
@@ -166,23 +636,27 @@ class DataStub(object):
         pass
 
 
+_instrument_methods(DataStub)
+
+
 class Data(DataStub):
     """Bridge between RLEB and postgres DB"""
 
     _singleton: Optional["Data"] = None
 
-    # Generic cache, mapping a string key to any object.
-    _cache: dict[str, Any] = {}
+    # Read-through cache for small, hot tables.
+    _cache = DataCache()
+
+    # Pool backing every query. Created lazily per instance, see pooled_connection().
+    _pool: Optional[ConnectionPool] = None
+    _pool_lock = threading.Lock()
+
+    # Autocommit connection LISTENing on TABLE_CHANGES_CHANNEL, see wait_for_table_changes().
+    _listen_connection: Any = None
 
     def __init__(self) -> None:
         raise RuntimeError("Call singleton() instead")
 
-    @staticmethod
-    def _empty_cache(cache_key: str) -> None:
-        """Safely removes cache_key and its memory from the internal data cache."""
-        if cache_key in Data._cache:
-            del Data._cache[cache_key]
-
     @classmethod
     def singleton(cls) -> "DataStub":
         if cls._singleton is None:
@@ -193,18 +667,37 @@ class Data(DataStub):
             if data_mode == "real":
                 # Use real PostgreSQL database
                 cls._singleton = cls.__new__(cls)  # type: ignore[assignment]
+                cls._singleton._initialize()  # type: ignore[union-attr]
             elif data_mode == "test":
                 # Use test stub with sample data
                 from test_data_stub import DataStubWithSampleData
 
                 cls._singleton = DataStubWithSampleData.singleton()  # type: ignore[assignment]
+            elif data_mode == "sqlite":
+                # Use a local SQLite file, for single-node deployments
+                from sqlite_data import SqliteData
+
+                cls._singleton = SqliteData.singleton()  # type: ignore[assignment]
             else:
                 # Use empty stub (default for "stubbed" or any other value)
                 cls._singleton = cls.__new__(DataStub)  # type: ignore[assignment]
         return cls._singleton  # type: ignore[return-value]
 
+    def _initialize(self) -> None:
+        """Sets up per-instance state, since singleton() bypasses __init__."""
+        # Unflushed user_statistics deltas, mapping username to [commands_used, thanks_given].
+        self._pending_user_statistics: dict[str, list[int]] = {}
+        self._pending_lock = threading.Lock()
+
+        # Held while flushing or reading user_statistics, so reads never miss or double count a delta.
+        self._user_statistics_lock = threading.Lock()
+
+        # Open !sql queries, keyed by session_key (the discord channel).
+        self._yolo_sessions: dict[str, _YoloQuerySession] = {}
+        self._yolo_lock = threading.Lock()
+
     def postgres_connection(self) -> Any:
-        """Returns the postgresSQL connection."""
+        """Opens a new postgresSQL connection. Queries should use pooled_connection() instead."""
         connection = psycopg2.connect(
             dbname=os.environ.get("DB_NAME") or config["PostgreSQL"]["DB_NAME"],
             host=os.environ.get("DB_HOST") or config["PostgreSQL"]["DB_HOST"],
@@ -215,56 +708,208 @@ class Data(DataStub):
         )
         return connection
 
-    def yolo_query(self, sql: str) -> str:
+    @contextmanager
+    def pooled_connection(self) -> Iterator[Any]:
+        """Yields a pooled postgresSQL connection inside a transaction."""
+        if self._pool is None:
+            with Data._pool_lock:
+                if self._pool is None:
+                    self._pool = ConnectionPool(
+                        self.postgres_connection,
+                        min_size=DB_POOL_MIN_SIZE,
+                        max_size=DB_POOL_MAX_SIZE,
+                    )
+        with self._pool.connection() as connection:
+            yield connection
+
+    def migrate(self) -> list[int]:
+        """Applies pending schema migrations. Returns the versions that were applied."""
+        db = self.postgres_connection()
+        try:
+            return migrations.apply_migrations(db)
+        finally:
+            db.close()
+
+    def wait_for_table_changes(self, timeout: float) -> set[str]:
+        """
+        Blocks up to `timeout` seconds for changes to WATCHED_TABLES, made by any bot instance.
+
+        Matching cache entries are invalidated before returning the names of the changed
+        tables. Every watched table is reported after (re)connecting the listener, since
+        notifications sent while it was down are lost.
+        """
+        if self._listen_connection is None:
+            connection = self.postgres_connection()
+            connection.autocommit = True
+            connection.cursor().execute(f"LISTEN {TABLE_CHANGES_CHANNEL};")
+            self._listen_connection = connection
+            changed = set(WATCHED_TABLES)
+        else:
+            connection = self._listen_connection
+            try:
+                if not connection.notifies:
+                    select.select([connection], [], [], timeout)
+                connection.poll()
+            except psycopg2.Error:
+                # Reconnects on the next call.
+                connection.close()
+                self._listen_connection = None
+                raise
+            changed = {
+                n.payload for n in connection.notifies if n.payload in WATCHED_TABLES
+            }
+            connection.notifies.clear()
+
+        for table in changed:
+            cache_table = WATCHED_TABLES[table]
+            if cache_table is not None:
+                Data._cache.invalidate(cache_table)
+        return changed
+
+    def close(self) -> None:
+        """Flushes buffered writes and closes the connection pool. Should be called once on shutdown."""
+        self.flush_user_statistics()
+        with self._yolo_lock:
+            sessions = list(self._yolo_sessions.values())
+            self._yolo_sessions = {}
+        for session in sessions:
+            self._close_yolo_session(session)
+        if self._listen_connection is not None:
+            self._listen_connection.close()
+            self._listen_connection = None
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
+
+    def pool_stats(self) -> dict[str, int]:
+        """Returns counters for the connection pool, for !status."""
+        if self._pool is None:
+            return {}
+        return self._pool.stats()
+
+    def cache_stats(self) -> dict[str, dict[str, int]]:
+        """Returns hit/miss counters for the read cache, for !status."""
+        return Data._cache.stats()
+
+    def yolo_query(self, sql: str, session_key: str = "") -> QueryPage:
+        """
+        Runs a read-only query and returns its first page of rows.
+
+        Rows are streamed through a named server-side cursor, so only one page is ever
+        held in memory. If there are more rows, the query stays open under `session_key`
+        for yolo_query_next(), until it is exhausted or idle for YOLO_QUERY_SESSION_SECONDS.
+        """
         # Security: Denylist dangerous SQL commands (backup to read-only transaction)
-        blocked_commands = [
-            # Write operations
-            "INSERT",
-            "UPDATE",
-            "DELETE",
-            "DROP",
-            "CREATE",
-            "ALTER",
-            "TRUNCATE",
-            "GRANT",
-            "REVOKE",
-            "EXECUTE",
-            "CALL",
-            "COPY",
-            # Esoteric and potentially dangerous commands
-            "DO",
-            "LOAD",
-            "VACUUM",
-            "LOCK",
-            "SET",
-            "PREPARE",
-            "REFRESH",
-            "REINDEX",
-            "CLUSTER",
-            "ANALYZE",
-            "COMMENT",
-            "CHECKPOINT",
-            "DISCARD",
-            "IMPORT",
-            "LISTEN",
-            "UNLISTEN",
-            "NOTIFY",
-        ]
-        sql_upper = sql.upper()
-        for cmd in blocked_commands:
-            if cmd in sql_upper:
-                raise ValueError(
-                    f"SQL command '{cmd}' is not allowed. Only SELECT queries are permitted."
-                )
+        _reject_blocked_commands(sql, YOLO_QUERY_BLOCKED_COMMANDS)
+
+        for session in self._take_yolo_sessions(session_key):
+            self._close_yolo_session(session)
 
+        db = self.postgres_connection()
+        session = _YoloQuerySession(db, None, 0, 0.0)
         try:
-            with self.postgres_connection() as db:
-                cursor = db.cursor()
-                cursor.execute("SET TRANSACTION READ ONLY;")
-                cursor.execute(sql)
-                response = cursor.fetchall()
-                return "\n".join([str(r) for r in response])
-        except psycopg2.Error as e:
+            cursor = db.cursor()
+            cursor.execute("SET TRANSACTION READ ONLY;")
+            cursor.execute(
+                "SET LOCAL statement_timeout = %s;", (YOLO_QUERY_TIMEOUT_MS,)
+            )
+            # The server ends a transaction left open past the session's lifetime itself,
+            # so an abandoned query never holds its locks for long.
+            cursor.execute(
+                "SET LOCAL idle_in_transaction_session_timeout = %s;",
+                (YOLO_QUERY_SESSION_SECONDS * 1000,),
+            )
+            session.cursor = db.cursor(name=f"yolo_{session_key or 'query'}")
+            session.cursor.itersize = YOLO_QUERY_PAGE_SIZE
+            session.cursor.execute(sql)
+            page = self._fetch_yolo_page(session)
+        except Exception as e:
+            self._close_yolo_session(session)
+            raise self._yolo_error(e) from e
+        self._keep_yolo_session(session_key, session, page)
+        return page
+
+    def yolo_query_next(self, session_key: str = "") -> Optional[QueryPage]:
+        """Returns the next page of the open query for `session_key`, or None if there is none."""
+        with self._yolo_lock:
+            session = self._yolo_sessions.pop(session_key, None)
+        if session is None:
+            return None
+        if session.expires_at <= time.time():
+            self._close_yolo_session(session)
+            return None
+        try:
+            page = self._fetch_yolo_page(session)
+        except Exception as e:
+            self._close_yolo_session(session)
+            raise self._yolo_error(e) from e
+        self._keep_yolo_session(session_key, session, page)
+        return page
+
+    def close_expired_yolo_sessions(self) -> None:
+        """Closes !sql queries left idle past YOLO_QUERY_SESSION_SECONDS."""
+        for session in self._take_yolo_sessions():
+            self._close_yolo_session(session)
+
+    def _take_yolo_sessions(
+        self, session_key: Optional[str] = None
+    ) -> list[_YoloQuerySession]:
+        """
+        Removes the expired sessions, and `session_key`'s, from the open ones. They are
+        closed by the caller, so the lock is never held over a round trip to the db.
+        """
+        now = time.time()
+        with self._yolo_lock:
+            taken = [
+                key
+                for key, session in self._yolo_sessions.items()
+                if key == session_key or session.expires_at <= now
+            ]
+            return [self._yolo_sessions.pop(key) for key in taken]
+
+    def _keep_yolo_session(
+        self, session_key: str, session: _YoloQuerySession, page: QueryPage
+    ) -> None:
+        """Keeps a session open for its next page, or closes it once it's out of rows."""
+        if not page.has_more:
+            self._close_yolo_session(session)
+            return
+        session.expires_at = time.time() + YOLO_QUERY_SESSION_SECONDS
+        with self._yolo_lock:
+            # A newer query from the same channel replaces this one.
+            replaced = self._yolo_sessions.pop(session_key, None)
+            self._yolo_sessions[session_key] = session
+        if replaced is not None:
+            self._close_yolo_session(replaced)
+
+    def _fetch_yolo_page(self, session: _YoloQuerySession) -> QueryPage:
+        """Fetches one page from an open query."""
+        rows = [session.lookahead] if session.lookahead is not None else []
+        rows.extend(session.cursor.fetchmany(YOLO_QUERY_PAGE_SIZE + 1 - len(rows)))
+        has_more = len(rows) > YOLO_QUERY_PAGE_SIZE
+        session.lookahead = rows[YOLO_QUERY_PAGE_SIZE] if has_more else None
+        session.page_number += 1
+        return QueryPage(
+            "\n".join(
+                [str(r)[:YOLO_QUERY_MAX_ROW_CHARS] for r in rows[:YOLO_QUERY_PAGE_SIZE]]
+            ),
+            session.page_number,
+            has_more,
+        )
+
+    def _close_yolo_session(self, session: _YoloQuerySession) -> None:
+        try:
+            session.connection.rollback()
+        except psycopg2.Error:
+            # The connection is already broken, closing it is all that's left.
+            pass
+        session.connection.close()
+
+    def _yolo_error(self, e: Exception) -> ValueError:
+        """Turns an error from a !sql query into a ValueError with a readable message."""
+        if isinstance(e, ValueError):
+            return e
+        if isinstance(e, psycopg2.Error):
             # Provide detailed database error information
             error_msg = f"Database error: {e.pgerror if e.pgerror else str(e)}"
             if e.pgcode:
@@ -274,15 +919,14 @@ class Data(DataStub):
                     error_msg += f"\nDetails: {e.diag.message_primary}"
                 if e.diag.message_detail:
                     error_msg += f"\n{e.diag.message_detail}"
-            raise ValueError(error_msg) from e
-        except Exception as e:
-            # Catch any other unexpected errors
-            raise ValueError(
-                f"Unexpected error executing query: {type(e).__name__}: {str(e)}"
-            ) from e
+            return ValueError(error_msg)
+        # Catch any other unexpected errors
+        return ValueError(
+            f"Unexpected error executing query: {type(e).__name__}: {str(e)}"
+        )
 
     def get_db_tables(self) -> int:
-        with self.postgres_connection() as db:
+        with self.pooled_connection() as db:
             cursor = db.cursor()
             cursor.execute(
                 """SELECT count(*) FROM pg_catalog.pg_tables where tableowner='pi' and schemaname='public';"""
@@ -290,94 +934,146 @@ class Data(DataStub):
             count: int = cursor.fetchone()[0]
         return count
 
-    def read_all_user_statistics(self) -> list[UserStatistics]:
-        if "user_statistics" in Data._cache:
-            return Data._cache["user_statistics"]  # type: ignore[no-any-return]
-
-        with self.postgres_connection() as db:
-            cursor = db.cursor()
-            cursor.execute("""SELECT * FROM public.user_statistics""")
-            statistics = []
-            for s in list(cursor.fetchall()):
-                statistics.append(UserStatistics(s[0], s[1], s[2]))
+    def _with_pending_user_statistics(
+        self, statistics: Optional[UserStatistics], discord_username: str
+    ) -> Optional[UserStatistics]:
+        """Returns a copy of `statistics` with the unflushed deltas for the user applied."""
+        with self._pending_lock:
+            commands_used, thanks_given = self._pending_user_statistics.get(
+                discord_username, (0, 0)
+            )
+        if commands_used == 0 and thanks_given == 0:
             return statistics
+        if statistics is None:
+            return UserStatistics(discord_username, commands_used, thanks_given)
+        return UserStatistics(
+            discord_username,
+            statistics.commands_used + commands_used,
+            statistics.thanks_given + thanks_given,
+        )
+
+    def read_all_user_statistics(self) -> list[UserStatistics]:
+        with self._user_statistics_lock:
+            cached = Data._cache.get("user_statistics")
+            if cached is not DataCache.MISS:
+                statistics = cached
+            else:
+                with self.pooled_connection() as db:
+                    cursor = db.cursor()
+                    cursor.execute("""SELECT * FROM public.user_statistics""")
+                    statistics = []
+                    for s in list(cursor.fetchall()):
+                        statistics.append(UserStatistics(s[0], s[1], s[2]))
+                    Data._cache.put("user_statistics", statistics)
+
+            with self._pending_lock:
+                pending_usernames = set(self._pending_user_statistics)
+            merged = []
+            for stat in statistics:
+                merged.append(
+                    self._with_pending_user_statistics(stat, stat.discord_username)
+                )
+                pending_usernames.discard(stat.discord_username)
+            for discord_username in sorted(pending_usernames):
+                merged.append(
+                    self._with_pending_user_statistics(None, discord_username)
+                )
+            return [stat for stat in merged if stat is not None]
 
     def read_user_statistics(self, discord_username: str) -> Optional[UserStatistics]:
-        if f"user_statistics_{discord_username}" in Data._cache:
-            return Data._cache[f"user_statistics_{discord_username}"]  # type: ignore[no-any-return]
+        with self._user_statistics_lock:
+            cached = Data._cache.get("user_statistics", discord_username)
+            if cached is not DataCache.MISS:
+                return self._with_pending_user_statistics(cached, discord_username)
 
-        with self.postgres_connection() as db:
-            cursor = db.cursor()
-            cursor.execute(
-                """SELECT * FROM public.user_statistics WHERE discord_user_name = %s""",
-                (discord_username,),
-            )
-            s = cursor.fetchone()
-            if not s:
-                return None
-            return UserStatistics(s[0], s[1], s[2])
+            with self.pooled_connection() as db:
+                cursor = db.cursor()
+                cursor.execute(
+                    """SELECT * FROM public.user_statistics WHERE discord_user_name = %s""",
+                    (discord_username,),
+                )
+                s = cursor.fetchone()
+                statistics = UserStatistics(s[0], s[1], s[2]) if s else None
+                Data._cache.put("user_statistics", statistics, discord_username)
+            return self._with_pending_user_statistics(statistics, discord_username)
 
     def increment_user_statistics_commands_used(self, discord_username: str) -> None:
-        Data._empty_cache(f"user_statistics_{discord_username}")
-        Data._empty_cache("user_statistics")
-
-        with self.postgres_connection() as db:
-            cursor = db.cursor()
-            cursor.execute(
-                """INSERT INTO public.user_statistics (discord_user_name, commands_used, thanks_given)
-               VALUES (%s, 1, 0)
-               ON CONFLICT (discord_user_name)
-               DO UPDATE SET commands_used = user_statistics.commands_used + 1;""",
-                (discord_username,),
-            )
+        """Buffers the increment in memory. It is written by the next flush_user_statistics()."""
+        with self._pending_lock:
+            self._pending_user_statistics.setdefault(discord_username, [0, 0])[0] += 1
 
     def increment_user_statistics_thanks_given(self, discord_username: str) -> None:
-        Data._empty_cache(f"user_statistics_{discord_username}")
-        Data._empty_cache("user_statistics")
-
-        with self.postgres_connection() as db:
-            cursor = db.cursor()
-            cursor.execute(
-                """INSERT INTO public.user_statistics (discord_user_name, commands_used, thanks_given)
-               VALUES (%s, 1, 1)
-               ON CONFLICT (discord_user_name)
-               DO UPDATE SET thanks_given = user_statistics.thanks_given + 1;""",
-                (discord_username,),
-            )
+        """Buffers the increment in memory. It is written by the next flush_user_statistics()."""
+        with self._pending_lock:
+            self._pending_user_statistics.setdefault(discord_username, [0, 0])[1] += 1
+
+    def flush_user_statistics(self) -> None:
+        """Writes all buffered user_statistics increments in one upsert."""
+        with self._user_statistics_lock:
+            with self._pending_lock:
+                pending = self._pending_user_statistics
+                self._pending_user_statistics = {}
+            if not pending:
+                return
+
+            rows = [(username, *deltas) for username, deltas in pending.items()]
+            try:
+                with self.pooled_connection() as db:
+                    cursor = db.cursor()
+                    cursor.execute(
+                        f"""INSERT INTO public.user_statistics (discord_user_name, commands_used, thanks_given)
+                   VALUES {", ".join(["(%s, %s, %s)"] * len(rows))}
+                   ON CONFLICT (discord_user_name)
+                   DO UPDATE SET commands_used = user_statistics.commands_used + EXCLUDED.commands_used,
+                   thanks_given = user_statistics.thanks_given + EXCLUDED.thanks_given;""",
+                        [value for row in rows for value in row],
+                    )
+            except Exception:
+                # Put the deltas back so the next flush retries them.
+                with self._pending_lock:
+                    for username, (commands_used, thanks_given) in pending.items():
+                        deltas = self._pending_user_statistics.setdefault(
+                            username, [0, 0]
+                        )
+                        deltas[0] += commands_used
+                        deltas[1] += thanks_given
+                raise
+            Data._cache.invalidate("user_statistics")
 
     def add_alias(self, long_name: str, short_name: str) -> None:
-        Data._empty_cache("aliases")
-        with self.postgres_connection() as db:
+        with self.pooled_connection() as db:
             cursor = db.cursor()
             cursor.execute(
                 """INSERT INTO public.aliases (long_name, short_name) VALUES (%s, %s);""",
                 (long_name, short_name),
             )
+        Data._cache.invalidate("aliases")
 
     def remove_alias(self, long_name: str) -> None:
-        Data._empty_cache("aliases")
-        with self.postgres_connection() as db:
+        with self.pooled_connection() as db:
             cursor = db.cursor()
             cursor.execute(
                 """DELETE FROM public.aliases WHERE long_name = %s;""",
-                (long_name),
+                (long_name,),
             )
+        Data._cache.invalidate("aliases")
 
     def read_all_aliases(self) -> dict[str, str]:
         """Returns a mapping of long_name to short_name for each alias"""
 
-        if "aliases" in Data._cache:
-            return Data._cache["aliases"]  # type: ignore[no-any-return]
-        with self.postgres_connection() as db:
+        cached = Data._cache.get("aliases")
+        if cached is not DataCache.MISS:
+            return cached  # type: ignore[no-any-return]
+        with self.pooled_connection() as db:
             cursor = db.cursor()
             cursor.execute("SELECT * FROM public.aliases;")
             all_aliases = cursor.fetchall()
             return_dict = {long: short for long, short in all_aliases}
-            Data._cache["aliases"] = return_dict
+            Data._cache.put("aliases", return_dict)
             return return_dict
 
     def read_auto_update_from_id(self, auto_update_id: int) -> Optional[AutoUpdate]:
-        with self.postgres_connection() as db:
+        with self.pooled_connection() as db:
             cursor = db.cursor()
             cursor.execute(
                 """SELECT * FROM public.auto_updates WHERE auto_update_id = %s""",
@@ -393,7 +1089,7 @@ class Data(DataStub):
     def read_auto_update_from_reddit_thread(
         self, reddit_thread_url: str
     ) -> Optional[AutoUpdate]:
-        with self.postgres_connection() as db:
+        with self.pooled_connection() as db:
             cursor = db.cursor()
             cursor.execute(
                 """SELECT * FROM public.auto_updates WHERE reddit_thread_url = %s""",
@@ -407,7 +1103,7 @@ class Data(DataStub):
             return auto_update
 
     def read_all_auto_updates(self) -> list[AutoUpdate]:
-        with self.postgres_connection() as db:
+        with self.pooled_connection() as db:
             cursor = db.cursor()
             cursor.execute("""SELECT * FROM public.auto_updates""")
             rows = cursor.fetchall()
@@ -420,7 +1116,7 @@ class Data(DataStub):
             return auto_updates
 
     def delete_auto_update(self, auto_update: AutoUpdate) -> None:
-        with self.postgres_connection() as db:
+        with self.pooled_connection() as db:
             cursor = db.cursor()
             cursor.execute(
                 """DELETE FROM public.auto_updates WHERE auto_update_id = %s;""",
@@ -449,7 +1145,7 @@ class Data(DataStub):
         liquipedia_url = (
             liquipedia_url.split("#")[0] if "#" in liquipedia_url else liquipedia_url
         )
-        with self.postgres_connection() as db:
+        with self.pooled_connection() as db:
             cursor = db.cursor()
             cursor.execute(
                 """INSERT INTO public.auto_updates (reddit_thread_url, liquipedia_url, thread_type, thread_options, seconds_since_epoch, day_number) VALUES (%s, %s, %s, %s, %s, %s) RETURNING auto_update_id;""",
@@ -480,7 +1176,7 @@ class Data(DataStub):
         target_timestamp = int(elapsed_time + time.time())
         remindme_id = -1
 
-        with self.postgres_connection() as db:
+        with self.pooled_connection() as db:
             cursor = db.cursor()
             cursor.execute(
                 """INSERT INTO public.remindme (discord_username, remindme_message, channel_id, trigger_timestamp) VALUES (%s, %s, %s, %s) RETURNING remindme_id;""",
@@ -491,16 +1187,29 @@ class Data(DataStub):
 
     def delete_remindme(self, remindme_id: int) -> None:
         """Deletes a remindme notification from db. Should be used after a remindme is triggered."""
-        with self.postgres_connection() as db:
+        with self.pooled_connection() as db:
             cursor = db.cursor()
             cursor.execute(
                 """DELETE FROM public.remindme WHERE remindme_id = %s;""",
                 (remindme_id,),
             )
 
+    def read_remindme(self, remindme_id: int) -> Optional[Remindme]:
+        """Returns the remindme with `remindme_id`, or None if it doesn't exist."""
+        with self.pooled_connection() as db:
+            cursor = db.cursor()
+            cursor.execute(
+                """SELECT remindme_id, discord_username, remindme_message, trigger_timestamp, channel_id FROM public.remindme WHERE remindme_id = %s""",
+                (remindme_id,),
+            )
+            r = cursor.fetchone()
+            if not r:
+                return None
+            return Remindme(int(r[0]), r[1], r[2], int(r[3]), int(r[4]))
+
     def read_remindmes(self) -> list[Remindme]:
         """Returns all remindmes stored in the db."""
-        with self.postgres_connection() as db:
+        with self.pooled_connection() as db:
             cursor = db.cursor()
             cursor.execute("""SELECT remindme_id, discord_username, remindme_message, trigger_timestamp, channel_id FROM public.remindme""")
             remindmes = []
@@ -512,7 +1221,7 @@ class Data(DataStub):
     def write_already_warned_scheduled_post(
         self, log_id: int, seconds_since_epoch: int
     ) -> None:
-        with self.postgres_connection() as db:
+        with self.pooled_connection() as db:
             cursor = db.cursor()
             cursor.execute(
                 """INSERT INTO public.already_warned_scheduled_posts VALUES (%s, %s);""",
@@ -523,7 +1232,7 @@ class Data(DataStub):
         self, min_seconds_since_epoch: int
     ) -> list[int]:
         """Returns a list of log ids for already warned scheduled posts."""
-        with self.postgres_connection() as db:
+        with self.pooled_connection() as db:
             cursor = db.cursor()
             cursor.execute(
                 """SELECT id FROM public.already_warned_scheduled_posts WHERE seconds_since_epoch > %s;""",
@@ -535,7 +1244,7 @@ class Data(DataStub):
     def write_already_warned_confirmed_post(
         self, log_id: int, seconds_since_epoch: int
     ) -> None:
-        with self.postgres_connection() as db:
+        with self.pooled_connection() as db:
             cursor = db.cursor()
             cursor.execute(
                 """INSERT INTO public.already_confirmed_scheduled_posts VALUES (%s, %s);""",
@@ -546,7 +1255,7 @@ class Data(DataStub):
         self, min_seconds_since_epoch: int
     ) -> list[int]:
         """Returns a list of log ids for already confirmed scheduled posts."""
-        with self.postgres_connection() as db:
+        with self.pooled_connection() as db:
             cursor = db.cursor()
             cursor.execute(
                 """SELECT post_id FROM public.already_confirmed_scheduled_posts WHERE seconds_since_epoch > %s;""",
@@ -555,69 +1264,381 @@ class Data(DataStub):
             post_ids = list(map(lambda x: x[0], cursor.fetchall()))
             return post_ids
 
-    def write_to_logs(self, logs: list[tuple[datetime, str]]) -> None:
-        """ "Writes all logs to the database."""
-        with self.postgres_connection() as db:
-            cursor = db.cursor()
-            cursor.executemany(
-                "INSERT INTO public.logs (log_time, log) VALUES (%s, %s);",
-                [(datetime_log[0], datetime_log[1]) for datetime_log in logs],
+    def write_already_warned_scheduled_posts(self, posts: list[tuple[int, int]]) -> None:
+        """Writes (id, seconds_since_epoch) rows of warned scheduled posts in one INSERT."""
+        if not posts:
+            return
+        with self.pooled_connection() as db:
+            psycopg2.extras.execute_values(
+                db.cursor(),
+                "INSERT INTO public.already_warned_scheduled_posts (id, seconds_since_epoch) VALUES %s",
+                posts,
             )
 
-    def read_logs(self, count: int = 10) -> list[tuple[datetime, str]]:
-        """Reads logs to the database."""
+    def write_already_confirmed_scheduled_posts(
+        self, posts: list[tuple[int, int]]
+    ) -> None:
+        """Writes (post_id, seconds_since_epoch) rows of confirmed scheduled posts in one INSERT."""
+        if not posts:
+            return
+        with self.pooled_connection() as db:
+            psycopg2.extras.execute_values(
+                db.cursor(),
+                "INSERT INTO public.already_confirmed_scheduled_posts (post_id, seconds_since_epoch) VALUES %s",
+                posts,
+            )
 
-        with self.postgres_connection() as db:
+    def write_to_logs(self, logs: list[tuple[datetime, str]]) -> None:
+        """Writes all logs to the database in one COPY, or multi-row INSERTs if COPY fails."""
+        if not logs:
+            return
+        try:
+            with self.pooled_connection() as db:
+                _copy_logs(db.cursor(), logs)
+        except psycopg2.Error:
+            # The failed COPY was rolled back, so nothing was written yet.
+            with self.pooled_connection() as db:
+                _insert_logs(db.cursor(), logs)
+
+    def _read_recent_logs_first(
+        self, where: str, params: tuple[Any, ...], count: int
+    ) -> list[tuple[datetime, str]]:
+        """
+        Reads the newest `count` logs matching `where`, newest first.
+
+        Only partitions covering the last LOG_RECENT_DAYS days are scanned first. Older
+        partitions are only read when the recent ones don't have `count` matches.
+        """
+        cutoff = datetime.now() - timedelta(days=LOG_RECENT_DAYS)
+        with self.pooled_connection() as db:
             cursor = db.cursor()
             cursor.execute(
-                "SELECT log_time, log FROM public.logs ORDER BY log_time DESC limit %s;",
-                (count,),
+                f"SELECT log_time, log FROM public.logs WHERE {where} AND log_time >= %s ORDER BY log_time DESC limit %s;",
+                (*params, cutoff, count),
             )
-            all_logs = cursor.fetchall()
-            return all_logs  # type: ignore[no-any-return]
+            logs: list[tuple[datetime, str]] = cursor.fetchall()
+            if len(logs) < count:
+                cursor.execute(
+                    f"SELECT log_time, log FROM public.logs WHERE {where} AND log_time < %s ORDER BY log_time DESC limit %s;",
+                    (*params, cutoff, count - len(logs)),
+                )
+                logs.extend(cursor.fetchall())
+            return logs
+
+    def read_logs(
+        self, count: int = 10, before: Optional[datetime] = None
+    ) -> list[tuple[datetime, str]]:
+        """Reads logs to the database, only ones older than `before` if given."""
+        if before is not None:
+            return self._read_recent_logs_first("log_time < %s", (before,), count)
+        return self._read_recent_logs_first("TRUE", (), count)
+
+    def read_logs_matching(
+        self, search_string: str, count: int = 10, before: Optional[datetime] = None
+    ) -> list[tuple[datetime, str]]:
+        """Reads logs matching a search string from the database, only ones older than `before` if given."""
+        if before is not None:
+            return self._read_recent_logs_first(
+                "log ILIKE %s AND log_time < %s", (f"%{search_string}%", before), count
+            )
+        return self._read_recent_logs_first(
+            "log ILIKE %s", (f"%{search_string}%",), count
+        )
 
-    def read_logs_matching(self, search_string: str, count: int = 10) -> list[tuple[datetime, str]]:
-        """Reads logs matching a search string from the database."""
+    def maintain_log_partitions(self) -> tuple[list[str], list[str]]:
+        """
+        Creates upcoming monthly partitions of public.logs and drops expired ones.
 
-        with self.postgres_connection() as db:
+        A partition is dropped once every log it can hold is older than LOG_RETENTION_DAYS.
+        Returns the names of the created and dropped partitions.
+        """
+        this_month = datetime.now().replace(
+            day=1, hour=0, minute=0, second=0, microsecond=0
+        )
+        retention_cutoff = datetime.now() - timedelta(days=LOG_RETENTION_DAYS)
+        created: list[str] = []
+        dropped: list[str] = []
+        with self.pooled_connection() as db:
             cursor = db.cursor()
             cursor.execute(
-                "SELECT log_time, log FROM public.logs WHERE log ILIKE %s ORDER BY log_time DESC limit %s;",
-                (f"%{search_string}%", count),
+                """SELECT c.relname, pg_get_expr(c.relpartbound, c.oid)
+                FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid
+                WHERE i.inhparent = 'public.logs'::regclass;"""
             )
-            all_logs = cursor.fetchall()
-            return all_logs  # type: ignore[no-any-return]
+            # Bounds look like: FOR VALUES FROM ('2026-10-01 00:00:00') TO ('2026-11-01 00:00:00')
+            # logs_default's bound is just DEFAULT, so it's never dropped.
+            upper_bounds: dict[str, datetime] = {}
+            for name, bound in cursor.fetchall():
+                match = re.search(r"TO \('([^']+)'\)", bound)
+                if match:
+                    upper_bounds[name] = datetime.fromisoformat(match.group(1)[:19])
+
+            for name, upper_bound in upper_bounds.items():
+                if upper_bound <= retention_cutoff:
+                    cursor.execute(f'DROP TABLE public."{name}";')
+                    dropped.append(name)
+
+            # The legacy partition covers everything up to its upper bound.
+            covered_until = max(upper_bounds.values(), default=this_month)
+            for months in range(LOG_PARTITION_MONTHS_AHEAD + 1):
+                month_start = _add_months(this_month, months)
+                name = f"logs_y{month_start:%Y}m{month_start:%m}"
+                if name in upper_bounds or month_start < covered_until:
+                    continue
+                month_end = _add_months(month_start, 1)
+                # Logs written while no partition covered their month sit in logs_default,
+                # and a partition can't be attached while the default holds rows in its range.
+                cursor.execute(
+                    f"CREATE TABLE IF NOT EXISTS public.{name} (LIKE public.logs INCLUDING DEFAULTS);"
+                )
+                cursor.execute(
+                    f"WITH moved AS (DELETE FROM public.logs_default WHERE log_time >= %s AND log_time < %s RETURNING *) INSERT INTO public.{name} SELECT * FROM moved;",
+                    (month_start, month_end),
+                )
+                cursor.execute(
+                    f"ALTER TABLE public.logs ATTACH PARTITION public.{name} FOR VALUES FROM (%s) TO (%s);",
+                    (month_start, month_end),
+                )
+                created.append(name)
+        return created, dropped
 
     def add_triflair(self, flair_to_add: str) -> None:
         """Adds a triflair to the database."""
-        with self.postgres_connection() as db:
+        with self.pooled_connection() as db:
             cursor = db.cursor()
             # NOTE: For legacy reasons, triflairs are called "dualflairs" in postgres.
             cursor.execute(
                 """INSERT INTO public.dualflairs VALUES (%s)""", (flair_to_add,)
             )
-
-            Data._empty_cache("triflair")
+        Data._cache.invalidate("triflairs")
 
     def read_triflairs(self) -> list[str]:
         """Reads all the triflair from the database."""
 
-        if "triflair" in Data._cache:
-            return Data._cache["triflair"]  # type: ignore[no-any-return]
+        cached = Data._cache.get("triflairs")
+        if cached is not DataCache.MISS:
+            return cached  # type: ignore[no-any-return]
 
-        with self.postgres_connection() as db:
+        with self.pooled_connection() as db:
             cursor = db.cursor()
             cursor.execute("SELECT * FROM public.dualflairs;")
             all_dualflairs = cursor.fetchall()
-            Data._cache["dualflairs"] = all_dualflairs
+            Data._cache.put("triflairs", all_dualflairs)
             return all_dualflairs  # type: ignore[no-any-return]
 
     def yeet_triflair(self, flair_to_remove: str) -> None:
         """Yeets a triflair out of the database."""
-        with self.postgres_connection() as db:
+        with self.pooled_connection() as db:
             cursor = db.cursor()
             cursor.execute(
                 "DELETE FROM public.dualflairs WHERE dualflair = %s", (flair_to_remove,)
             )
+        Data._cache.invalidate("triflairs")
+
+
+class AsyncData(object):
+    """
+    Awaitable counterpart to the DataStub interface, for use inside coroutines.
+
+    Each call resolves Data.singleton() and runs the blocking query on a dedicated
+    db thread pool (sized to the connection pool), so the discord gateway and reddit
+    streams keep running while postgres responds.
+    """
+
+    _singleton: Optional["AsyncData"] = None
+    _executor = ThreadPoolExecutor(
+        max_workers=DB_POOL_MAX_SIZE, thread_name_prefix="rleb-db"
+    )
+
+    def __init__(self) -> None:
+        raise RuntimeError("Call singleton() instead")
+
+    @classmethod
+    def singleton(cls) -> "AsyncData":
+        if cls._singleton is None:
+            cls._singleton = cls.__new__(cls)
+        return cls._singleton
+
+    async def _run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            AsyncData._executor, functools.partial(fn, *args, **kwargs)
+        )
+
+    async def wait_for_table_changes(self, timeout: float) -> set[str]:
+        # Mostly spent blocked on the listener socket, so it runs on the default
+        # executor instead of taking one of the db workers.
+        return await asyncio.to_thread(Data.singleton().wait_for_table_changes, timeout)
+
+    async def yolo_query(self, sql: str, session_key: str = "") -> QueryPage:
+        return await self._run(Data.singleton().yolo_query, sql, session_key)
+
+    async def yolo_query_next(self, session_key: str = "") -> Optional[QueryPage]:
+        return await self._run(Data.singleton().yolo_query_next, session_key)
+
+    async def close_expired_yolo_sessions(self) -> None:
+        await self._run(Data.singleton().close_expired_yolo_sessions)
+
+    async def get_db_tables(self) -> int:
+        return await self._run(Data.singleton().get_db_tables)
+
+    async def read_all_user_statistics(self) -> list[UserStatistics]:
+        return await self._run(Data.singleton().read_all_user_statistics)
+
+    async def read_user_statistics(
+        self, discord_username: str
+    ) -> Optional[UserStatistics]:
+        return await self._run(Data.singleton().read_user_statistics, discord_username)
+
+    async def increment_user_statistics_commands_used(
+        self, discord_username: str
+    ) -> None:
+        await self._run(
+            Data.singleton().increment_user_statistics_commands_used, discord_username
+        )
+
+    async def increment_user_statistics_thanks_given(
+        self, discord_username: str
+    ) -> None:
+        await self._run(
+            Data.singleton().increment_user_statistics_thanks_given, discord_username
+        )
+
+    async def flush_user_statistics(self) -> None:
+        await self._run(Data.singleton().flush_user_statistics)
+
+    async def add_alias(self, long_name: str, short_name: str) -> None:
+        await self._run(Data.singleton().add_alias, long_name, short_name)
+
+    async def remove_alias(self, long_name: str) -> None:
+        await self._run(Data.singleton().remove_alias, long_name)
+
+    async def read_all_aliases(self) -> dict[str, str]:
+        return await self._run(Data.singleton().read_all_aliases)
+
+    async def read_auto_update_from_id(
+        self, auto_update_id: int
+    ) -> Optional[AutoUpdate]:
+        return await self._run(
+            Data.singleton().read_auto_update_from_id, auto_update_id
+        )
+
+    async def read_auto_update_from_reddit_thread(
+        self, reddit_thread_url: str
+    ) -> Optional[AutoUpdate]:
+        return await self._run(
+            Data.singleton().read_auto_update_from_reddit_thread, reddit_thread_url
+        )
+
+    async def read_all_auto_updates(self) -> list[AutoUpdate]:
+        return await self._run(Data.singleton().read_all_auto_updates)
+
+    async def delete_auto_update(self, auto_update: AutoUpdate) -> None:
+        await self._run(Data.singleton().delete_auto_update, auto_update)
+
+    async def write_auto_update(
+        self,
+        reddit_thread_url: str,
+        liquipedia_url: str,
+        tourney_system: str,
+        thread_options: str,
+        day_number: int,
+    ) -> AutoUpdate:
+        return await self._run(
+            Data.singleton().write_auto_update,
+            reddit_thread_url,
+            liquipedia_url,
+            tourney_system,
+            thread_options,
+            day_number,
+        )
+
+    async def write_remindme(
+        self, user: str, message: str, elapsed_time: int, channel_id: int
+    ) -> Remindme:
+        return await self._run(
+            Data.singleton().write_remindme, user, message, elapsed_time, channel_id
+        )
+
+    async def delete_remindme(self, remindme_id: int) -> None:
+        await self._run(Data.singleton().delete_remindme, remindme_id)
+
+    async def read_remindme(self, remindme_id: int) -> Optional[Remindme]:
+        return await self._run(Data.singleton().read_remindme, remindme_id)
+
+    async def read_remindmes(self) -> list[Remindme]:
+        return await self._run(Data.singleton().read_remindmes)
+
+    async def write_already_warned_scheduled_post(
+        self, log_id: int, seconds_since_epoch: int
+    ) -> None:
+        await self._run(
+            Data.singleton().write_already_warned_scheduled_post,
+            log_id,
+            seconds_since_epoch,
+        )
+
+    async def read_already_warned_scheduled_posts(
+        self, min_seconds_since_epoch: int
+    ) -> list[int]:
+        return await self._run(
+            Data.singleton().read_already_warned_scheduled_posts,
+            min_seconds_since_epoch,
+        )
+
+    async def write_already_warned_confirmed_post(
+        self, log_id: int, seconds_since_epoch: int
+    ) -> None:
+        await self._run(
+            Data.singleton().write_already_warned_confirmed_post,
+            log_id,
+            seconds_since_epoch,
+        )
+
+    async def read_already_confirmed_scheduled_posts(
+        self, min_seconds_since_epoch: int
+    ) -> list[int]:
+        return await self._run(
+            Data.singleton().read_already_confirmed_scheduled_posts,
+            min_seconds_since_epoch,
+        )
+
+    async def write_already_warned_scheduled_posts(
+        self, posts: list[tuple[int, int]]
+    ) -> None:
+        await self._run(Data.singleton().write_already_warned_scheduled_posts, posts)
+
+    async def write_already_confirmed_scheduled_posts(
+        self, posts: list[tuple[int, int]]
+    ) -> None:
+        await self._run(Data.singleton().write_already_confirmed_scheduled_posts, posts)
+
+    async def write_to_logs(self, logs: list[tuple[datetime, str]]) -> None:
+        await self._run(Data.singleton().write_to_logs, logs)
+
+    async def read_logs(
+        self, count: int = 10, before: Optional[datetime] = None
+    ) -> list[tuple[datetime, str]]:
+        return await self._run(Data.singleton().read_logs, count, before)
+
+    async def read_logs_matching(
+        self, search_string: str, count: int = 10, before: Optional[datetime] = None
+    ) -> list[tuple[datetime, str]]:
+        return await self._run(
+            Data.singleton().read_logs_matching, search_string, count, before
+        )
+
+    async def migrate(self) -> list[int]:
+        return await self._run(Data.singleton().migrate)
+
+    async def maintain_log_partitions(self) -> tuple[list[str], list[str]]:
+        return await self._run(Data.singleton().maintain_log_partitions)
+
+    async def add_triflair(self, flair_to_add: str) -> None:
+        await self._run(Data.singleton().add_triflair, flair_to_add)
+
+    async def read_triflairs(self) -> list[str]:
+        return await self._run(Data.singleton().read_triflairs)
 
-            Data._empty_cache("triflair")
+    async def yeet_triflair(self, flair_to_remove: str) -> None:
+        await self._run(Data.singleton().yeet_triflair, flair_to_remove)
@@ -1,3 +1,4 @@
+import io
 import os
 import pathlib
 import signal
@@ -9,13 +10,20 @@ import asyncio
 from threading import Lock, Thread
 import traceback
 import math
+from typing import Optional
 
 import health_check
 import global_settings
 from reddit_bridge import RedditBridge
 from liqui import diesel
 import stdout
-from data_bridge import AutoUpdate, Data, Remindme
+from data_bridge import AsyncData, AutoUpdate, Data, Remindme
+from error_reporter import ErrorReporter
+from instrumentation import Instrumentation
+from log_archive import LogArchive
+from log_index import LogIndex
+from log_shipper import LogShipper
+from remindme_scheduler import RemindmeScheduler
 from global_settings import user_names_to_ids
 from liqui.team_lookup import handle_team_lookup
 from liqui.group_lookup import handle_group_lookup
@@ -50,6 +58,47 @@ def is_admin(user: discord.Member) -> bool:
     return "Subreddit Admins" in map(lambda x: x.name, user.roles)
 
 
+async def read_recent_logs(
+    count: int, search_string: Optional[str] = None
+) -> list[tuple[datetime, str]]:
+    """
+    Returns the newest `count` logs (matching `search_string`, if any), oldest first.
+
+    Recent logs come from memory, older ones from the local log archive, and only logs
+    older than both from the db.
+    """
+    if search_string is None:
+        logs = LogIndex.singleton().latest(count)
+    else:
+        logs = LogIndex.singleton().search(search_string, count)
+    oldest = LogIndex.singleton().oldest_time()
+
+    archive = LogArchive.singleton()
+    if archive is not None and len(logs) < count:
+        logs = (
+            await asyncio.to_thread(
+                archive.read, count - len(logs), search_string, None, oldest
+            )
+            + logs
+        )
+        oldest_archived = await asyncio.to_thread(archive.oldest_time)
+        if oldest is None or (oldest_archived is not None and oldest_archived < oldest):
+            oldest = oldest_archived
+
+    if len(logs) < count:
+        remaining_log_count = count - len(logs)
+        if search_string is None:
+            older_logs = await AsyncData.singleton().read_logs(
+                remaining_log_count, oldest
+            )
+        else:
+            older_logs = await AsyncData.singleton().read_logs_matching(
+                search_string, remaining_log_count, oldest
+            )
+        logs = list(reversed(older_logs)) + logs
+    return logs
+
+
 class RLEsportsBot(discord.Client):
     new_post_channel: discord.TextChannel
     modmail_channel: discord.TextChannel
@@ -196,7 +245,12 @@ class RLEsportsBot(discord.Client):
         self.loop.create_task(self.process_reddit_inbox())
         self.loop.create_task(self.auto_update_threads())
         self.loop.create_task(self.check_remindmes())
+        self.loop.create_task(self.flush_user_statistics())
+        self.loop.create_task(self.close_idle_sql_queries())
+        self.loop.create_task(self.maintain_log_partitions())
+        self.loop.create_task(self.listen_for_table_changes())
         self.loop.create_task(self.process_error_log_queue())
+        self.loop.create_task(self.ship_logs())
 
         # Create asyncio tasks for health monitoring and task alerts
         if global_settings.health_enabled:
@@ -622,86 +676,226 @@ class RLEsportsBot(discord.Client):
             await asyncio.sleep(global_settings.discord_async_interval_seconds)
 
     async def check_remindmes(self):
-        """Check for due reminders and send them."""
+        """Send reminders as they come due."""
         await asyncio.sleep(10)
+        scheduler = RemindmeScheduler.singleton()
         while True:
             try:
-                remindmes = Data.singleton().read_remindmes()
-                current_time = time.time()
+                await scheduler.load()
+                await self.send_due_remindmes()
 
-                for remindme in remindmes:
-                    # Check if reminder is due
-                    if remindme.trigger_timestamp <= current_time:
+                global_settings.asyncio_threads_heartbeats["remindme"] = datetime.now()
+            except Exception as e:
+                global_settings.rleb_log_error(
+                    "[DISCORD]: Remindme check failed - {0}".format(e)
+                )
+                global_settings.rleb_log_error(traceback.format_exc())
+                global_settings.thread_crashes["asyncio"] += 1
+                global_settings.last_datetime_crashed["asyncio"] = datetime.now()
+                await asyncio.sleep(60)
+                continue
+
+            # Sleeps until the next reminder is due, or a reminder is added/deleted.
+            await scheduler.wait_for_next(global_settings.remindme_max_sleep_seconds)
+
+    async def send_due_remindmes(self):
+        """
+        Sends and deletes every due reminder. If one fails, it and the rest of the batch go
+        back on the schedule, so they're retried on the next check rather than after a restart.
+        """
+        scheduler = RemindmeScheduler.singleton()
+        due = scheduler.pop_due()
+        try:
+            while due:
+                await self.send_remindme(due[0])
+                await AsyncData.singleton().delete_remindme(due[0].remindme_id)
+                due.pop(0)
+        finally:
+            for remindme in due:
+                scheduler.add(remindme)
+
+    async def send_remindme(self, remindme: Remindme):
+        """Send a due reminder to the channel it was set in."""
+        global_settings.rleb_log_info(
+            f"[REMINDME]: Triggering reminder {remindme.remindme_id}"
+        )
+
+        # Build the message
+        user_id = global_settings.user_names_to_ids.get(remindme.discord_username)
+        if user_id:
+            msg = f"**Reminder for <@{user_id}>:** {remindme.message}"
+        else:
+            msg = f"**Reminder for {remindme.discord_username}:** {remindme.message}"
+
+        # Send to channel
+        try:
+            channel = self.get_channel(remindme.channel_id)  # type: ignore
+            if not channel:
+                # Channel not in cache, try fetching via API
+                try:
+                    channel = await self.fetch_channel(remindme.channel_id)  # type: ignore
+                except Exception:
+                    channel = None
+            if not channel:
+                global_settings.rleb_log_info(
+                    f"[REMINDME]: Channel {remindme.channel_id} not found for reminder {remindme.remindme_id}, using fallback channel"
+                )
+                channel = self.bot_command_channel
+
+            if channel:
+                await channel.send(msg)  # type: ignore
+            else:
+                global_settings.rleb_log_error(
+                    f"[REMINDME]: Could not find channel {remindme.channel_id} for reminder {remindme.remindme_id}"
+                )
+        except Exception as e:
+            global_settings.rleb_log_error(
+                f"[REMINDME]: Failed to send reminder {remindme.remindme_id}: {e}"
+            )
+
+    async def flush_user_statistics(self):
+        """Periodically write buffered user statistics to the database."""
+        await asyncio.sleep(10)
+        while True:
+            try:
+                await AsyncData.singleton().flush_user_statistics()
+                global_settings.asyncio_threads_heartbeats["user_statistics"] = (
+                    datetime.now()
+                )
+            except Exception as e:
+                global_settings.rleb_log_error(
+                    "[DISCORD]: User statistics flush failed - {0}".format(e)
+                )
+                global_settings.rleb_log_error(traceback.format_exc())
+                global_settings.thread_crashes["asyncio"] += 1
+                global_settings.last_datetime_crashed["asyncio"] = datetime.now()
+
+            await asyncio.sleep(global_settings.user_statistics_flush_interval_seconds)
+
+    async def close_idle_sql_queries(self):
+        """Periodically close !sql queries nobody paged through before they expired."""
+        await asyncio.sleep(10)
+        while True:
+            try:
+                await AsyncData.singleton().close_expired_yolo_sessions()
+                global_settings.asyncio_threads_heartbeats["sql_sessions"] = (
+                    datetime.now()
+                )
+            except Exception as e:
+                global_settings.rleb_log_error(
+                    "[DISCORD]: Closing idle !sql queries failed - {0}".format(e)
+                )
+                global_settings.rleb_log_error(traceback.format_exc())
+                global_settings.thread_crashes["asyncio"] += 1
+                global_settings.last_datetime_crashed["asyncio"] = datetime.now()
+
+            await asyncio.sleep(global_settings.sql_session_sweep_interval_seconds)
+
+    async def maintain_log_partitions(self):
+        """Periodically create upcoming log partitions and drop expired ones."""
+        await asyncio.sleep(10)
+        last_maintained = 0.0
+        while True:
+            try:
+                if (
+                    time.time() - last_maintained
+                    >= global_settings.log_partition_maintenance_interval_seconds
+                ):
+                    # Also catches up on migrations that failed at startup.
+                    applied_migrations = await AsyncData.singleton().migrate()
+                    if applied_migrations:
                         global_settings.rleb_log_info(
-                            f"[REMINDME]: Triggering reminder {remindme.remindme_id}"
+                            f"[DISCORD]: Applied db migrations {applied_migrations}."
                         )
-
-                        # Build the message
-                        user_id = global_settings.user_names_to_ids.get(
-                            remindme.discord_username
+                    created, dropped = (
+                        await AsyncData.singleton().maintain_log_partitions()
+                    )
+                    last_maintained = time.time()
+                    if created or dropped:
+                        global_settings.rleb_log_info(
+                            f"[DISCORD]: Created log partitions {created}, dropped {dropped}."
                         )
-                        if user_id:
-                            msg = f"**Reminder for <@{user_id}>:** {remindme.message}"
-                        else:
-                            msg = f"**Reminder for {remindme.discord_username}:** {remindme.message}"
-
-                        # Send to channel
-                        try:
-                            channel = self.get_channel(remindme.channel_id)  # type: ignore
-                            if not channel:
-                                # Channel not in cache, try fetching via API
-                                try:
-                                    channel = await self.fetch_channel(remindme.channel_id)  # type: ignore
-                                except Exception:
-                                    channel = None
-                            if not channel:
-                                global_settings.rleb_log_info(
-                                    f"[REMINDME]: Channel {remindme.channel_id} not found for reminder {remindme.remindme_id}, using fallback channel"
-                                )
-                                channel = self.bot_command_channel
-
-                            if channel:
-                                await channel.send(msg)  # type: ignore
-                            else:
-                                global_settings.rleb_log_error(
-                                    f"[REMINDME]: Could not find channel {remindme.channel_id} for reminder {remindme.remindme_id}"
-                                )
-                        except Exception as e:
-                            global_settings.rleb_log_error(
-                                f"[REMINDME]: Failed to send reminder {remindme.remindme_id}: {e}"
-                            )
+                global_settings.asyncio_threads_heartbeats["log_partitions"] = (
+                    datetime.now()
+                )
+            except Exception as e:
+                global_settings.rleb_log_error(
+                    "[DISCORD]: Log partition maintenance failed - {0}".format(e)
+                )
+                global_settings.rleb_log_error(traceback.format_exc())
+                global_settings.thread_crashes["asyncio"] += 1
+                global_settings.last_datetime_crashed["asyncio"] = datetime.now()
 
-                        # Delete from database
-                        Data.singleton().delete_remindme(remindme.remindme_id)
+            await asyncio.sleep(60)
 
-                global_settings.asyncio_threads_heartbeats["remindme"] = datetime.now()
+    async def listen_for_table_changes(self):
+        """Drop cached data that another bot instance (or this one) changed in the db."""
+        await asyncio.sleep(10)
+        while True:
+            try:
+                changed = await AsyncData.singleton().wait_for_table_changes(
+                    global_settings.table_changes_listen_timeout_seconds
+                )
+                if "auto_updates" in changed:
+                    auto_updates = await AsyncData.singleton().read_all_auto_updates()
+                    # Swapped in whole, so loops over the old dict aren't disturbed.
+                    global_settings.auto_updates = {
+                        auto_update.auto_update_id: auto_update
+                        for auto_update in auto_updates
+                    }
+                global_settings.asyncio_threads_heartbeats["table_changes"] = (
+                    datetime.now()
+                )
             except Exception as e:
                 global_settings.rleb_log_error(
-                    "[DISCORD]: Remindme check failed - {0}".format(e)
+                    "[DISCORD]: Table change listener failed - {0}".format(e)
                 )
                 global_settings.rleb_log_error(traceback.format_exc())
                 global_settings.thread_crashes["asyncio"] += 1
                 global_settings.last_datetime_crashed["asyncio"] = datetime.now()
+                await asyncio.sleep(60)
 
-            await asyncio.sleep(60)  # Check every 60 seconds
+    async def ship_logs(self):
+        """Write buffered logs to the archive and db in batches, so logging never waits on either."""
+        await asyncio.sleep(10)
+        shipper = LogShipper.singleton()
+        while True:
+            try:
+                global_settings.asyncio_threads_heartbeats["log_shipper"] = (
+                    datetime.now()
+                )
+                # Locally, logs only go to the archive (if there is one).
+                await shipper.ship(to_db=global_settings.RUNNING_MODE != "local")
+            except Exception as e:
+                # Don't use rleb_log_error here, logging it would only grow the backlog
+                print(f"[LOG_SHIPPER]: Log shipping failed - {e}")
+                print(traceback.format_exc())
+                global_settings.thread_crashes["asyncio"] += 1
+                global_settings.last_datetime_crashed["asyncio"] = datetime.now()
+                await asyncio.sleep(60)  # backoff
+
+            await shipper.wait_for_batch(global_settings.log_ship_interval_seconds)
 
     async def process_error_log_queue(self):
         """Process error log queue and send errors to #bot-logs channel."""
         await asyncio.sleep(10)
         while True:
             try:
-                # Process all queued error messages
+                # Coalesce queued errors, then send a few packed messages.
+                reporter = ErrorReporter.singleton()
+                now = time.time()
                 while global_settings.error_log_queue:
+                    reporter.add(global_settings.error_log_queue.popleft(), now)
+                messages = reporter.take_messages(now)
+                for i, error_message in enumerate(messages):
                     try:
-                        error_message = global_settings.error_log_queue.pop(0)
                         await self.bot_logs_channel.send(error_message)
-                    except IndexError:
-                        # Queue is empty (race condition with another check)
-                        break
                     except Exception as e:
+                        reporter.requeue(messages[i:])
                         global_settings.rleb_log_info(
                             f"[ERROR_LOGGER]: Failed to send error to Discord: {e}"
                         )
+                        break
             except Exception as e:
                 # Don't use rleb_log_error here to avoid infinite loop
                 print(f"[ERROR_LOGGER]: Error log queue processing failed - {e}")
@@ -718,7 +912,7 @@ class RLEsportsBot(discord.Client):
                 if not global_settings.reddit_bridge:
                     break
 
-                auto_updates = global_settings.auto_updates.values()
+                auto_updates = list(global_settings.auto_updates.values())
                 if auto_updates:
                     global_settings.rleb_log_info(
                         "[AUTO UPDATER]: Starting auto update check."
@@ -766,11 +960,12 @@ class RLEsportsBot(discord.Client):
                         result = await global_settings.reddit_bridge.update_submission(
                             submission_id=submission_id, text=fresh_markdown
                         )
-                        # TODO is this logic correct?
-                        # Future fix, this will resize the dictionary while we are looping.
+                        # The loop is over a copy, so dropping the update here is safe.
                         if result is False:
-                            del global_settings.auto_updates[auto_update.auto_update_id]
-                            Data.singleton().delete_auto_update(auto_update)
+                            global_settings.auto_updates.pop(
+                                auto_update.auto_update_id, None
+                            )
+                            await AsyncData.singleton().delete_auto_update(auto_update)
                         elif result is True:
                             global_settings.rleb_log_info(
                                 f"[AUTO UPDATER]: Updated {auto_update.reddit_url}"
@@ -824,7 +1019,9 @@ class RLEsportsBot(discord.Client):
 
     # Record that a user was responded to. Useful for responding "thanks".
     async def add_response(self, message):
-        Data.singleton().increment_user_statistics_commands_used(str(message.author))
+        await AsyncData.singleton().increment_user_statistics_commands_used(
+            str(message.author)
+        )
         with responses_lock:
             self.responses[str(message.author)] = datetime.now()
 
@@ -892,7 +1089,7 @@ class RLEsportsBot(discord.Client):
             if str(message.author) in self.responses:
                 thanks_responses = ["np", "no problem", "no worries", "you're welcome"]
                 await message.channel.send(random.choice(thanks_responses))
-                Data.singleton().increment_user_statistics_thanks_given(
+                await AsyncData.singleton().increment_user_statistics_thanks_given(
                     str(message.author)
                 )
                 del self.responses[str(message.author)]
@@ -904,7 +1101,9 @@ class RLEsportsBot(discord.Client):
             tokens = discord_message.split()
             if len(tokens) == 1:
                 user_statistics = [
-                    Data.singleton().read_user_statistics(str(message.author))
+                    await AsyncData.singleton().read_user_statistics(
+                        str(message.author)
+                    )
                 ]
             elif len(tokens) == 2:
                 if tokens[1] == "help":
@@ -913,9 +1112,13 @@ class RLEsportsBot(discord.Client):
                     )
                     return
                 if tokens[1] == "all":
-                    user_statistics = Data.singleton().read_all_user_statistics()
+                    user_statistics = (
+                        await AsyncData.singleton().read_all_user_statistics()
+                    )
                 else:
-                    user_stat = Data.singleton().read_user_statistics(tokens[1])
+                    user_stat = await AsyncData.singleton().read_user_statistics(
+                        tokens[1]
+                    )
                     if not user_stat:
                         await message.channel.send(
                             f"{tokens[1]} has never used the bot!"
@@ -1067,7 +1270,7 @@ class RLEsportsBot(discord.Client):
                 return
 
             all_flairs = ""
-            flairs = Data.singleton().read_triflairs()
+            flairs = await AsyncData.singleton().read_triflairs()
             flair_list = list(map(lambda x: x[0], flairs))
             flair_list.sort()
             for flair in flair_list:
@@ -1096,7 +1299,7 @@ class RLEsportsBot(discord.Client):
                 )
                 return
 
-            flairs = Data.singleton().read_triflairs()
+            flairs = await AsyncData.singleton().read_triflairs()
             flair_list = list(map(lambda x: x[0], flairs))
             if not (flair_to_remove in flair_list):
                 await message.channel.send(
@@ -1106,7 +1309,7 @@ class RLEsportsBot(discord.Client):
                 )
                 return
             else:
-                Data.singleton().yeet_triflair(flair_to_remove)
+                await AsyncData.singleton().yeet_triflair(flair_to_remove)
                 await message.channel.send("Removed {0}.".format(flair_to_remove))
                 await self.add_response(message)
 
@@ -1129,7 +1332,7 @@ class RLEsportsBot(discord.Client):
                 )
                 return
 
-            flairs = Data.singleton().read_triflairs()
+            flairs = await AsyncData.singleton().read_triflairs()
             flair_list = list(map(lambda x: x[0], flairs))
             if flair_to_add in flair_list:
                 await message.channel.send(
@@ -1139,7 +1342,7 @@ class RLEsportsBot(discord.Client):
                 )
                 return
             else:
-                Data.singleton().add_triflair(flair_to_add)
+                await AsyncData.singleton().add_triflair(flair_to_add)
                 await message.channel.send("Added {0}.".format(flair_to_add))
                 await self.add_response(message)
 
@@ -1147,7 +1350,7 @@ class RLEsportsBot(discord.Client):
             if not global_settings.is_discord_mod(message.author):
                 return
 
-            global_settings.flush_memory_log()
+            await asyncio.to_thread(global_settings.flush_memory_log)
             await message.channel.send(":toilet:")
 
         elif discord_message.startswith("!weekly") and is_staff(message.author):
@@ -1181,8 +1384,22 @@ class RLEsportsBot(discord.Client):
                 return
 
             sql = " ".join(discord_message.split()[1:])
+            session_key = str(message.channel.id)
             try:
-                response = Data.singleton().yolo_query(sql)
+                if sql.lower() == "next":
+                    page = await AsyncData.singleton().yolo_query_next(session_key)
+                    if page is None:
+                        await message.channel.send(
+                            "No query has more results. Use `!sql [query]` to run one."
+                        )
+                        return
+                else:
+                    page = await AsyncData.singleton().yolo_query(sql, session_key)
+                response = page.text
+                if page.has_more:
+                    response += f"\n\nPage {page.page_number}. Use `!sql next` for more results."
+                elif page.page_number > 1:
+                    response += f"\n\nPage {page.page_number}, no more results."
                 await stdout.print_to_channel(
                     message.channel, response, title="SQL Query Results", use_hook=False
                 )
@@ -1247,22 +1464,7 @@ class RLEsportsBot(discord.Client):
                     )
                     return
 
-            # Search in memory logs
-            logs = [
-                log
-                for log in global_settings.memory_log
-                if search_string.lower() in log[1].lower()
-            ]
-            logs = logs[(-1 * count) :]
-
-            if len(logs) < count:
-                # fill in remaining logs from db.
-                remaining_log_count = count - len(logs)
-                logs.extend(
-                    Data.singleton().read_logs_matching(
-                        search_string, remaining_log_count
-                    )
-                )
+            logs = await read_recent_logs(count, search_string)
 
             try:
                 if logs == None or len(logs) == 0:
@@ -1295,11 +1497,7 @@ class RLEsportsBot(discord.Client):
                 )
                 return
 
-            logs = global_settings.memory_log[(-1 * count) :]
-            if len(logs) < count:
-                # fill in remaining logs from db.
-                remaining_log_count = count - len(logs)
-                logs.extend(Data.singleton().read_logs(remaining_log_count))
+            logs = await read_recent_logs(count)
             try:
                 if logs == None or len(logs) == 0:
                     await message.channel.send("No logs to show.")
@@ -1338,6 +1536,11 @@ class RLEsportsBot(discord.Client):
             # Give Discord a moment to send the message & flush logs
             await asyncio.sleep(1.0)
 
+            # Write buffered logs and release pooled db connections before the hard
+            # exit below skips cleanup.
+            await asyncio.to_thread(global_settings.flush_memory_log)
+            Data.singleton().close()
+
             try:
                 # Close Discord connection cleanly so sockets/files are released
                 await self.close()
@@ -1347,6 +1550,21 @@ class RLEsportsBot(discord.Client):
             # Last resort: terminate the process so Docker will restart the container
             os._exit(0)  # hard exit, no atexit handlers
 
+        elif discord_message == "!status json" and is_staff(message.author):
+            if not global_settings.is_discord_mod(message.author):
+                return
+
+            stats = Instrumentation.singleton().dump(
+                {
+                    "data_backend": type(Data.singleton()).__name__,
+                    "db_pool": Data.singleton().pool_stats(),
+                    "db_cache": Data.singleton().cache_stats(),
+                }
+            )
+            await message.channel.send(
+                file=discord.File(io.BytesIO(stats.encode()), filename="rleb_stats.json")
+            )
+
         elif discord_message == "!status" and is_staff(message.author):
             if not global_settings.is_discord_mod(message.author):
                 return
@@ -1377,12 +1595,77 @@ class RLEsportsBot(discord.Client):
 
             try:
                 before = time.time() * 1000
-                db_table_count = Data.singleton().get_db_tables()
+                db_table_count = await AsyncData.singleton().get_db_tables()
                 after = time.time() * 1000
                 elapsed_time = round(after - before)
                 await message.channel.send(
                     f"**DB Status:** {db_table_count} tables found ({elapsed_time}ms response time)"
                 )
+                pool_stats = Data.singleton().pool_stats()
+                if pool_stats:
+                    await message.channel.send(
+                        "**DB Pool:** {0}/{1} in use, {2} idle, {3} opened, {4} discarded, {5} checkouts ({6} waited)".format(
+                            pool_stats["in_use"],
+                            pool_stats["max_size"],
+                            pool_stats["idle"],
+                            pool_stats["created"],
+                            pool_stats["discarded"],
+                            pool_stats["checkouts"],
+                            pool_stats["waits"],
+                        )
+                    )
+                cache_stats = Data.singleton().cache_stats()
+                if cache_stats:
+                    cache_summary = ", ".join(
+                        f"{table} {stats['hits']}/{stats['hits'] + stats['misses']}"
+                        for table, stats in cache_stats.items()
+                    )
+                    await message.channel.send(f"**DB Cache Hits:** {cache_summary}")
+                log_stats = LogShipper.singleton().stats()
+                await message.channel.send(
+                    "**Log Shipper:** {0}/{1} buffered, {2} shipped, {3} dropped, {4} failed batches".format(
+                        log_stats["pending"],
+                        log_stats["capacity"],
+                        log_stats["shipped"],
+                        log_stats["dropped"],
+                        log_stats["failed_batches"],
+                    )
+                )
+                if LogArchive.singleton() is not None:
+                    await message.channel.send(
+                        "**Log Archive:** {0} archived, {1} dropped, {2} failed writes".format(
+                            log_stats["archived"],
+                            log_stats["archive_dropped"],
+                            log_stats["archive_failures"],
+                        )
+                    )
+                error_stats = ErrorReporter.singleton().stats()
+                await message.channel.send(
+                    "**Error Reporter:** {0} unsent, {1} repeats coalesced, {2} dropped".format(
+                        error_stats["unsent"],
+                        error_stats["coalesced"],
+                        error_stats["dropped"],
+                    )
+                )
+                db_latency = Instrumentation.singleton().summary("db.")
+                if db_latency:
+                    await message.channel.send(
+                        f"**DB Latency ({type(Data.singleton()).__name__}):**\n"
+                        + "\n".join(db_latency)
+                        + "\nUse `!status json` for every method."
+                    )
+                liqui_stats = Instrumentation.singleton().summary("liqui.")
+                if liqui_stats:
+                    queue_depths = Instrumentation.singleton().gauges("liqui.")
+                    await message.channel.send(
+                        "**Liquipedia Rate Limits:**\n"
+                        + "\n".join(liqui_stats)
+                        + "\n"
+                        + ", ".join(
+                            f"{name[len('liqui.'):]}: {int(depth)}"
+                            for name, depth in queue_depths.items()
+                        )
+                    )
             except:
                 pass
 
@@ -1524,7 +1807,7 @@ class RLEsportsBot(discord.Client):
 
             if operation == "list":
                 long_to_short_name_map: dict[str, str] = (
-                    Data.singleton().read_all_aliases()
+                    await AsyncData.singleton().read_all_aliases()
                 )
                 if len(long_to_short_name_map) == 0:
                     await message.channel.send(
@@ -1550,7 +1833,7 @@ class RLEsportsBot(discord.Client):
                     )
                     return
                 global_settings.rleb_log_info(f"Removing alias: {long_name}")
-                Data.singleton().remove_alias(long_name)
+                await AsyncData.singleton().remove_alias(long_name)
                 await message.channel.send(
                     "Alias removed. Use `!alias list` to see all existing aliases."
                 )
@@ -1569,7 +1852,7 @@ class RLEsportsBot(discord.Client):
                 global_settings.rleb_log_info(
                     f"Adding alias: {long_name} -> {short_name}"
                 )
-                Data.singleton().add_alias(long_name, short_name)
+                await AsyncData.singleton().add_alias(long_name, short_name)
                 await message.channel.send(
                     "Alias added. Use `!alias list` to see all existing aliases."
                 )
@@ -1705,7 +1988,7 @@ class RLEsportsBot(discord.Client):
                         )
                         return
                     auto_update_id = int(tokens[2])
-                    auto_update = Data.singleton().read_auto_update_from_id(
+                    auto_update = await AsyncData.singleton().read_auto_update_from_id(
                         auto_update_id
                     )
                     if not auto_update:
@@ -1713,7 +1996,7 @@ class RLEsportsBot(discord.Client):
                             "Couldn't find that auto update! Use `!autoupdate list` to view all auto update ids, and then use `!autoupdate stop id`."
                         )
                         return
-                    Data.singleton().delete_auto_update(auto_update)
+                    await AsyncData.singleton().delete_auto_update(auto_update)
                     if auto_update_id in global_settings.auto_updates:
                         del global_settings.auto_updates[auto_update_id]
                     await message.channel.send(
@@ -1763,7 +2046,7 @@ class RLEsportsBot(discord.Client):
                 if tokens[1] == "list":
                     global_settings.rleb_log_info("[DISCORD]: Listing autoupdate")
                     auto_updates: list[AutoUpdate] = (
-                        Data.singleton().read_all_auto_updates()
+                        await AsyncData.singleton().read_all_auto_updates()
                     )
                     if len(auto_updates) == 0:
                         await message.channel.send(
@@ -1813,7 +2096,7 @@ class RLEsportsBot(discord.Client):
                     template = tourney_system
                 else:
                     template = f"{tourney_system}-{stringified_options}"
-                auto_update = Data.singleton().write_auto_update(
+                auto_update = await AsyncData.singleton().write_auto_update(
                     reddit_url,
                     liqui_url,
                     tourney_system,
@@ -2000,21 +2283,20 @@ class RLEsportsBot(discord.Client):
                     return
 
                 # Check if reminder exists in database
-                remindmes = Data.singleton().read_remindmes()
-                if not any(r.remindme_id == remindme_id for r in remindmes):
+                if await AsyncData.singleton().read_remindme(remindme_id) is None:
                     await message.channel.send(
                         f"Couldn't find reminder with id `{remindme_id}`. Use `!remindme list` to view all reminder ids."
                     )
                     return
 
-                Data.singleton().delete_remindme(remindme_id)
+                await RemindmeScheduler.singleton().cancel(remindme_id)
 
                 await message.channel.send("Deleted reminder.")
                 await self.add_response(message)
                 return
 
             if tokens[1] == "list":
-                remindmes: list[Remindme] = Data.singleton().read_remindmes()
+                remindmes: list[Remindme] = await AsyncData.singleton().read_remindmes()
                 output = ""
                 for remindme in remindmes:
                     total_seconds_left = remindme.trigger_timestamp - time.time()
@@ -2072,10 +2354,9 @@ class RLEsportsBot(discord.Client):
                 return
 
             total_time = seconds_multiplier[last_char] * units
-            remindme: Remindme = Data.singleton().write_remindme(
+            remindme: Remindme = await RemindmeScheduler.singleton().schedule(
                 user, reminder_message, int(total_time), message.channel.id
             )
-            # Remindme will be picked up by the check_remindmes() polling loop
             await message.channel.send(
                 random.choice(global_settings.success_emojis)
                 + " reminder set.\nUse `!remindme list` to see all reminders."
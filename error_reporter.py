@@ -0,0 +1,138 @@
+from collections import deque
+from dataclasses import dataclass
+import re
+from typing import Optional
+
+# Repeats of an error within this many seconds of reporting it are only counted.
+ERROR_COALESCE_WINDOW_SECONDS = 300
+# Longest message Discord accepts.
+DISCORD_MESSAGE_LIMIT = 2000
+# Most messages sent to #bot-logs per drain, so an outage can't eat the rate limit of every other loop.
+ERROR_REPORT_MAX_MESSAGES = 3
+# Most distinct errors waiting to be sent. Once full, the oldest waiting error is dropped.
+ERROR_REPORT_BACKLOG = 500
+
+_VOLATILE_PATTERN = re.compile(r"0x[0-9a-f]+|\d+")
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+def fingerprint(message: str) -> str:
+    """Identity of an error, ignoring numbers (ids, line numbers, counts, addresses) and spacing."""
+    normalized = _VOLATILE_PATTERN.sub("#", message.lower())
+    return _WHITESPACE_PATTERN.sub(" ", normalized).strip()
+
+
+@dataclass
+class _ReportedError:
+    message: str
+    reported_at: float
+    repeats: int = 0
+
+
+class ErrorReporter(object):
+    """Turns a stream of error messages into few, packed #bot-logs messages.
+
+    The first occurrence of an error is sent on the next drain. Repeats with the same
+    fingerprint within ERROR_COALESCE_WINDOW_SECONDS are counted and sent once as a
+    single summary when the window closes.
+    """
+
+    _singleton = None
+
+    def __init__(
+        self,
+        window_seconds: float = ERROR_COALESCE_WINDOW_SECONDS,
+        message_limit: int = DISCORD_MESSAGE_LIMIT,
+        max_messages: int = ERROR_REPORT_MAX_MESSAGES,
+        backlog: int = ERROR_REPORT_BACKLOG,
+    ) -> None:
+        self._window_seconds = window_seconds
+        self._message_limit = message_limit
+        self._max_messages = max_messages
+        self._backlog = backlog
+        self._reported: dict[str, _ReportedError] = {}
+        self._unsent: deque[str] = deque(maxlen=backlog)
+        self.coalesced = 0
+        self.dropped = 0
+
+    @classmethod
+    def singleton(cls) -> "ErrorReporter":
+        if cls._singleton is None:
+            cls._singleton = cls()
+        return cls._singleton
+
+    def add(self, message: str, now: float) -> None:
+        key = fingerprint(message)
+        reported = self._reported.get(key)
+        if reported is not None and now - reported.reported_at < self._window_seconds:
+            reported.repeats += 1
+            self.coalesced += 1
+            return
+        self._reported[key] = _ReportedError(message, now)
+        self._queue(message)
+
+    def _queue(self, message: str) -> None:
+        if len(self._unsent) == self._unsent.maxlen:
+            self.dropped += 1
+        self._unsent.append(message)
+
+    def _close_windows(self, now: float) -> None:
+        """Forgets errors whose window has passed, queueing a summary of their repeats."""
+        for key, reported in list(self._reported.items()):
+            if now - reported.reported_at < self._window_seconds:
+                continue
+            del self._reported[key]
+            if reported.repeats:
+                self._queue(
+                    "[repeated {0}x in {1}s] {2}".format(
+                        reported.repeats, round(self._window_seconds), reported.message
+                    )
+                )
+
+    def _truncate(self, message: str) -> str:
+        if len(message) <= self._message_limit:
+            return message
+        return message[: self._message_limit - 3] + "..."
+
+    def _pack(self) -> Optional[str]:
+        """Joins as many waiting errors as fit in one Discord message, oldest first."""
+        if not self._unsent:
+            return None
+        packed = self._truncate(self._unsent.popleft())
+        while self._unsent:
+            next_message = self._truncate(self._unsent[0])
+            if len(packed) + 1 + len(next_message) > self._message_limit:
+                break
+            self._unsent.popleft()
+            packed += "\n" + next_message
+        return packed
+
+    def take_messages(self, now: float) -> list[str]:
+        """Returns at most `max_messages` Discord messages to send now. The rest wait for the next drain."""
+        self._close_windows(now)
+        messages: list[str] = []
+        while len(messages) < self._max_messages:
+            packed = self._pack()
+            if packed is None:
+                break
+            messages.append(packed)
+        return messages
+
+    def requeue(self, messages: list[str]) -> None:
+        """
+        Puts messages that failed to send back in front of the waiting errors. They are the
+        oldest errors, so the ones that don't fit in the backlog are dropped, like _queue()
+        drops the oldest.
+        """
+        free = self._backlog - len(self._unsent)
+        if len(messages) > free:
+            self.dropped += len(messages) - free
+            messages = messages[len(messages) - free :]
+        self._unsent.extendleft(reversed(messages))
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "unsent": len(self._unsent),
+            "coalesced": self.coalesced,
+            "dropped": self.dropped,
+        }
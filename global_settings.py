@@ -1,4 +1,5 @@
 # Utilities file. Houses methods that are used throughout rleb.
+from collections import deque
 import configparser
 import threading
 import time
@@ -12,6 +13,9 @@ from sys import platform
 import discord
 
 from data_bridge import AutoUpdate, Data, Remindme
+from log_index import LogIndex
+from log_records import DEBUG, INFO, LogRecord, LogSampler
+from log_shipper import LogShipper
 
 config = configparser.ConfigParser(interpolation=None)
 if os.path.exists("rleb_secrets.ini"):
@@ -53,6 +57,11 @@ asyncio_threads_heartbeats = {
     "remindme": datetime.now(),
     "health": datetime.now(),
     "task_alerts": datetime.now(),
+    "user_statistics": datetime.now(),
+    "log_partitions": datetime.now(),
+    "table_changes": datetime.now(),
+    "log_shipper": datetime.now(),
+    "sql_sessions": datetime.now(),
 }
 
 # List of threads to check for heartbeat in health check.
@@ -92,7 +101,7 @@ auto_update_markdown: Dict[str, str] = {}
 
 
 def refresh_remindmes() -> None:
-    """No-op: Remindmes are now checked by the check_remindmes() asyncio loop in discord_bridge.py."""
+    """No-op: Remindmes are loaded and scheduled by RemindmeScheduler in the check_remindmes() asyncio loop."""
     pass
 
 
@@ -280,6 +289,21 @@ def is_discord_mod(user: discord.Member) -> bool:
 
 discord_async_interval_seconds = 20
 
+# Longest the remindme loop sleeps between reminders, so its heartbeat stays fresh.
+remindme_max_sleep_seconds = 60
+
+# Seconds between writes of buffered !ty user statistics to the db.
+user_statistics_flush_interval_seconds = 60
+
+# Seconds between closing !sql queries left idle past their session lifetime.
+sql_session_sweep_interval_seconds = 30
+
+# Seconds between creating upcoming log partitions and dropping expired ones.
+log_partition_maintenance_interval_seconds = 60 * 60 * 6
+
+# Longest the table change listener blocks waiting for a notification from the db.
+table_changes_listen_timeout_seconds = 30
+
 # MONITORING
 
 enable_direct_channel_messages = (
@@ -288,40 +312,76 @@ enable_direct_channel_messages = (
 
 logging_enabled = True
 
+# Logs below this level are dropped before anything is formatted.
+log_level = DEBUG
 
-def flush_memory_log() -> None:
-    """Write all logs from memory to db."""
-    if RUNNING_MODE == "local":
-        return
-    Data.singleton().write_to_logs(memory_log)
-    memory_log.clear()
+# Debug logs kept per subsystem, as 1 of every n from each call site. For per-item and
+# per-cycle logs.
+log_sampler = LogSampler({"REDDIT": 10, "TASK CHECK": 10})
+
+
+# Longest buffered logs wait before the log shipper writes them to the db.
+log_ship_interval_seconds = 5
 
 
-# list of tuples (datetime, message)
-memory_log: list[tuple[datetime, str]] = []
+def flush_memory_log() -> None:
+    """Write all buffered logs to the archive and db. Blocks, so only for shutdown or off the event loop."""
+    LogShipper.singleton().flush(to_db=RUNNING_MODE != "local")
+
 
-# Queue for error messages to send to Discord #bot-logs channel
-error_log_queue: list[str] = []
+# Queue for error messages to send to Discord #bot-logs channel. Appended from any thread,
+# drained by the error reporter.
+error_log_queue: deque[str] = deque()
 
 
-def _rleb_log(message: str, should_flush: bool = False) -> None:
-    """Log a message to memory. If `should_flush` is True or memory is too full, the logs will be sent to db."""
-    print(f"{datetime.now()} - {message}")
+def _rleb_log(
+    message: str, should_flush: bool = False, log_time: Optional[datetime] = None
+) -> None:
+    """Log a message to memory. The log shipper sends it to db, right away if `should_flush` is True."""
+    log_time = log_time or datetime.now()
+    print(f"{log_time} - {message}")
     if not logging_enabled:
         return
-    memory_log.append((datetime.now(), message))
-    if len(memory_log) > 10 or should_flush:
-        flush_memory_log()
+    LogIndex.singleton().add(log_time, message)
+    LogShipper.singleton().enqueue(log_time, message, urgent=should_flush)
+
+
+def rleb_log(
+    level: int,
+    subsystem: str,
+    template: str,
+    should_flush: bool = False,
+    **fields: Any,
+) -> None:
+    """
+    Log a structured record, e.g. rleb_log(INFO, "REDDIT", "Modmail - {id}", id=conversation.id).
+
+    Records below `log_level`, and debug records `log_sampler` skips, are dropped before
+    the template is formatted. Debug records are sampled per template, so per call site.
+    """
+    if level < log_level:
+        return
+    if level <= DEBUG and not log_sampler.sample(subsystem, template):
+        return
+    record = LogRecord(level, subsystem, template, fields)
+    _rleb_log(record.message(), should_flush=should_flush, log_time=record.log_time)
+
+
+def rleb_log_debug(subsystem: str, template: str, **fields: Any) -> None:
+    """Log a sampled debug record. See rleb_log()."""
+    rleb_log(DEBUG, subsystem, template, **fields)
 
 
 def rleb_log_info(message: str, should_flush: bool = False) -> None:
-    """Log an informative message. If `should_flush` is True or memory is too full, the logs will be sent to db."""
+    """Log an informative message. If `should_flush` is True, the log shipper sends it to db right away."""
+    if log_level > INFO:
+        return
     _rleb_log("INFO: {0}".format(message), should_flush=should_flush)
 
 
 def rleb_log_error(message: str) -> None:
     """Log an error message."""
-    _rleb_log("ERROR: {0}".format(message), should_flush=True)
+    _rleb_log("ERROR: {0}".format(message))
     # Queue error for Discord #bot-logs channel
     error_log_queue.append(message)
 
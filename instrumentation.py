@@ -0,0 +1,185 @@
+from collections import deque
+from dataclasses import dataclass, field
+import functools
+import inspect
+import json
+import threading
+import time
+from typing import Any, Callable, Optional, TypeVar
+
+# Latencies kept per operation for percentiles. Older samples are dropped first.
+INSTRUMENTATION_SAMPLE_SIZE = 1024
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+@dataclass
+class OperationStats:
+    """Running totals for one instrumented operation."""
+
+    calls: int = 0
+    errors: int = 0
+    rows: int = 0
+    # Most recent latencies, in seconds.
+    latencies: deque = field(
+        default_factory=lambda: deque(maxlen=INSTRUMENTATION_SAMPLE_SIZE)
+    )
+
+
+def _percentile(sorted_values: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted, non-empty list."""
+    index = max(0, min(len(sorted_values) - 1, int(fraction * len(sorted_values))))
+    return sorted_values[index]
+
+
+def count_rows(result: Any) -> int:
+    """Rows an operation returned: the length of collections, 0 for None, else 1."""
+    if result is None:
+        return 0
+    if isinstance(result, (list, tuple, dict, set)):
+        return len(result)
+    return 1
+
+
+class Instrumentation(object):
+    """Thread-safe call counts, latency percentiles, row counts and errors per operation, plus gauges."""
+
+    _singleton = None
+
+    def __init__(self) -> None:
+        self._operations: dict[str, OperationStats] = {}
+        # Latest value of each gauge, e.g. a queue depth.
+        self._gauges: dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._since = time.time()
+
+    @classmethod
+    def singleton(cls) -> "Instrumentation":
+        if cls._singleton is None:
+            cls._singleton = cls()
+        return cls._singleton
+
+    def record(
+        self, name: str, seconds: float, rows: int = 0, error: bool = False
+    ) -> None:
+        with self._lock:
+            stats = self._operations.get(name)
+            if stats is None:
+                stats = self._operations[name] = OperationStats()
+            stats.calls += 1
+            stats.rows += rows
+            stats.errors += int(error)
+            stats.latencies.append(seconds)
+
+    def gauge(self, name: str, value: float) -> None:
+        with self._lock:
+            self._gauges[name] = value
+
+    def gauges(self, prefix: str = "") -> dict[str, float]:
+        with self._lock:
+            return {
+                name: value
+                for name, value in sorted(self._gauges.items())
+                if name.startswith(prefix)
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._operations = {}
+            self._gauges = {}
+            self._since = time.time()
+
+    def snapshot(self, prefix: str = "") -> dict[str, dict[str, float]]:
+        """Returns calls, errors, rows and p50/p95/p99 latency (ms) for each operation starting with `prefix`."""
+        with self._lock:
+            operations = {
+                name: (stats.calls, stats.errors, stats.rows, sorted(stats.latencies))
+                for name, stats in self._operations.items()
+                if name.startswith(prefix)
+            }
+        snapshot = {}
+        for name, (calls, errors, rows, latencies) in sorted(operations.items()):
+            snapshot[name] = {
+                "calls": calls,
+                "errors": errors,
+                "rows": rows,
+                "p50_ms": round(_percentile(latencies, 0.50) * 1000, 3),
+                "p95_ms": round(_percentile(latencies, 0.95) * 1000, 3),
+                "p99_ms": round(_percentile(latencies, 0.99) * 1000, 3),
+            }
+        return snapshot
+
+    def dump(self, extra: Optional[dict[str, Any]] = None) -> str:
+        """Returns every operation's stats and gauges as JSON, along with `extra` top level keys, for !status json."""
+        return json.dumps(
+            {
+                **(extra or {}),
+                "since": self._since,
+                "generated_at": time.time(),
+                "operations": self.snapshot(),
+                "gauges": self.gauges(),
+            },
+            indent=2,
+        )
+
+    def summary(self, prefix: str = "", limit: int = 10) -> list[str]:
+        """Returns one line per operation starting with `prefix`, slowest p95 first."""
+        snapshot = self.snapshot(prefix)
+        slowest = sorted(snapshot.items(), key=lambda item: -item[1]["p95_ms"])
+        return [
+            "{0}: {1} calls, p50 {2}ms, p95 {3}ms, p99 {4}ms, {5} rows, {6} errors".format(
+                name[len(prefix) :],
+                stats["calls"],
+                stats["p50_ms"],
+                stats["p95_ms"],
+                stats["p99_ms"],
+                stats["rows"],
+                stats["errors"],
+            )
+            for name, stats in slowest[:limit]
+        ]
+
+
+def instrumented(
+    name: str, instrumentation: Optional[Instrumentation] = None
+) -> Callable[[F], F]:
+    """Decorator recording each call of a function or coroutine function as `name`."""
+
+    def decorator(fn: F) -> F:
+        def record(start: float, result: Any, error: bool) -> None:
+            (instrumentation or Instrumentation.singleton()).record(
+                name,
+                time.perf_counter() - start,
+                0 if error else count_rows(result),
+                error,
+            )
+
+        if inspect.iscoroutinefunction(fn):
+
+            @functools.wraps(fn)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                start = time.perf_counter()
+                try:
+                    result = await fn(*args, **kwargs)
+                except BaseException:
+                    record(start, None, True)
+                    raise
+                record(start, result, False)
+                return result
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            start = time.perf_counter()
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException:
+                record(start, None, True)
+                raise
+            record(start, result, False)
+            return result
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
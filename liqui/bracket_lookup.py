@@ -1,10 +1,6 @@
-from typing import NamedTuple
-from bs4 import BeautifulSoup
 from datetime import datetime
 import traceback
 
-import pytz
-
 from data_bridge import Data
 import global_settings
 import stdout
@@ -77,9 +73,9 @@ async def handle_bracket_lookup(
     # # If Diesel fails, fallback to RLEB, python parsing.
     # await channel.send("Failed to build bracket table from Diesel. Trying RLEB...")
     try:
-        content = None
+        page = None
         try:
-            content = liqui_utils.get_page_html_from_url(url)
+            page = await liqui_utils.fetch_page(url, ("rounds", "matches"))
         except Exception as e:
             await channel.send("Couldn't load {0} !\nError: {1}".format(url, e))
             global_settings.rleb_log_info(
@@ -88,88 +84,14 @@ async def handle_bracket_lookup(
             global_settings.rleb_log_error(traceback.format_exc())
             return
 
-        html = BeautifulSoup(content, "html.parser")
-
-        class Match(NamedTuple):
-            team1: str
-            team2: str
-            team1_score: int
-            team2_score: int
-            game_start_time: datetime
-            is_finished: bool
-
-        matches: list[Match] = []
-        rounds: list[str] = []
-
-        def datetime_from_liqui_timestring(
-            liqui_timestring: str, timezone: str
-        ) -> datetime:
-            """Returns a UTC datetime off of the time string from liquipedia."""
-            # Clean timezone offset.
-            tz = timezone.replace(":", "")
-            if len(tz) == 4:
-                # Add a padding 0 to the first digit, after the +/-.
-                tz = tz[0] + "0" + tz[1:]
-
-            # Liqui format example: March 26, 2022 - 13:15
-            local_datetime = datetime.strptime(
-                liqui_timestring + tz, "%B %d, %Y - %H:%M%z"
-            )
-            return local_datetime.astimezone(pytz.timezone("Etc/UTC"))
-
         def time_of_day_from_datetime(dt: datetime) -> str:
             """Returns 'hh:mm UTC' from a datetime."""
             return datetime.strftime(dt, "%H:%M UTC")
 
-        match_elements = html.select(".brkts-round-center")
-        for match in match_elements:
-            timer = match.select(".timer-object")[0]
-            try:
-                is_finished = timer.attrs["data-finished"] != None
-            except:
-                is_finished = False
-
-            # Strip out timezone info from timer, use data-tz instead (more standard).
-            liqui_timestring = timer.text
-            timezone = timer.select("abbr")[0].attrs["data-tz"]
-            timezone_str = timer.select("abbr")[0].text
-            liqui_timestring = liqui_timestring.replace(timezone_str, "").strip()
-            start_datetime = datetime_from_liqui_timestring(liqui_timestring, timezone)
-
-            # Fetch team names and scores.
-            teams = match.select(".brkts-opponent-entry")
-            team1_name = "TBD"
-            team1_score = ""
-            team2_name = "TBD"
-            team2_score = ""
-            try:
-                team1_name = teams[0].select(".name")[0].text
-                team1_score = teams[0].select(".brkts-opponent-score-inner")[0].text
-            except:
-                pass
-            try:
-                team2_name = teams[1].select(".name")[0].text
-                team2_score = teams[1].select(".brkts-opponent-score-inner")[0].text
-            except:
-                pass
-
-            new_match = Match(
-                team1_name,
-                team2_name,
-                team1_score,
-                team2_score,
-                start_datetime,
-                is_finished,
-            )
-            matches.append(new_match)
-
-        round_elements = html.select(".brkts-header.brkts-header-div")
-        rounds = [r.select(".brkts-header-option")[0].text for r in round_elements]
-
         # changes liquipedia grab to our preferred round names
-        correct_rounds = list(map(bracket_names, rounds))
+        correct_rounds = list(map(bracket_names, page.rounds))
 
-        matches.sort(key=lambda x: x.game_start_time)
+        matches = sorted(page.matches, key=lambda x: x.start_time)
 
         final_markdown = BRACKET_MARKDOWN_TEMPLATE.replace("{LIQUI_URL}", url)
         for r in correct_rounds:
@@ -191,7 +113,7 @@ async def handle_bracket_lookup(
             match_row = match_template.replace("{TEAM1}", team1_name)
             match_row = match_row.replace("{TEAM2}", team2_name)
             match_row = match_row.replace(
-                "{TIMESTRING}", time_of_day_from_datetime(m.game_start_time)
+                "{TIMESTRING}", time_of_day_from_datetime(m.start_time)
             )
             match_row = match_row.replace("{TEAM1_SCORE}", m.team1_score)
             match_row = match_row.replace("{TEAM2_SCORE}", m.team2_score)
@@ -1,16 +1,20 @@
 from typing import Optional
 import discord
-import requests
 from data_bridge import Data
+from liqui import liqui_utils
 from liqui.liqui_utils import string_to_base64, base64_to_string
 
 import global_settings
 import stdout
 
+# (connect, read) timeouts in seconds for diesel, which builds markdown from several pages.
+DIESEL_TIMEOUT_SECONDS = (5, 120)
+
 
 def get_make_thread_markdown(url: str, template: str, day_number: int) -> str:
-    response = requests.get(
-        f"http://localhost:8080/makethread/{string_to_base64(url)}/template/{string_to_base64(template)}/day/{day_number}"
+    response = liqui_utils.http_get(
+        f"http://localhost:8080/makethread/{string_to_base64(url)}/template/{string_to_base64(template)}/day/{day_number}",
+        timeout=DIESEL_TIMEOUT_SECONDS,
     )
     markdown = base64_to_string(response.content)
     aliases = Data.singleton().read_all_aliases()
@@ -22,8 +26,9 @@ def get_make_thread_markdown(url: str, template: str, day_number: int) -> str:
 
 
 def get_make_thread_markdown_date(url: str, template: str, date_number: int) -> str:
-    response = requests.get(
-        f"http://localhost:8080/makethread/{string_to_base64(url)}/template/{string_to_base64(template)}/date/{date_number}"
+    response = liqui_utils.http_get(
+        f"http://localhost:8080/makethread/{string_to_base64(url)}/template/{string_to_base64(template)}/date/{date_number}",
+        timeout=DIESEL_TIMEOUT_SECONDS,
     )
     markdown = base64_to_string(response.content)
     aliases = Data.singleton().read_all_aliases()
@@ -67,8 +72,9 @@ async def handle_broadcast_lookup(
     )
 
     try:
-        response = requests.get(
-            f"http://localhost:8080/broadcast/{string_to_base64(url)}"
+        response = liqui_utils.http_get(
+            f"http://localhost:8080/broadcast/{string_to_base64(url)}",
+            timeout=DIESEL_TIMEOUT_SECONDS,
         )
         markdown = base64_to_string(response.content)
         aliases = Data.singleton().read_all_aliases()
@@ -95,8 +101,9 @@ async def handle_stream_lookup(url: str, channel: discord.channel.TextChannel) -
     global_settings.rleb_log_info("DIESEL: Creating stream lookup for {0}".format(url))
 
     try:
-        response = requests.get(
-            f"http://localhost:8080/streams/{string_to_base64(url)}"
+        response = liqui_utils.http_get(
+            f"http://localhost:8080/streams/{string_to_base64(url)}",
+            timeout=DIESEL_TIMEOUT_SECONDS,
         )
         markdown = base64_to_string(response.content)
         aliases = Data.singleton().read_all_aliases()
@@ -130,8 +137,9 @@ async def handle_schedule_lookup(
     )
 
     try:
-        response = requests.get(
-            f"http://localhost:8080/schedule/{string_to_base64(liquipedia_url)}/day/{day_number}"
+        response = liqui_utils.http_get(
+            f"http://localhost:8080/schedule/{string_to_base64(liquipedia_url)}/day/{day_number}",
+            timeout=DIESEL_TIMEOUT_SECONDS,
         )
         markdown = base64_to_string(response.content)
         aliases = Data.singleton().read_all_aliases()
@@ -165,8 +173,9 @@ async def handle_schedule_lookup_date(
     )
 
     try:
-        response = requests.get(
-            f"http://localhost:8080/schedule/{string_to_base64(liquipedia_url)}/date/{date_number}"
+        response = liqui_utils.http_get(
+            f"http://localhost:8080/schedule/{string_to_base64(liquipedia_url)}/date/{date_number}",
+            timeout=DIESEL_TIMEOUT_SECONDS,
         )
         markdown = base64_to_string(response.content)
         aliases = Data.singleton().read_all_aliases()
@@ -197,8 +206,9 @@ async def handle_coverage_lookup(
     )
 
     try:
-        response = requests.get(
-            f"http://localhost:8080/coverage/{string_to_base64(url)}"
+        response = liqui_utils.http_get(
+            f"http://localhost:8080/coverage/{string_to_base64(url)}",
+            timeout=DIESEL_TIMEOUT_SECONDS,
         )
         markdown = base64_to_string(response.content)
         aliases = Data.singleton().read_all_aliases()
@@ -218,7 +228,9 @@ async def handle_coverage_lookup(
 async def healthcheck() -> Optional[str]:
     try:
         return (
-            requests.get(f"http://localhost:8080/healthcheck")
+            liqui_utils.http_get(
+                "http://localhost:8080/healthcheck", timeout=DIESEL_TIMEOUT_SECONDS
+            )
             .content.decode("utf-8")
             .strip()
         )
@@ -229,8 +241,9 @@ async def healthcheck() -> Optional[str]:
 
 async def get_prizepool_markdown(liquipedia_url: str) -> Optional[str]:
     try:
-        response = requests.get(
-            f"http://localhost:8080/prizepool/{string_to_base64(liquipedia_url)}"
+        response = liqui_utils.http_get(
+            f"http://localhost:8080/prizepool/{string_to_base64(liquipedia_url)}",
+            timeout=DIESEL_TIMEOUT_SECONDS,
         )
         markdown = base64_to_string(response.content)
         aliases = Data.singleton().read_all_aliases()
@@ -249,8 +262,9 @@ async def get_mvp_candidates(liquipedia_url: str, teams_allowed: int = 4) -> str
         "DIESEL: Creating mvp lookup for {0}".format(liquipedia_url)
     )
 
-    response = requests.get(
-        f"http://localhost:8080/mvp_candidates/{string_to_base64(liquipedia_url)}/teams_allowed/{teams_allowed}"
+    response = liqui_utils.http_get(
+        f"http://localhost:8080/mvp_candidates/{string_to_base64(liquipedia_url)}/teams_allowed/{teams_allowed}",
+        timeout=DIESEL_TIMEOUT_SECONDS,
     )
     markdown = base64_to_string(response.content)
     aliases = Data.singleton().read_all_aliases()
@@ -263,8 +277,9 @@ async def get_mvp_candidates(liquipedia_url: str, teams_allowed: int = 4) -> str
 
 async def get_swiss_markdown(liquipedia_url: str) -> Optional[str]:
     try:
-        response = requests.get(
-            f"http://localhost:8080/swiss/{string_to_base64(liquipedia_url)}"
+        response = liqui_utils.http_get(
+            f"http://localhost:8080/swiss/{string_to_base64(liquipedia_url)}",
+            timeout=DIESEL_TIMEOUT_SECONDS,
         )
         markdown = base64_to_string(response.content)
         aliases = Data.singleton().read_all_aliases()
@@ -285,8 +300,9 @@ async def get_bracket_markdown(liquipedia_url: str, day_number: int) -> Optional
         day_number (int): The day (usually 1, 2, or 3) of the event to generate a bracket for.
     """
     try:
-        response = requests.get(
-            f"http://localhost:8080/bracket/{string_to_base64(liquipedia_url)}/day/{day_number}"
+        response = liqui_utils.http_get(
+            f"http://localhost:8080/bracket/{string_to_base64(liquipedia_url)}/day/{day_number}",
+            timeout=DIESEL_TIMEOUT_SECONDS,
         )
         markdown = base64_to_string(response.content)
         aliases = Data.singleton().read_all_aliases()
@@ -309,8 +325,9 @@ async def get_bracket_markdown_date(
         day_number (int): The day (usually 1, 2, or 3) of the event to generate a bracket for.
     """
     try:
-        response = requests.get(
-            f"http://localhost:8080/bracket/{string_to_base64(liquipedia_url)}/date/{date_number}"
+        response = liqui_utils.http_get(
+            f"http://localhost:8080/bracket/{string_to_base64(liquipedia_url)}/date/{date_number}",
+            timeout=DIESEL_TIMEOUT_SECONDS,
         )
         markdown = base64_to_string(response.content)
         aliases = Data.singleton().read_all_aliases()
@@ -325,8 +342,9 @@ async def get_bracket_markdown_date(
 
 async def get_group_markdown(liquipedia_url: str) -> Optional[str]:
     try:
-        response = requests.get(
-            f"http://localhost:8080/groups/{string_to_base64(liquipedia_url)}"
+        response = liqui_utils.http_get(
+            f"http://localhost:8080/groups/{string_to_base64(liquipedia_url)}",
+            timeout=DIESEL_TIMEOUT_SECONDS,
         )
         markdown = base64_to_string(response.content)
         aliases = Data.singleton().read_all_aliases()
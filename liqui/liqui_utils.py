@@ -1,29 +1,128 @@
+import asyncio
 import base64
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import functools
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import random
+import re
+import threading
+import time
+from typing import Any, Callable, Optional, TypeVar, Union
 from urllib.parse import quote as urlescape
 
-headers = {"User-Agent": "r/RocketLeagueEsports Thread Tools"}
+from instrumentation import Instrumentation
+from liqui.liquipedia_page import LiquipediaPage
+from liqui.page_content_cache import PageContentCache
+from liqui.page_html_store import PageVersion
+from liqui.page_id_cache import PageIdCache, normalize_page_title
+from liqui.rate_limiter import RateLimitExceeded, TokenBucket
 
+headers = {
+    "User-Agent": "r/RocketLeagueEsports Thread Tools",
+    # Liquipedia asks API clients to accept gzip.
+    "Accept-Encoding": "gzip",
+}
 
-def _get_page_id_from_url(liquipedia_url: str) -> str:
-    """Accepts a liquipedia_url and returns a mediawiki api pageid."""
+# (connect, read) timeouts in seconds for Liquipedia requests.
+HTTP_TIMEOUT_SECONDS = (5, 30)
+# Keep-alive connections held open per host. Extra concurrent requests open (and close)
+# their own connection instead of waiting.
+HTTP_POOL_SIZE = 8
+
+# Threads that fetch and parse Liquipedia pages, so lookups never block the event loop.
+# Rate limit waits happen on the event loop, never on these threads.
+LIQUI_WORKERS = 4
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+_workers = ThreadPoolExecutor(max_workers=LIQUI_WORKERS, thread_name_prefix="liqui")
+
+# Liquipedia's API terms allow one parse request per 30s and one other request per 2s.
+# The small bursts let a couple of lookups start at once.
+# Lookups past the queue caps fail fast rather than waiting minutes.
+RATE_LIMITS = {
+    "parse": TokenBucket("parse", capacity=2, refill_seconds=30, max_waiting=4),
+    "query": TokenBucket("query", capacity=5, refill_seconds=2, max_waiting=20),
+}
+
+# In-flight page fetches by page, shared by concurrent lookups of the same page.
+_in_flight: dict[str, "asyncio.Future[str]"] = {}
+
+# Parsed pages kept for reuse across lookups. The least recently used is dropped past this.
+PARSED_PAGES = 8
+# Latest parsed revision of each page, by page.
+_parsed_pages: OrderedDict[str, LiquipediaPage] = OrderedDict()
+
+T = TypeVar("T")
+
+
+def http_session() -> requests.Session:
+    """Shared, pooled session, so fetches reuse keep-alive connections instead of a new TLS handshake each."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=HTTP_POOL_SIZE)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers.update(headers)
+            _session = session
+        return _session
+
+
+def http_get(
+    url: str, timeout: Union[float, tuple[float, float]] = HTTP_TIMEOUT_SECONDS
+) -> requests.Response:
+    """GET `url` through the shared session."""
+    return http_session().get(url, timeout=timeout)
+
+
+# Parse errors meaning the pageid no longer points at a page.
+MISSING_PAGE_ERRORS = {"nosuchpageid", "missingtitle"}
+
+
+def _get_json(url: str) -> dict:
+    response = http_get(url)
+    # Uncomment to generate the response text for testing.
+    # with open("new_response.txt", "w") as f:
+    #     f.write(response.text)
+    if response.status_code >= 300:
+        raise Exception(response.text)
+    return json.loads(response.text)
+
+
+async def liquipedia_get_json(url: str) -> dict:
+    """
+    GETs a Liquipedia api url as json. Waits for the url's rate limit budget on the
+    event loop, then fetches on the liqui worker pool.
+    """
+    await RATE_LIMITS["parse" if "action=parse" in url else "query"].acquire()
+    return await run_in_worker(_get_json, url)
+
+
+def _get_page_title_from_url(liquipedia_url: str) -> str:
     liquipedia_url = (
         liquipedia_url.replace("https://", "")
         .replace("http://", "")
         .replace("www.", "")
     )
-    liquipedia_page_title = liquipedia_url.split("liquipedia.net/rocketleague/")[1]
+    return liquipedia_url.split("liquipedia.net/rocketleague/")[1]
+
+
+async def _get_page_id_from_url(liquipedia_url: str, use_cache: bool = True) -> str:
+    """Accepts a liquipedia_url and returns a mediawiki api pageid, from the cache when possible."""
+    liquipedia_page_title = _get_page_title_from_url(liquipedia_url)
+    if use_cache:
+        cached_page_id = PageIdCache.singleton().get(liquipedia_page_title)
+        if cached_page_id is not None:
+            return cached_page_id
 
     request = f"https://liquipedia.net/rocketleague/api.php?action=query&format=json&titles={liquipedia_page_title}"
-    response = requests.get(request, headers=headers)
-    # Uncomment to generate the response text for testing.
-    # with open("new_id.txt", "w") as f:
-    #     f.write(response.text)
-    if response.status_code >= 300:
-        raise Exception(response.text)
-    response_json = json.loads(response.text)
+    response_json = await liquipedia_get_json(request)
 
     pages = response_json["query"]["pages"]
     if len(pages) != 1:
@@ -32,32 +131,131 @@ def _get_page_id_from_url(liquipedia_url: str) -> str:
         )
 
     # Just pull out the only key, which is the pageid.
-    return random.choice(list(pages.keys()))
+    pageid = random.choice(list(pages.keys()))
+    # Missing pages come back with a negative pageid, which is never cached.
+    if not pageid.startswith("-"):
+        await run_in_worker(PageIdCache.singleton().put, liquipedia_page_title, pageid)
+    return pageid
 
 
-def _get_content_api_url_from_liqui_url(liquipedia_url: str) -> str:
-    pageid = _get_page_id_from_url(liquipedia_url)
+def _get_content_api_url(pageid: str) -> str:
     return f"https://liquipedia.net/rocketleague/api.php?action=parse&format=json&pageid={pageid}"
 
 
-def get_page_html_from_url(liquipedia_url: str) -> str:
+async def _get_page_version(pageid: str) -> Optional[PageVersion]:
+    """
+    Cheap probe for a page's (revid, touched), without its content. touched also moves
+    when a template the page uses is edited, which changes the html but not the revid.
+    """
+    request = f"https://liquipedia.net/rocketleague/api.php?action=query&format=json&prop=info&pageids={pageid}"
+    response_json = await liquipedia_get_json(request)
+    page = response_json["query"]["pages"].get(pageid, {})
+    if "lastrevid" not in page or "touched" not in page:
+        return None
+    # Like 2026-10-17T12:00:00Z, kept as the number 20261017120000.
+    return page["lastrevid"], int(re.sub(r"\D", "", page["touched"]))
+
+
+async def load_page_html(liquipedia_url: str) -> str:
     """Accepts a liquipedia_url and returns the html for that page."""
-    request = _get_content_api_url_from_liqui_url(liquipedia_url)
-    response = requests.get(request, headers=headers)
-    #Uncomment to generate the response text for testing.
-    # with open("new_content.txt", "w") as f:
-    #     f.write(response.text)
-    if response.status_code >= 300:
-        raise Exception(response.text)
-    response_json = json.loads(response.text)
+    pageid = await _get_page_id_from_url(liquipedia_url)
+
+    # Probed before fetching, so an edit made mid fetch is caught on the next load.
+    version = None
+    try:
+        version = await _get_page_version(pageid)
+    except RateLimitExceeded:
+        raise
+    except Exception:
+        # A failed probe just means a full fetch.
+        pass
+
+    # Reuse the html we already have if the page hasn't been edited or re-rendered since.
+    cached_page = await run_in_worker(PageContentCache.singleton().get, pageid)
+    if version is not None and cached_page is not None and cached_page[0] == version:
+        return cached_page[1]
+
+    response_json = await liquipedia_get_json(_get_content_api_url(pageid))
+    if response_json.get("error", {}).get("code") in MISSING_PAGE_ERRORS:
+        # The cached pageid went stale (page deleted or recreated), look it up again.
+        PageIdCache.singleton().invalidate(_get_page_title_from_url(liquipedia_url))
+        PageContentCache.singleton().invalidate(pageid)
+        pageid = await _get_page_id_from_url(liquipedia_url, use_cache=False)
+        response_json = await liquipedia_get_json(_get_content_api_url(pageid))
+        version = None
 
     content = response_json["parse"]["text"]["*"]
     if content == None or len(content) == 0:
         raise Exception(f"Couldn't parse {liquipedia_url}.")
 
+    # Only pages whose version is known can be revalidated later.
+    if version is not None and response_json["parse"].get("revid") == version[0]:
+        await run_in_worker(PageContentCache.singleton().put, pageid, version, content)
     return content
 
 
+async def run_in_worker(fn: Callable[..., T], *args: Any) -> T:
+    """Runs blocking fetch or parse work on the liqui worker pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_workers, functools.partial(fn, *args))
+
+
+def _page_key(liquipedia_url: str) -> str:
+    try:
+        return normalize_page_title(_get_page_title_from_url(liquipedia_url))
+    except IndexError:
+        return liquipedia_url
+
+
+async def fetch_page_html(liquipedia_url: str) -> str:
+    """load_page_html(), where concurrent fetches of the same page share one fetch."""
+    key = _page_key(liquipedia_url)
+    in_flight = _in_flight.get(key)
+    if in_flight is not None:
+        start = time.perf_counter()
+        try:
+            return await asyncio.shield(in_flight)
+        finally:
+            Instrumentation.singleton().record(
+                "liqui.fetch_coalesced", time.perf_counter() - start
+            )
+
+    future = asyncio.ensure_future(load_page_html(liquipedia_url))
+    _in_flight[key] = future
+    future.add_done_callback(lambda _: _in_flight.pop(key, None))
+    # Shielded, so one lookup being cancelled doesn't fail the others sharing the fetch.
+    return await asyncio.shield(future)
+
+
+async def fetch_page(
+    liquipedia_url: str,
+    sections: tuple[str, ...] = (),
+    features: str = "html.parser",
+) -> LiquipediaPage:
+    """
+    Fetches and parses a page with the `features` BeautifulSoup parser. Lookups of the
+    same page revision share one parsed LiquipediaPage, which is parsed on the liqui
+    worker pool along with the `sections` the lookup reads, so it only reads plain data
+    on the event loop.
+    """
+    html = await fetch_page_html(liquipedia_url)
+    key = _page_key(liquipedia_url)
+    page = _parsed_pages.get(key)
+    # A new revision has new html, which is parsed anew.
+    if page is None or page.html != html:
+        page = LiquipediaPage(html)
+        _parsed_pages[key] = page
+    _parsed_pages.move_to_end(key)
+    while len(_parsed_pages) > PARSED_PAGES:
+        _parsed_pages.popitem(last=False)
+    page = page.parsed_with(features)
+
+    # Concurrent lookups wait on the first parse rather than parsing again.
+    await run_in_worker(lambda: page.soup)
+    await run_in_worker(page.extract, sections)
+    return page
+
+
 def string_to_base64(in_string: str) -> str:
     b64_str = base64.b64encode(in_string.encode("utf-8")).decode("utf-8")
     return urlescape(b64_str, safe='')
@@ -0,0 +1,340 @@
+from dataclasses import dataclass
+from datetime import datetime
+from functools import cached_property
+import re
+import threading
+import time
+from typing import Iterable, Optional
+
+from bs4 import BeautifulSoup
+import pytz
+
+from instrumentation import Instrumentation
+
+
+@dataclass
+class TeamCard:
+    name: str
+    link: str
+    # Main roster, in teamcard order.
+    players: list[str]
+
+
+@dataclass
+class BracketMatch:
+    team1: str
+    team2: str
+    team1_score: str
+    team2_score: str
+    start_time: datetime
+    is_finished: bool
+
+
+@dataclass
+class SwissResult:
+    # swisstable-bgc-win, swisstable-bgc-lose or swisstable-bgc- for unplayed.
+    outcome: str
+    score: str
+    opponent: Optional[str]
+
+
+@dataclass
+class SwissRow:
+    placement: str
+    team: str
+    link: Optional[str]
+    record: str
+    results: list[SwissResult]
+
+
+@dataclass
+class GroupRow:
+    team: str
+    link: str
+    match_record: str
+    game_diff: str
+
+
+@dataclass
+class GroupTable:
+    name: str
+    rows: list[GroupRow]
+
+
+@dataclass
+class PrizeRow:
+    # Tied placements (like 3rd-4th) repeat the place, prize and points of the row above.
+    place: Optional[str]
+    prize: Optional[str]
+    points: Optional[str]
+    team: str
+
+
+def _absolute_link(href: str) -> str:
+    if "https://liquipedia.net" not in href:
+        return "https://liquipedia.net" + href
+    return href
+
+
+def _datetime_from_liqui_timestring(liqui_timestring: str, timezone: str) -> datetime:
+    """Returns a UTC datetime off of the time string from liquipedia."""
+    # Clean timezone offset.
+    tz = timezone.replace(":", "")
+    if len(tz) == 4:
+        # Add a padding 0 to the first digit, after the +/-.
+        tz = tz[0] + "0" + tz[1:]
+
+    # Liqui format example: March 26, 2022 - 13:15
+    local_datetime = datetime.strptime(liqui_timestring + tz, "%B %d, %Y - %H:%M%z")
+    return local_datetime.astimezone(pytz.timezone("Etc/UTC"))
+
+
+class LiquipediaPage(object):
+    """
+    One revision of a Liquipedia page, parsed once and shared by every lookup of it.
+    Each section is extracted the first time it's read, so a lookup only pays for the
+    sections it uses and a page missing one section still serves the others.
+    """
+
+    def __init__(self, html: str, features: str = "html.parser") -> None:
+        self.html = html
+        # BeautifulSoup parser, parsers repair broken html differently.
+        self.features = features
+        self._soup: Optional[BeautifulSoup] = None
+        self._parsed_with: dict[str, "LiquipediaPage"] = {}
+        self._lock = threading.Lock()
+
+    def parsed_with(self, features: str) -> "LiquipediaPage":
+        """This page parsed by another parser, with its own sections. Shared by every caller."""
+        if features == self.features:
+            return self
+        with self._lock:
+            page = self._parsed_with.get(features)
+            if page is None:
+                page = LiquipediaPage(self.html, features)
+                self._parsed_with[features] = page
+            return page
+
+    def extract(self, sections: Iterable[str]) -> None:
+        """
+        Reads `sections` (like "matches") so they're cached. Called on the liqui worker pool,
+        since the selects behind a section take as long as a fraction of the parse. A section
+        that fails is left to raise where the lookup reads it.
+        """
+        for section in sections:
+            try:
+                getattr(self, section)
+            except Exception:
+                pass
+
+    @property
+    def soup(self) -> BeautifulSoup:
+        """The parsed page. The first read parses it, which takes seconds on large pages."""
+        with self._lock:
+            if self._soup is None:
+                start = time.perf_counter()
+                self._soup = BeautifulSoup(self.html, self.features)
+                Instrumentation.singleton().record(
+                    "liqui.parse", time.perf_counter() - start
+                )
+            return self._soup
+
+    @cached_property
+    def teams(self) -> list[TeamCard]:
+        teams = []
+        for team in self.soup.select("div.teamcard"):
+            try:
+                team_element = team.select("b a")[0]
+            except IndexError:
+                # New liquipedia roster have different xpath.
+                team_element = team.select("center > a")[0]
+            players = team.select(
+                ".teamcard-inner table[data-toggle-area-content='1'] td > a"
+            )
+            teams.append(
+                TeamCard(
+                    team_element.text,
+                    _absolute_link(team_element.attrs["href"]),
+                    [p.text for p in players],
+                )
+            )
+        return teams
+
+    @cached_property
+    def rosters(self) -> dict[str, list[str]]:
+        """Team name to everyone listed on its teamcard, substitutes included."""
+        rosters: dict[str, list[str]] = {}
+        for teams_box in self.soup.select("div[class^=teamcard-columns]"):
+            for team in teams_box.select("div.template-box"):
+                team_name = team.select("center > a")[0].text
+                for player_table in team.select("div.teamcard-inner > table"):
+                    players = []
+                    for player in player_table.select("td"):
+                        player_name = player.text.strip()
+
+                        # Filter out bad liqui data
+                        bad_rows = ["DNP", "Ranking", "Substitutes", "Main Roster"]
+                        if any(bad_row in player_name for bad_row in bad_rows):
+                            continue
+                        if player_name == "":
+                            continue
+
+                        players.append(player_name)
+                    rosters.setdefault(team_name, []).extend(players)
+        return rosters
+
+    @cached_property
+    def matches(self) -> list[BracketMatch]:
+        """Every bracket match, in page order."""
+        matches = []
+        for match in self.soup.select(".brkts-round-center"):
+            timer = match.select(".timer-object")[0]
+            is_finished = timer.attrs.get("data-finished") is not None
+
+            # Strip out timezone info from timer, use data-tz instead (more standard).
+            timezone = timer.select("abbr")[0].attrs["data-tz"]
+            timezone_str = timer.select("abbr")[0].text
+            liqui_timestring = timer.text.replace(timezone_str, "").strip()
+            start_time = _datetime_from_liqui_timestring(liqui_timestring, timezone)
+
+            # Fetch team names and scores.
+            teams = match.select(".brkts-opponent-entry")
+            names = ["TBD", "TBD"]
+            scores = ["", ""]
+            for i, team in enumerate(teams[:2]):
+                try:
+                    names[i] = team.select(".name")[0].text
+                    scores[i] = team.select(".brkts-opponent-score-inner")[0].text
+                except IndexError:
+                    pass
+
+            matches.append(
+                BracketMatch(
+                    names[0], names[1], scores[0], scores[1], start_time, is_finished
+                )
+            )
+        return matches
+
+    @cached_property
+    def rounds(self) -> list[str]:
+        """Bracket round names, like 'Upper Bracket Quarter-Finals'."""
+        round_elements = self.soup.select(".brkts-header.brkts-header-div")
+        return [r.select(".brkts-header-option")[0].text for r in round_elements]
+
+    @cached_property
+    def team_acronyms(self) -> dict[str, str]:
+        """Lowercase team name (without year) to the acronym matchlists show for it."""
+        acronyms = {}
+        for team in self.soup.select(
+            "div.brkts-matchlist-cell.brkts-matchlist-opponent"
+        ):
+            raw_team_name = team.get("aria-label")
+            if raw_team_name is None:
+                continue
+
+            # Strip years (YYYY) from aria-label.
+            team_name = re.sub(r"\s[\d]{4}", "", str(raw_team_name)).lower()
+            acronyms[team_name] = team.text
+        return acronyms
+
+    @cached_property
+    def swiss_tables(self) -> list[list[SwissRow]]:
+        tables = []
+        for table in self.soup.select("table.swisstable"):
+            rows = []
+            for row in table.select("tr")[1:]:
+                team_link = row.select("span.team-template-text a")
+                results = []
+                for result in row.select('td[class^="swisstable-bgc"]'):
+                    opponent = result.select('span[class^="team-template"] a')
+                    results.append(
+                        SwissResult(
+                            result["class"][0],
+                            result.text,
+                            opponent[0]["title"] if opponent else None,
+                        )
+                    )
+                rows.append(
+                    SwissRow(
+                        row.select("th")[0].text,
+                        row.select("span.team-template-text")[0].text,
+                        _absolute_link(team_link[0]["href"]) if team_link else None,
+                        row.select("b")[0].text,
+                        results,
+                    )
+                )
+            tables.append(rows)
+        return tables
+
+    @cached_property
+    def group_tables(self) -> list[GroupTable]:
+        tables = []
+        for table in self.soup.select("table.grouptable"):
+            rows = []
+            for row in table.select("tr:nth-child(n+2)"):
+                cells = row.select("td")
+                rows.append(
+                    GroupRow(
+                        cells[0].text.strip(),
+                        _absolute_link(
+                            cells[0].select(".team-template-text a")[0].attrs["href"]
+                        ),
+                        cells[1].text,
+                        cells[3].text,
+                    )
+                )
+            name = table.select("tr:nth-child(1) th span")[0].text
+            tables.append(GroupTable(name, rows))
+        return tables
+
+    @cached_property
+    def prize_rows(self) -> list[PrizeRow]:
+        # Get all rows of prizepool table, ignore the first row which contains table headers.
+        try:
+            team_rows = self.soup.select("div.prizepooltable")[0].select(
+                ".csstable-widget-row:not(:first-child)"
+            )
+        except IndexError:
+            team_rows = self.soup.select("table.prizepooltable")[0].select(
+                "tr:not(:first-child)"
+            )
+
+        # This part is actually a bit complex because liqui uses tricky CSS to create two 3rd-4th places in tourneys where there is no difference between 3rd and 4th place.
+        # In tourneys where 3rd and 4th place are equivalent, we need to keep track of the prize & point total from 3rd place because it's missing from 4th place.
+        rows = []
+        place = prize = points = None
+        for team_row in team_rows:
+            cells = team_row.select(".csstable-widget-cell")
+            if not cells:
+                continue
+            # Partially down the prizepool, there's a row "expand" that just houses a toggle for the UI,
+            classes = cells[0].get("class") or []
+            if (
+                "prizepooltabletoggle" in classes
+                or "general-collapsible-expand-button" in classes
+            ):
+                continue
+            if len(cells) == 4:
+                # If this is a complete row, write down the new prize and points.
+                place = cells[0].text.replace(" ", "").strip()
+                prize = cells[1].text.strip()
+                points = cells[2].text.strip()
+                team = cells[3].text.strip()
+            else:
+                # If this is a followup row, use prize and points from previous row.
+                team = cells[0].text.strip()
+            rows.append(PrizeRow(place, prize, points, team))
+        return rows
+
+    @cached_property
+    def prize_teams(self) -> list[str]:
+        """Team names in prizepool order, including TBD placements."""
+        prizepool = self.soup.select("table.prizepooltable:not(.collapsed)")
+
+        # Liqui can render the prizepool as a div or table lol.
+        if not prizepool:
+            prizepool = self.soup.select("div.general-collapsible.prizepooltable")
+            rows = prizepool[0].select("span.name")
+        else:
+            rows = prizepool[0].select("span[class^='team-template-team']")
+        return [row.text.strip() for row in rows]
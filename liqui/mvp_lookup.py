@@ -8,7 +8,6 @@ from googleapiclient.discovery import build
 from google.auth.transport.requests import Request
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.errors import HttpError
-from bs4 import BeautifulSoup
 import discord
 from global_settings import rleb_log_error
 
@@ -128,7 +127,7 @@ async def _get_eligible_candidates(
         await channel.send(
             "Loading mvp candidates from Python (this may take a few minutes)..."
         )
-        page = liqui_utils.get_page_html_from_url(liquipedia_url)
+        page = await liqui_utils.fetch_page(liquipedia_url, ("prize_teams", "rosters"))
     except Exception as e:
         await channel.send("Couldn't load {0}!\nError: {1}".format(liquipedia_url, e))
         global_settings.rleb_log_info(
@@ -137,52 +136,14 @@ async def _get_eligible_candidates(
         global_settings.rleb_log_error(traceback.format_exc())
         return None
 
-    html = BeautifulSoup(page, "html.parser")
-
-    mvp_candidates = {}
-
-    teams_boxes = html.select("div[class^=teamcard-columns]")
-    for teams_box in teams_boxes:
-        teams = teams_box.select("div.template-box")
-
-        # Create mapping of team_name to player name.
-        for team in teams:
-            team_name = team.select("center > a")[0].text
-            player_tables = team.select("div.teamcard-inner > table")
-            for player_table in player_tables:
-                players = player_table.select("td")
-                candidates = []
-                for i, player in enumerate(players):
-                    player_name = player.text.strip()
-
-                    # Filter out bad liqui data
-                    bad_rows = ["DNP", "Ranking", "Substitutes", "Main Roster"]
-                    if any(bad_row in player_name for bad_row in bad_rows):
-                        continue
-                    if player_name == "":
-                        continue
-
-                    candidates.append(f"{player_name} ({team_name})")
-                if team_name not in mvp_candidates:
-                    mvp_candidates[team_name] = []
-                mvp_candidates[team_name].extend(candidates)
-
     # Get all players on top teams.
     eligible_candidates = []
-    prizepool = html.select("table.prizepooltable:not(.collapsed)")
-
-    # Liqui can render the prizepool as a div or table lol.
-    if not prizepool or len(prizepool) == 0:
-        prizepool = html.select("div.general-collapsible.prizepooltable")
-        rows = prizepool[0].select("span.name")
-    else:
-        rows = prizepool[0].select("span[class^='team-template-team']")
-
-    for i in range(min(teams_allowed, len(rows))):
-        team_name = rows[i].text.strip()
+    for team_name in page.prize_teams[:teams_allowed]:
         if team_name == "TBD" or team_name == "":
             continue
-        eligible_candidates = eligible_candidates + mvp_candidates[team_name]
+        eligible_candidates.extend(
+            f"{player_name} ({team_name})" for player_name in page.rosters[team_name]
+        )
     return eligible_candidates
 
 
@@ -0,0 +1,75 @@
+from collections import OrderedDict
+import os
+import threading
+from typing import Optional
+
+from liqui.page_html_store import PageHtmlStore, PageVersion
+from liqui.page_id_cache import LIQUIPEDIA_CACHE_DIR
+
+# Pages whose html is kept for revalidation. The least recently used is dropped past this.
+PAGE_CONTENT_CACHE_PAGES = 64
+
+
+class PageContentCache(object):
+    """
+    Html of recently fetched Liquipedia pages, along with the version it was parsed from.
+    Backed by an optional `store` on disk, which pages evicted from memory or lost to a
+    restart are read back from.
+    """
+
+    _singleton = None
+
+    def __init__(
+        self,
+        max_pages: int = PAGE_CONTENT_CACHE_PAGES,
+        store: Optional[PageHtmlStore] = None,
+    ) -> None:
+        self._max_pages = max_pages
+        self._store = store
+        self._pages: OrderedDict[str, tuple[PageVersion, str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def singleton(cls) -> "PageContentCache":
+        if cls._singleton is None:
+            store = None
+            if LIQUIPEDIA_CACHE_DIR:
+                store = PageHtmlStore(os.path.join(LIQUIPEDIA_CACHE_DIR, "pages"))
+            cls._singleton = cls(store=store)
+        return cls._singleton
+
+    def get(self, pageid: str) -> Optional[tuple[PageVersion, str]]:
+        """Returns (version, html) of a page, if cached."""
+        with self._lock:
+            page = self._pages.get(pageid)
+            if page is not None:
+                self._pages.move_to_end(pageid)
+                return page
+        if self._store is None:
+            return None
+        page = self._store.get(pageid)
+        if page is not None:
+            self._put_in_memory(pageid, *page)
+        return page
+
+    def _put_in_memory(self, pageid: str, version: PageVersion, html: str) -> None:
+        with self._lock:
+            self._pages[pageid] = (version, html)
+            self._pages.move_to_end(pageid)
+            while len(self._pages) > self._max_pages:
+                self._pages.popitem(last=False)
+
+    def put(self, pageid: str, version: PageVersion, html: str) -> None:
+        self._put_in_memory(pageid, version, html)
+        if self._store is not None:
+            try:
+                self._store.put(pageid, version, html)
+            except OSError:
+                # The disk copy is only an optimization.
+                pass
+
+    def invalidate(self, pageid: str) -> None:
+        with self._lock:
+            self._pages.pop(pageid, None)
+        if self._store is not None:
+            self._store.invalidate(pageid)
@@ -0,0 +1,135 @@
+"""
+Compressed on-disk copies of fetched Liquipedia page html, so restarts don't refetch them.
+
+Each page is one gzip file named by its pageid, revid and touched time. A page's older
+versions are deleted when a newer one is stored. Entries unused for PAGE_HTML_STORE_TTL_SECONDS are
+expired, and the least recently used are deleted once the store passes
+PAGE_HTML_STORE_MAX_BYTES. Use is tracked through file mtimes, so it survives restarts.
+"""
+
+import gzip
+import os
+from pathlib import Path
+import threading
+import time
+from typing import Callable, Optional
+
+# Compressed bytes kept on disk. The least recently used pages are deleted past this.
+PAGE_HTML_STORE_MAX_BYTES = 256 * 1024 * 1024
+# Pages unused for this long are deleted.
+PAGE_HTML_STORE_TTL_SECONDS = 14 * 24 * 60 * 60
+
+SUFFIX = ".html.gz"
+
+# (revid, touched) of a page. touched also changes when a template the page uses is
+# edited, which re-renders the page without a new revid.
+PageVersion = tuple[int, int]
+
+
+class PageHtmlStore(object):
+    """Thread-safe gzip html files keyed by pageid and version, with a size cap and TTL."""
+
+    def __init__(
+        self,
+        directory: str,
+        max_bytes: int = PAGE_HTML_STORE_MAX_BYTES,
+        ttl_seconds: float = PAGE_HTML_STORE_TTL_SECONDS,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._directory = Path(directory)
+        self._max_bytes = max_bytes
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        # pageid to (version, compressed size, last used).
+        self._pages: dict[str, tuple[PageVersion, int, float]] = {}
+        self._directory.mkdir(parents=True, exist_ok=True)
+        for path in self._directory.glob(f"*{SUFFIX}"):
+            parts = path.name[: -len(SUFFIX)].split("-")
+            if len(parts) != 3 or not (parts[1].isdigit() and parts[2].isdigit()):
+                continue
+            pageid, version = parts[0], (int(parts[1]), int(parts[2]))
+            stat = path.stat()
+            known = self._pages.get(pageid)
+            if known is not None and known[0] > version:
+                self._delete(pageid, version)
+                continue
+            if known is not None:
+                self._delete(pageid, known[0])
+            self._pages[pageid] = (version, stat.st_size, stat.st_mtime)
+        with self._lock:
+            self._evict()
+
+    def _path(self, pageid: str, version: PageVersion) -> Path:
+        revid, touched = version
+        return self._directory / f"{pageid}-{revid}-{touched}{SUFFIX}"
+
+    def _delete(self, pageid: str, version: PageVersion) -> None:
+        try:
+            os.remove(self._path(pageid, version))
+        except FileNotFoundError:
+            pass
+
+    def _evict(self) -> None:
+        """Deletes expired pages, then the least recently used past the size cap."""
+        expire_before = self._clock() - self._ttl_seconds
+        pages = sorted(self._pages.items(), key=lambda page: page[1][2])
+        total_bytes = sum(size for _, (_, size, _) in pages)
+        for pageid, (version, size, used_at) in pages:
+            if used_at >= expire_before and total_bytes <= self._max_bytes:
+                break
+            self._delete(pageid, version)
+            del self._pages[pageid]
+            total_bytes -= size
+
+    def get(self, pageid: str) -> Optional[tuple[PageVersion, str]]:
+        """Returns (version, html) of the latest stored version of a page, if any."""
+        with self._lock:
+            page = self._pages.get(pageid)
+            if page is None:
+                return None
+            version, size, used_at = page
+            if used_at < self._clock() - self._ttl_seconds:
+                self._delete(pageid, version)
+                del self._pages[pageid]
+                return None
+            path = self._path(pageid, version)
+            try:
+                with gzip.open(path, "rt", encoding="utf-8") as f:
+                    html = f.read()
+                now = self._clock()
+                os.utime(path, (now, now))
+            except (OSError, EOFError):
+                # A missing or truncated file is just a miss.
+                self._delete(pageid, version)
+                del self._pages[pageid]
+                return None
+            self._pages[pageid] = (version, size, now)
+            return version, html
+
+    def put(self, pageid: str, version: PageVersion, html: str) -> None:
+        with self._lock:
+            known = self._pages.get(pageid)
+            if known is not None and known[0] > version:
+                return
+            path = self._path(pageid, version)
+            temp_path = path.with_name(path.name + ".tmp")
+            with gzip.open(temp_path, "wt", encoding="utf-8") as f:
+                f.write(html)
+            now = self._clock()
+            os.utime(temp_path, (now, now))
+            os.replace(temp_path, path)
+            if known is not None and known[0] != version:
+                self._delete(pageid, known[0])
+            self._pages[pageid] = (version, path.stat().st_size, now)
+            self._evict()
+
+    def invalidate(self, pageid: str) -> None:
+        with self._lock:
+            page = self._pages.pop(pageid, None)
+            if page is not None:
+                self._delete(pageid, page[0])
+
+    def size_bytes(self) -> int:
+        with self._lock:
+            return sum(size for _, size, _ in self._pages.values())
@@ -0,0 +1,74 @@
+import json
+import os
+from pathlib import Path
+import threading
+from typing import Optional
+from urllib.parse import unquote
+
+from data_bridge import config
+
+# Directory for Liquipedia caches that survive restarts. Unset keeps them in memory only.
+LIQUIPEDIA_CACHE_DIR = os.environ.get("LIQUIPEDIA_CACHE_DIR") or config.get(
+    "General", "LIQUIPEDIA_CACHE_DIR", fallback=None
+)
+
+PAGE_ID_CACHE_FILE = "page_ids.json"
+
+
+def normalize_page_title(title: str) -> str:
+    """Canonical form of a Liquipedia page title, so equivalent urls share a cache entry."""
+    title = unquote(title).split("#")[0].split("?")[0].strip().strip("/")
+    title = title.replace(" ", "_")
+    # MediaWiki titles are case-sensitive except for the first letter.
+    return title[:1].upper() + title[1:]
+
+
+class PageIdCache(object):
+    """Liquipedia page title to pageid. Pageids of a title never change unless the page is deleted."""
+
+    _singleton = None
+
+    def __init__(self, directory: Optional[str] = None) -> None:
+        self._path = Path(directory) / PAGE_ID_CACHE_FILE if directory else None
+        self._lock = threading.Lock()
+        self._page_ids: dict[str, str] = {}
+        if self._path is not None:
+            try:
+                with open(self._path, encoding="utf-8") as f:
+                    self._page_ids = json.load(f)
+            except (FileNotFoundError, ValueError):
+                # A missing or corrupt cache is just a cold cache.
+                pass
+
+    @classmethod
+    def singleton(cls) -> "PageIdCache":
+        if cls._singleton is None:
+            cls._singleton = cls(LIQUIPEDIA_CACHE_DIR)
+        return cls._singleton
+
+    def get(self, title: str) -> Optional[str]:
+        with self._lock:
+            return self._page_ids.get(normalize_page_title(title))
+
+    def put(self, title: str, page_id: str) -> None:
+        title = normalize_page_title(title)
+        with self._lock:
+            if self._page_ids.get(title) == page_id:
+                return
+            self._page_ids[title] = page_id
+            self._save()
+
+    def invalidate(self, title: str) -> None:
+        """Forgets a title's pageid, when Liquipedia says the page no longer exists."""
+        with self._lock:
+            if self._page_ids.pop(normalize_page_title(title), None) is not None:
+                self._save()
+
+    def _save(self) -> None:
+        if self._path is None:
+            return
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self._path.with_name(self._path.name + ".tmp")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(self._page_ids, f)
+        os.replace(temp_path, self._path)
@@ -0,0 +1,91 @@
+import asyncio
+import threading
+import time
+from typing import Awaitable, Callable, Optional
+
+from instrumentation import Instrumentation
+
+
+class RateLimitExceeded(Exception):
+    """Raised instead of waiting when too many callers are already queued on a budget."""
+
+
+class TokenBucket(object):
+    """Token bucket holding up to `capacity` requests, refilling one every `refill_seconds`.
+
+    Callers reserve a token up front, so waiters are served in the order they arrived.
+    Waits are awaited on the event loop, so they never hold a worker thread and are
+    cancellable. At most `max_waiting` callers wait at once. Each acquire() records its
+    wait as `liqui.rate_limit.<name>`, and the number of callers waiting as the
+    `liqui.rate_limit.<name>.queue_depth` gauge.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        capacity: int,
+        refill_seconds: float,
+        max_waiting: int = 10,
+        instrumentation: Optional[Instrumentation] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> None:
+        self._name = name
+        self._capacity = capacity
+        self._refill_seconds = refill_seconds
+        self._max_waiting = max_waiting
+        self._instrumentation = instrumentation
+        self._clock = clock
+        self._sleep = sleep
+        # Buckets are shared by every event loop and thread in the process.
+        self._lock = threading.Lock()
+        # Goes negative once tokens are reserved by waiting callers.
+        self._tokens = float(capacity)
+        self._updated_at = clock()
+        self._waiting = 0
+
+    def _record_queue_depth(self) -> None:
+        (self._instrumentation or Instrumentation.singleton()).gauge(
+            f"liqui.rate_limit.{self._name}.queue_depth", self._waiting
+        )
+
+    def _reserve(self) -> float:
+        """Reserves a token and returns the seconds until it may be used."""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(
+                self._capacity,
+                self._tokens + (now - self._updated_at) / self._refill_seconds,
+            )
+            self._updated_at = now
+            wait = max(0.0, (1 - self._tokens) * self._refill_seconds)
+            if wait:
+                if self._waiting >= self._max_waiting:
+                    raise RateLimitExceeded(
+                        f"{self._waiting} Liquipedia {self._name} requests are already "
+                        "queued, try again in a minute."
+                    )
+                self._waiting += 1
+                self._record_queue_depth()
+            self._tokens -= 1
+            return wait
+
+    async def acquire(self) -> float:
+        """Waits until the caller may make a request. Returns the seconds waited."""
+        wait = self._reserve()
+        if wait:
+            try:
+                await self._sleep(wait)
+            except asyncio.CancelledError:
+                # Hand the token back, later waiters just keep their reserved times.
+                with self._lock:
+                    self._tokens += 1
+                raise
+            finally:
+                with self._lock:
+                    self._waiting -= 1
+                    self._record_queue_depth()
+        (self._instrumentation or Instrumentation.singleton()).record(
+            f"liqui.rate_limit.{self._name}", wait
+        )
+        return wait
@@ -1,5 +1,3 @@
-from bs4 import BeautifulSoup
-import re
 import traceback
 import discord
 
@@ -30,9 +28,13 @@ async def handle_swiss_lookup(url, channel: discord.channel.TextChannel):
     # If Diesel fails, fallback to RLEB, python parsing.
     try:
         await channel.send("Building swiss table from Python...")
-        content = None
+        page = None
         try:
-            content = liqui_utils.get_page_html_from_url(url)
+            # Swiss tables have always been read through lxml, which repairs liqui's
+            # markup differently than html.parser.
+            page = await liqui_utils.fetch_page(
+                url, ("team_acronyms", "swiss_tables"), features="lxml"
+            )
         except Exception as e:
             await channel.send("Couldn't load {0} !\nError: {1}".format(url, e))
             global_settings.rleb_log_info(
@@ -41,8 +43,6 @@ async def handle_swiss_lookup(url, channel: discord.channel.TextChannel):
             global_settings.rleb_log_error(traceback.format_exc())
             return
 
-        html = BeautifulSoup(content)
-
         # The indicator that each cell in the swiss table starts with.
         indicator = {
             "swisstable-bgc-win": "✔️",
@@ -51,21 +51,7 @@ async def handle_swiss_lookup(url, channel: discord.channel.TextChannel):
         }
 
         # Mapping from team name to team acronym.
-        acronym_map = {}
-
-        # Find all cells that mention both team name and acronym.
-        teams = html.select("div.brkts-matchlist-cell.brkts-matchlist-opponent")
-        for t in teams:
-            raw_team_name = t.get("aria-label")
-            if raw_team_name is None:
-                continue
-
-            # Strip years (YYYY) from aria-label.
-            team_name = re.sub(r"\s[\d]{4}", "", raw_team_name).lower()
-            team_acronym = t.text
-
-            # Add to mapping.
-            acronym_map[team_name] = team_acronym
+        acronym_map = page.team_acronyms
 
         def name_to_acronym(full_team_name):
             """Takes a team name and returns it's acroynm. If the acronym isn't found, returns the full name."""
@@ -75,32 +61,28 @@ async def handle_swiss_lookup(url, channel: discord.channel.TextChannel):
             )
 
         tables = []
-        for s in html.select("table.swisstable"):
+        for s in page.swiss_tables:
             rows = []
             rows.append(
                 "|**#**|**Teams**|**W-L**|**Round 1**|**Round 2**|**Round 3**|**Round 4**|**Round 5**|"
             )
             rows.append("|:-|:-|:-|:-|:-|:-|:-|:-|")
-            for t in s.select("tr")[1:]:
+            for t in s:
                 row = []
-                row.append(t.select("th")[0].text.replace(".", " "))
-                team_name = name_to_acronym(t.select("span.team-template-text")[0].text)
-                team_link = t.select("span.team-template-text a")
-                if team_link is None or len(team_link) == 0:
+                row.append(t.placement.replace(".", " "))
+                team_name = name_to_acronym(t.team)
+                if t.link is None:
                     team_markdown = "**" + team_name + "**"
                 else:
-                    href = team_link[0]["href"].replace("(", "\(").replace(")", "\)")
-                    if "https://liquipedia.net" not in href:
-                        href = "https://liquipedia.net" + href
+                    href = t.link.replace("(", "\(").replace(")", "\)")
                     team_markdown = "[**" + team_name + "**](" + href + ")"
                 row.append(team_markdown)
-                row.append("**" + t.select("b")[0].text + "**")
-                for m in t.select('td[class^="swisstable-bgc"]'):
-                    match = indicator[m["class"][0]]
-                    match += " " + m.text.replace(":", "-")
-                    other_team = m.select('span[class^="team-template"] a')
-                    if len(other_team) > 0:
-                        match += " " + name_to_acronym(other_team[0]["title"])
+                row.append("**" + t.record + "**")
+                for m in t.results:
+                    match = indicator[m.outcome]
+                    match += " " + m.score.replace(":", "-")
+                    if m.opponent is not None:
+                        match += " " + name_to_acronym(m.opponent)
                     row.append(match)
                 rows.append("|".join(row))
             rows.insert(int(len(rows) / 2) + 1, "|\-|\- - - - -|\- - -||||||")
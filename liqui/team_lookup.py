@@ -1,4 +1,3 @@
-from bs4 import BeautifulSoup
 import requests
 import time
 import traceback
@@ -24,7 +23,7 @@ async def handle_team_lookup(url, channel):
     try:
         page = None
         try:
-            page = liqui_utils.get_page_html_from_url(url)
+            page = await liqui_utils.fetch_page(url, ("teams",))
         except Exception as e:
             await channel.send("Couldn't load {0}!\nError: {1}".format(url, e))
             global_settings.rleb_log_info(
@@ -33,35 +32,17 @@ async def handle_team_lookup(url, channel):
             global_settings.rleb_log_error(traceback.format_exc())
             return
 
-        html = BeautifulSoup(page, "html.parser")
-
         # The reddit markdown table to return.
         table = "|Team|\n:--|\n"
 
         # Iterate each team.
-        for team in html.select("div.teamcard"):
-            try:
-                team_element = team.select("b a")[0]
-            except:
-                # New liquipedia roster have different xpath.
-                team_element = team.select("center > a")[0]
-            team_name = (
-                team_element.text.replace("(", "").replace(")", "")
-                if team_element
-                else "TBD"
-            )
-            href = team_element.attrs["href"].replace("(", "\(").replace(")", "\)")
-            if "https://liquipedia.net" not in href:
-                href = "https://liquipedia.net" + href
-            team_link = href if team_element and href else "#"
-            players = []
+        for team in page.teams:
+            team_name = team.name.replace("(", "").replace(")", "") or "TBD"
+            href = team.link.replace("(", "\(").replace(")", "\)")
+            team_link = href if href else "#"
 
-            # Iterate each player on the team.
-            player_list = team.select(".teamcard-inner table[data-toggle-area-content='1'] td > a")
-            for p in player_list:
-                players.append(p.text.replace("_", "-"))
-                if len(players) >= 3:
-                    break
+            # Take the first 3 players on the team.
+            players = [p.replace("_", "-") for p in team.players[:3]]
 
             # If 3 players aren't found, leave the team as unknown.
             players = players if len(players) == 3 else ["?", "?", "?"]
@@ -0,0 +1,265 @@
+"""
+Local, db-independent log history.
+
+Logs are appended to a plain active file. Once it passes LOG_ARCHIVE_SEGMENT_BYTES it is
+rotated into a gzip segment written as one gzip member per LOG_ARCHIVE_BLOCK_LINES logs,
+next to a sparse index of each block's first log time and byte offset. Reads binary
+search the segments and their blocks by time and only decompress from the first block
+that can hold a match.
+
+Set LOG_ARCHIVE_DIR to enable it.
+"""
+
+from bisect import bisect_left, bisect_right
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime
+import gzip
+import json
+import os
+from pathlib import Path
+import threading
+from typing import BinaryIO, Iterator, Optional
+
+from data_bridge import config
+
+LOG_ARCHIVE_DIR = os.environ.get("LOG_ARCHIVE_DIR") or config.get(
+    "General", "LOG_ARCHIVE_DIR", fallback=None
+)
+# Uncompressed size at which the active file is rotated into a segment.
+LOG_ARCHIVE_SEGMENT_BYTES = 8 * 1024 * 1024
+# Logs per gzip member, which is also the granularity of the time index.
+LOG_ARCHIVE_BLOCK_LINES = 500
+# Segments kept. The oldest is deleted past this.
+LOG_ARCHIVE_MAX_SEGMENTS = 200
+
+ACTIVE_FILE = "active.log"
+
+
+def _format_log(log_time: datetime, message: str) -> str:
+    return f"{log_time.isoformat()}\t{json.dumps(message, ensure_ascii=False)}\n"
+
+
+def _parse_log(line: str) -> tuple[datetime, str]:
+    time_text, _, message = line.rstrip("\n").partition("\t")
+    return datetime.fromisoformat(time_text), json.loads(message)
+
+
+@dataclass
+class _Segment:
+    path: Path
+    # First log time and byte offset of each gzip member, in order.
+    block_times: list[datetime]
+    block_offsets: list[int]
+    last_time: datetime
+
+    @property
+    def first_time(self) -> datetime:
+        return self.block_times[0]
+
+
+class LogArchive(object):
+    """Size-rotated, gzip-compressed log segments with a sparse time index.
+
+    Logs are expected roughly in time order, as the log shipper hands them over.
+    """
+
+    _singleton = None
+
+    def __init__(
+        self,
+        directory: str,
+        segment_bytes: int = LOG_ARCHIVE_SEGMENT_BYTES,
+        block_lines: int = LOG_ARCHIVE_BLOCK_LINES,
+        max_segments: int = LOG_ARCHIVE_MAX_SEGMENTS,
+    ) -> None:
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._active = self._directory / ACTIVE_FILE
+        self._segment_bytes = segment_bytes
+        self._block_lines = block_lines
+        self._max_segments = max_segments
+        self._lock = threading.Lock()
+        self._segments = [
+            self._load_segment(path)
+            for path in sorted(self._directory.glob("segment-*.log.gz"))
+        ]
+
+    @classmethod
+    def singleton(cls) -> Optional["LogArchive"]:
+        """The archive in LOG_ARCHIVE_DIR, or None when archiving is off."""
+        if cls._singleton is None and LOG_ARCHIVE_DIR:
+            cls._singleton = cls(LOG_ARCHIVE_DIR)
+        return cls._singleton
+
+    @staticmethod
+    def _index_path(segment_path: Path) -> Path:
+        return segment_path.with_name(segment_path.name.replace(".log.gz", ".idx"))
+
+    def _load_segment(self, path: Path) -> _Segment:
+        """Reads a segment's index. The last index line holds the last log time and file size."""
+        with open(self._index_path(path)) as index:
+            entries = [line.rstrip("\n").split("\t") for line in index if line.strip()]
+        return _Segment(
+            path,
+            [datetime.fromisoformat(time_text) for time_text, _ in entries[:-1]],
+            [int(offset) for _, offset in entries[:-1]],
+            datetime.fromisoformat(entries[-1][0]),
+        )
+
+    def append(self, logs: list[tuple[datetime, str]]) -> None:
+        if not logs:
+            return
+        with self._lock:
+            with open(self._active, "a", encoding="utf-8") as active:
+                active.writelines(_format_log(*log) for log in logs)
+            if self._active.stat().st_size >= self._segment_bytes:
+                self._rotate()
+
+    def rotate(self) -> None:
+        """Compresses the active file into a new segment, even if it isn't full."""
+        with self._lock:
+            self._rotate()
+
+    def _rotate(self) -> None:
+        if not self._active.exists() or self._active.stat().st_size == 0:
+            return
+        with open(self._active, encoding="utf-8") as active:
+            lines = active.readlines()
+        number = int(self._segments[-1].path.name[8:14]) + 1 if self._segments else 1
+        path = self._directory / f"segment-{number:06d}.log.gz"
+
+        block_times: list[datetime] = []
+        block_offsets: list[int] = []
+        offset = 0
+        temp_path = path.with_name(path.name + ".tmp")
+        with open(temp_path, "wb") as segment:
+            for start in range(0, len(lines), self._block_lines):
+                block = lines[start : start + self._block_lines]
+                block_times.append(_parse_log(block[0])[0])
+                block_offsets.append(offset)
+                compressed = gzip.compress("".join(block).encode("utf-8"))
+                segment.write(compressed)
+                offset += len(compressed)
+        last_time = _parse_log(lines[-1])[0]
+
+        index_lines = [
+            f"{block_time.isoformat()}\t{block_offset}\n"
+            for block_time, block_offset in zip(block_times, block_offsets)
+        ]
+        index_lines.append(f"{last_time.isoformat()}\t{offset}\n")
+        with open(self._index_path(path), "w") as index:
+            index.writelines(index_lines)
+        # The segment only becomes visible once its index exists.
+        os.replace(temp_path, path)
+        self._active.unlink()
+        self._segments.append(_Segment(path, block_times, block_offsets, last_time))
+
+        while len(self._segments) > self._max_segments:
+            oldest = self._segments.pop(0)
+            oldest.path.unlink(missing_ok=True)
+            self._index_path(oldest.path).unlink(missing_ok=True)
+
+    def oldest_time(self) -> Optional[datetime]:
+        """Time of the oldest archived log. Anything older is only in the db."""
+        with self._lock:
+            if self._segments:
+                return self._segments[0].first_time
+            for log_time, _ in self._read_active():
+                return log_time
+        return None
+
+    def _read_active(self) -> Iterator[tuple[datetime, str]]:
+        return self._read_snapshot(self._snapshot_active())
+
+    def _snapshot_active(self) -> Optional[tuple[BinaryIO, int]]:
+        """
+        Opens the active file and notes its size. Called under the lock, so the snapshot
+        can be read after it's released: logs appended later are past the noted size, and
+        an open file stays readable after rotation unlinks it.
+        """
+        try:
+            active = open(self._active, "rb")
+        except FileNotFoundError:
+            return None
+        return active, os.fstat(active.fileno()).st_size
+
+    def _read_snapshot(
+        self, snapshot: Optional[tuple[BinaryIO, int]]
+    ) -> Iterator[tuple[datetime, str]]:
+        if snapshot is None:
+            return
+        active, size = snapshot
+        with active:
+            for line in active:
+                size -= len(line)
+                # A partial last line means the bot died (or is) mid-write.
+                if size < 0 or not line.endswith(b"\n"):
+                    return
+                yield _parse_log(line.decode("utf-8"))
+
+    def _read_segment(
+        self, segment: _Segment, start: Optional[datetime]
+    ) -> Iterator[tuple[datetime, str]]:
+        """Streams a segment's logs, starting at the first block that can hold `start`."""
+        block = 0
+        if start is not None:
+            block = max(0, bisect_right(segment.block_times, start) - 1)
+        try:
+            raw = open(segment.path, "rb")
+        except FileNotFoundError:
+            # Dropped past LOG_ARCHIVE_MAX_SEGMENTS since the read started.
+            return
+        with raw:
+            raw.seek(segment.block_offsets[block])
+            # GzipFile reads consecutive members as one stream.
+            with gzip.open(raw, "rt", encoding="utf-8") as lines:
+                for line in lines:
+                    yield _parse_log(line)
+
+    def read(
+        self,
+        count: int = 10,
+        search_string: Optional[str] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> list[tuple[datetime, str]]:
+        """
+        Returns the newest `count` logs in [start, end) containing `search_string` (case-insensitive),
+        oldest first. Blocks on file reads, so call it off the event loop.
+
+        Only the segment list and the active file's size are read under the lock. Segments
+        are never modified once written, so appends and rotations carry on while the files
+        are decompressed.
+        """
+        query = search_string.lower() if search_string is not None else None
+        with self._lock:
+            segments = list(self._segments)
+            active = self._snapshot_active()
+        # Any segment ending before `start` or beginning at/after `end` is skipped.
+        first = 0
+        if start is not None:
+            first = bisect_left([s.last_time for s in segments], start)
+        stop = len(segments)
+        if end is not None:
+            stop = bisect_left([s.first_time for s in segments], end)
+        sources = [self._read_snapshot(active)] + [
+            self._read_segment(segment, start)
+            for segment in reversed(segments[first:stop])
+        ]
+
+        logs: list[tuple[datetime, str]] = []
+        # Newest source first, keeping only the newest matches of each.
+        for source in sources:
+            matches: deque[tuple[datetime, str]] = deque(maxlen=count - len(logs))
+            for log_time, message in source:
+                if end is not None and log_time >= end:
+                    break
+                if start is not None and log_time < start:
+                    continue
+                if query is None or query in message.lower():
+                    matches.append((log_time, message))
+            logs = list(matches) + logs
+            if len(logs) >= count:
+                break
+        return logs
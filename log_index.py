@@ -0,0 +1,144 @@
+from collections import deque
+from datetime import datetime
+import re
+import threading
+from typing import Iterable, Optional
+
+# Most recent logs kept in memory for !logs and !logfind.
+LOG_INDEX_CAPACITY = 20_000
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9_]+")
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase words of `text`, in order."""
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+class LogIndex(object):
+    """Fixed-capacity ring of recent logs with an inverted index from token to log.
+
+    Every log gets an increasing sequence number and lives in slot seq % capacity.
+    Each token maps to the ascending sequence numbers of the logs containing it, so
+    evicting the oldest log only pops from the front of its tokens' postings.
+    """
+
+    _singleton = None
+
+    def __init__(self, capacity: int = LOG_INDEX_CAPACITY) -> None:
+        self._capacity = capacity
+        # (log_time, message, tokens) by slot, None until the ring first fills up.
+        self._slots: list[Optional[tuple[datetime, str, frozenset[str]]]] = [
+            None
+        ] * capacity
+        self._postings: dict[str, deque[int]] = {}
+        # Sequence number of the oldest live log and of the next log added.
+        self._first = 0
+        self._next = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def singleton(cls) -> "LogIndex":
+        if cls._singleton is None:
+            cls._singleton = cls()
+        return cls._singleton
+
+    def __len__(self) -> int:
+        return self._next - self._first
+
+    def add(self, log_time: datetime, message: str) -> None:
+        tokens = frozenset(tokenize(message))
+        with self._lock:
+            if self._next - self._first == self._capacity:
+                self._evict_oldest()
+            seq = self._next
+            self._slots[seq % self._capacity] = (log_time, message, tokens)
+            for token in tokens:
+                postings = self._postings.get(token)
+                if postings is None:
+                    postings = self._postings[token] = deque()
+                postings.append(seq)
+            self._next += 1
+
+    def _evict_oldest(self) -> None:
+        slot = self._slots[self._first % self._capacity]
+        assert slot is not None
+        for token in slot[2]:
+            postings = self._postings[token]
+            postings.popleft()
+            if not postings:
+                del self._postings[token]
+        self._first += 1
+
+    def _log(self, seq: int) -> tuple[datetime, str]:
+        slot = self._slots[seq % self._capacity]
+        assert slot is not None
+        return slot[0], slot[1]
+
+    def oldest_time(self) -> Optional[datetime]:
+        """Time of the oldest log in memory. Older logs are only in the db."""
+        with self._lock:
+            if self._next == self._first:
+                return None
+            return self._log(self._first)[0]
+
+    def latest(self, count: int) -> list[tuple[datetime, str]]:
+        """Returns the newest `count` logs, oldest first."""
+        with self._lock:
+            start = max(self._first, self._next - count)
+            return [self._log(seq) for seq in range(start, self._next)]
+
+    def _candidates(self, query: str) -> Optional[list[int]]:
+        """
+        Sequence numbers of the logs that can contain `query`, newest first, or None
+        when every log has to be checked. Must be called with the lock held.
+
+        A query word with a word boundary on both sides must be a whole word of the log.
+        The first word may be the end of a longer word and the last word its start, so
+        those match every indexed word ending or starting with them.
+        """
+        words = list(_TOKEN_PATTERN.finditer(query))
+        if not words:
+            return None
+        whole_words = [
+            w.group() for w in words if w.start() > 0 and w.end() < len(query)
+        ]
+        if whole_words:
+            rarest = min(
+                (self._postings.get(word) or deque() for word in whole_words), key=len
+            )
+            return list(reversed(rarest))
+
+        candidates: Optional[set[int]] = None
+        for word in words:
+            token = word.group()
+            at_start, at_end = word.start() == 0, word.end() == len(query)
+            seqs: set[int] = set()
+            for indexed, postings in self._postings.items():
+                if (
+                    (at_start and at_end and token in indexed)
+                    or (at_start and not at_end and indexed.endswith(token))
+                    or (at_end and not at_start and indexed.startswith(token))
+                ):
+                    seqs.update(postings)
+            if candidates is None or len(seqs) < len(candidates):
+                candidates = seqs
+        assert candidates is not None
+        return sorted(candidates, reverse=True)
+
+    def search(self, query: str, count: int) -> list[tuple[datetime, str]]:
+        """Returns the newest `count` logs containing `query` (case-insensitive), oldest first."""
+        query = query.lower()
+        with self._lock:
+            candidates: Optional[Iterable[int]] = self._candidates(query)
+            if candidates is None:
+                candidates = range(self._next - 1, self._first - 1, -1)
+            matches = []
+            for seq in candidates:
+                log_time, message = self._log(seq)
+                if query in message.lower():
+                    matches.append((log_time, message))
+                    if len(matches) == count:
+                        break
+        matches.reverse()
+        return matches
@@ -0,0 +1,66 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from string import Formatter
+import threading
+from typing import Any
+
+DEBUG = 10
+INFO = 20
+ERROR = 40
+
+LEVEL_NAMES = {DEBUG: "DEBUG", INFO: "INFO", ERROR: "ERROR"}
+
+_formatter = Formatter()
+
+
+@dataclass
+class LogRecord:
+    """One log, formatted only when its message is needed."""
+
+    level: int
+    subsystem: str
+    template: str
+    fields: dict[str, Any] = field(default_factory=dict)
+    log_time: datetime = field(default_factory=datetime.now)
+
+    def message(self) -> str:
+        """
+        "LEVEL: [SUBSYSTEM]: template" with `fields` filled in. Fields the template
+        doesn't use are appended as key=value. Without fields, the template is used as is.
+        """
+        text = self.template
+        if self.fields:
+            used = {name for _, name, _, _ in _formatter.parse(self.template) if name}
+            text = self.template.format(**self.fields)
+            extra = " ".join(
+                f"{key}={value}"
+                for key, value in self.fields.items()
+                if key not in used
+            )
+            if extra:
+                text = f"{text} {extra}"
+        return f"{LEVEL_NAMES.get(self.level, self.level)}: [{self.subsystem}]: {text}"
+
+
+class LogSampler(object):
+    """
+    Keeps 1 of every n logs per subsystem, for subsystems with a sample rate.
+
+    Each `key` (the log's call site) is counted separately, so a subsystem logging from
+    several places every cycle keeps 1 in n of each, not a rotating subset of them.
+    """
+
+    def __init__(self, sample_rates: dict[str, int]) -> None:
+        # Subsystem to n. Subsystems without a rate keep every log.
+        self.sample_rates = sample_rates
+        self._seen: dict[tuple[str, str], int] = {}
+        self._lock = threading.Lock()
+
+    def sample(self, subsystem: str, key: str = "") -> bool:
+        rate = self.sample_rates.get(subsystem, 1)
+        if rate <= 1:
+            return True
+        with self._lock:
+            seen = self._seen.get((subsystem, key), 0)
+            self._seen[(subsystem, key)] = seen + 1
+        return seen % rate == 0
@@ -0,0 +1,186 @@
+import asyncio
+from collections import deque
+from datetime import datetime
+import threading
+from typing import Optional
+
+from data_bridge import AsyncData, Data
+from log_archive import LogArchive
+
+# Logs held while waiting for the db. Once full, the oldest log is dropped for each new one.
+LOG_SHIP_BUFFER_SIZE = 5000
+# Most logs written to the db in one write_to_logs() call.
+LOG_SHIP_BATCH_SIZE = 200
+
+
+class LogShipper(object):
+    """Bounded buffer between logging calls and the db.
+
+    Logging only appends to the buffer, from any thread. The ship_logs() asyncio loop
+    drains it in batches through AsyncData, so no caller ever waits on the db. With an
+    `archive`, every log is also written to the local log archive, even when logs don't
+    go to the db.
+    """
+
+    _singleton = None
+
+    def __init__(
+        self,
+        capacity: int = LOG_SHIP_BUFFER_SIZE,
+        batch_size: int = LOG_SHIP_BATCH_SIZE,
+        archive: Optional[LogArchive] = None,
+    ) -> None:
+        self._buffer: deque[tuple[datetime, str]] = deque(maxlen=capacity)
+        # Logs not yet archived, drained separately so a db outage doesn't hold up the archive.
+        self._archive = archive
+        self._archive_buffer: deque[tuple[datetime, str]] = deque(maxlen=capacity)
+        self._archived = 0
+        self._archive_dropped = 0
+        self._archive_failures = 0
+        self._batch_size = batch_size
+        self._lock = threading.Lock()
+        self._shipped = 0
+        self._dropped = 0
+        self._failed_batches = 0
+        # Set once a full batch (or an urgent log) is waiting, see wait_for_batch().
+        self._wakeup: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @classmethod
+    def singleton(cls) -> "LogShipper":
+        if cls._singleton is None:
+            cls._singleton = cls(archive=LogArchive.singleton())
+        return cls._singleton
+
+    def enqueue(self, log_time: datetime, message: str, urgent: bool = False) -> None:
+        """Buffers a log for the db. `urgent` wakes the shipper instead of waiting for its interval."""
+        with self._lock:
+            if len(self._buffer) == self._buffer.maxlen:
+                self._dropped += 1
+            self._buffer.append((log_time, message))
+            if self._archive is not None:
+                if len(self._archive_buffer) == self._archive_buffer.maxlen:
+                    self._archive_dropped += 1
+                self._archive_buffer.append((log_time, message))
+            wake = urgent or len(self._buffer) == self._batch_size
+        if wake:
+            self._wake()
+
+    def _wake(self) -> None:
+        loop, wakeup = self._loop, self._wakeup
+        if loop is None or wakeup is None or loop.is_closed():
+            return
+        # Logs come from executor threads too, and asyncio.Event isn't thread-safe.
+        loop.call_soon_threadsafe(wakeup.set)
+
+    def pending(self) -> list[tuple[datetime, str]]:
+        """Returns the logs not yet written to the db, oldest first."""
+        with self._lock:
+            return list(self._buffer)
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    def stats(self) -> dict[str, int]:
+        """Returns buffer counters, for !status."""
+        with self._lock:
+            return {
+                "pending": len(self._buffer),
+                "capacity": self._buffer.maxlen or 0,
+                "shipped": self._shipped,
+                "dropped": self._dropped,
+                "failed_batches": self._failed_batches,
+                "archived": self._archived,
+                "archive_dropped": self._archive_dropped,
+                "archive_failures": self._archive_failures,
+            }
+
+    def _take_batch(self) -> list[tuple[datetime, str]]:
+        with self._lock:
+            count = min(self._batch_size, len(self._buffer))
+            return [self._buffer.popleft() for _ in range(count)]
+
+    def _requeue(self, batch: list[tuple[datetime, str]]) -> None:
+        """Puts a batch that failed to write back at the front of the buffer."""
+        with self._lock:
+            self._failed_batches += 1
+            room = (self._buffer.maxlen or 0) - len(self._buffer)
+            # Newer logs win, the oldest of the failed batch are dropped if there's no room.
+            kept = batch[len(batch) - room :] if room < len(batch) else batch
+            self._dropped += len(batch) - len(kept)
+            self._buffer.extendleft(reversed(kept))
+
+    def _archive_pending(self) -> None:
+        """Appends every log not yet archived to the archive. A failed write is dropped and counted."""
+        if self._archive is None:
+            return
+        with self._lock:
+            logs = list(self._archive_buffer)
+            self._archive_buffer.clear()
+        try:
+            self._archive.append(logs)
+        except Exception:
+            with self._lock:
+                self._archive_failures += 1
+            return
+        with self._lock:
+            self._archived += len(logs)
+
+    def _discard(self) -> None:
+        """Forgets logs meant for the db, when they aren't shipped there (local mode)."""
+        with self._lock:
+            self._buffer.clear()
+
+    async def ship(self, to_db: bool = True) -> int:
+        """Archives every buffered log, then writes them to the db in batches. Returns the number written to db."""
+        if self._archive is not None:
+            await asyncio.to_thread(self._archive_pending)
+        if not to_db:
+            self._discard()
+            return 0
+        shipped = 0
+        while True:
+            batch = self._take_batch()
+            if not batch:
+                return shipped
+            try:
+                await AsyncData.singleton().write_to_logs(batch)
+            except Exception:
+                self._requeue(batch)
+                raise
+            with self._lock:
+                self._shipped += len(batch)
+            shipped += len(batch)
+
+    def flush(self, to_db: bool = True) -> int:
+        """Blocking version of ship(), for shutdown when the event loop is no longer running."""
+        self._archive_pending()
+        if not to_db:
+            self._discard()
+            return 0
+        shipped = 0
+        while True:
+            batch = self._take_batch()
+            if not batch:
+                return shipped
+            try:
+                Data.singleton().write_to_logs(batch)
+            except Exception:
+                self._requeue(batch)
+                raise
+            with self._lock:
+                self._shipped += len(batch)
+            shipped += len(batch)
+
+    async def wait_for_batch(self, max_seconds: float) -> None:
+        """Sleeps until a full batch or an urgent log is waiting, or `max_seconds` pass."""
+        if self._wakeup is None or self._loop is not asyncio.get_running_loop():
+            self._loop = asyncio.get_running_loop()
+            self._wakeup = asyncio.Event()
+        self._wakeup.clear()
+        if len(self._buffer) >= self._batch_size:
+            return
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), max_seconds)
+        except asyncio.TimeoutError:
+            pass
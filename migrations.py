@@ -0,0 +1,243 @@
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass
+class Migration:
+    """A schema change. Each migration is applied once, in its own transaction."""
+
+    version: int
+    description: str
+    statements: list[str]
+
+
+# Arbitrary key for pg_advisory_xact_lock, so two bots starting at once don't race.
+MIGRATION_LOCK_ID = 7_424_311
+
+MIGRATIONS: list[Migration] = [
+    Migration(
+        1,
+        "Baseline tables",
+        [
+            # No-ops against the existing production db, creates the schema on a fresh one.
+            """CREATE TABLE IF NOT EXISTS public.user_statistics (
+                discord_user_name text PRIMARY KEY,
+                commands_used integer NOT NULL DEFAULT 0,
+                thanks_given integer NOT NULL DEFAULT 0
+            )""",
+            """CREATE TABLE IF NOT EXISTS public.aliases (
+                long_name text NOT NULL,
+                short_name text NOT NULL
+            )""",
+            """CREATE TABLE IF NOT EXISTS public.auto_updates (
+                auto_update_id serial PRIMARY KEY,
+                reddit_thread_url text NOT NULL,
+                liquipedia_url text NOT NULL,
+                thread_type text NOT NULL,
+                thread_options text NOT NULL,
+                seconds_since_epoch bigint NOT NULL,
+                day_number integer NOT NULL
+            )""",
+            """CREATE TABLE IF NOT EXISTS public.remindme (
+                remindme_id serial PRIMARY KEY,
+                discord_username text NOT NULL,
+                remindme_message text NOT NULL,
+                channel_id bigint NOT NULL,
+                trigger_timestamp bigint NOT NULL
+            )""",
+            """CREATE TABLE IF NOT EXISTS public.already_warned_scheduled_posts (
+                id text NOT NULL,
+                seconds_since_epoch bigint NOT NULL
+            )""",
+            """CREATE TABLE IF NOT EXISTS public.already_confirmed_scheduled_posts (
+                post_id text NOT NULL,
+                seconds_since_epoch bigint NOT NULL
+            )""",
+            """CREATE TABLE IF NOT EXISTS public.logs (
+                log_time timestamp NOT NULL,
+                log text NOT NULL
+            )""",
+            """CREATE TABLE IF NOT EXISTS public.dualflairs (
+                dualflair text NOT NULL
+            )""",
+        ],
+    ),
+    Migration(
+        2,
+        "Btree indexes for hot lookups",
+        [
+            # !logs: ORDER BY log_time DESC LIMIT n.
+            """CREATE INDEX IF NOT EXISTS logs_log_time_idx
+                ON public.logs (log_time DESC)""",
+            # Task alerts: WHERE seconds_since_epoch > x.
+            """CREATE INDEX IF NOT EXISTS already_warned_scheduled_posts_seconds_idx
+                ON public.already_warned_scheduled_posts (seconds_since_epoch)""",
+            """CREATE INDEX IF NOT EXISTS already_confirmed_scheduled_posts_seconds_idx
+                ON public.already_confirmed_scheduled_posts (seconds_since_epoch)""",
+            # !autoupdate: WHERE reddit_thread_url = x.
+            """CREATE INDEX IF NOT EXISTS auto_updates_reddit_thread_url_idx
+                ON public.auto_updates (reddit_thread_url)""",
+            # The user_statistics upsert needs a unique index on discord_user_name. Only
+            # add one if the existing table doesn't already lead an index with it.
+            """DO $$
+            BEGIN
+                IF NOT EXISTS (
+                    SELECT 1 FROM pg_index i
+                    JOIN pg_attribute a
+                        ON a.attrelid = i.indrelid AND a.attnum = i.indkey[0]
+                    WHERE i.indrelid = 'public.user_statistics'::regclass
+                        AND i.indisunique
+                        AND a.attname = 'discord_user_name'
+                ) THEN
+                    CREATE UNIQUE INDEX user_statistics_discord_user_name_idx
+                        ON public.user_statistics (discord_user_name);
+                END IF;
+            END $$""",
+        ],
+    ),
+    Migration(
+        3,
+        "Trigram index for !logfind",
+        [
+            # WHERE log ILIKE '%x%' can't use a btree, a trigram GIN index covers it.
+            "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+            """CREATE INDEX IF NOT EXISTS logs_log_trgm_idx
+                ON public.logs USING gin (log gin_trgm_ops)""",
+        ],
+    ),
+    Migration(
+        4,
+        "Partition logs by month",
+        [
+            # Existing logs stay in logs_legacy, attached as the oldest partition and
+            # dropped by Data.maintain_log_partitions() once they are past retention.
+            """DO $$
+            DECLARE
+                legacy_until timestamp;
+            BEGIN
+                IF EXISTS (
+                    SELECT 1 FROM pg_partitioned_table
+                    WHERE partrelid = 'public.logs'::regclass
+                ) THEN
+                    RETURN;
+                END IF;
+
+                -- Partitions need a log_time. Logs without one keep a placeholder time at
+                -- the start of logs_legacy rather than being dropped.
+                UPDATE public.logs SET log_time = '1970-01-01 00:00:00'
+                    WHERE log_time IS NULL;
+                SELECT greatest(
+                    date_trunc('month', now()::timestamp),
+                    date_trunc('month', max(log_time)::timestamp)
+                ) + interval '1 month'
+                INTO legacy_until FROM public.logs;
+
+                ALTER TABLE public.logs RENAME TO logs_legacy;
+                ALTER INDEX IF EXISTS public.logs_log_time_idx
+                    RENAME TO logs_legacy_log_time_idx;
+                ALTER INDEX IF EXISTS public.logs_log_trgm_idx
+                    RENAME TO logs_legacy_log_trgm_idx;
+                ALTER TABLE public.logs_legacy ALTER COLUMN log_time SET NOT NULL;
+
+                CREATE TABLE public.logs (LIKE public.logs_legacy INCLUDING DEFAULTS)
+                    PARTITION BY RANGE (log_time);
+                EXECUTE format(
+                    'ALTER TABLE public.logs ATTACH PARTITION public.logs_legacy
+                        FOR VALUES FROM (MINVALUE) TO (%L)',
+                    legacy_until
+                );
+                EXECUTE format(
+                    'CREATE TABLE public.%I PARTITION OF public.logs
+                        FOR VALUES FROM (%L) TO (%L)',
+                    to_char(legacy_until, '"logs_y"YYYY"m"MM'),
+                    legacy_until,
+                    legacy_until + interval '1 month'
+                );
+                -- Catches logs past the newest partition, so a missed maintenance run
+                -- never fails writes. Moved out as their partition is created.
+                CREATE TABLE public.logs_default PARTITION OF public.logs DEFAULT;
+
+                -- Attaches the legacy indexes and builds them on new partitions.
+                CREATE INDEX logs_log_time_idx ON public.logs (log_time DESC);
+                CREATE INDEX logs_log_trgm_idx
+                    ON public.logs USING gin (log gin_trgm_ops);
+            END $$""",
+        ],
+    ),
+    Migration(
+        5,
+        "Publish cached table changes to other bot instances",
+        [
+            # The payload is the table name, see data_bridge.WATCHED_TABLES.
+            """CREATE OR REPLACE FUNCTION public.rleb_notify_table_change()
+            RETURNS trigger AS $$
+            BEGIN
+                PERFORM pg_notify('rleb_table_changes', TG_TABLE_NAME);
+                RETURN NULL;
+            END;
+            $$ LANGUAGE plpgsql""",
+        ]
+        + [
+            statement
+            for table in ["aliases", "dualflairs", "auto_updates"]
+            for statement in [
+                f"DROP TRIGGER IF EXISTS {table}_notify_change ON public.{table}",
+                f"""CREATE TRIGGER {table}_notify_change
+                AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON public.{table}
+                FOR EACH STATEMENT EXECUTE FUNCTION public.rleb_notify_table_change()""",
+            ]
+        ],
+    ),
+]
+
+
+def applied_versions(connection: Any) -> set[int]:
+    """Returns the versions already recorded in public.schema_migrations."""
+    with connection:
+        cursor = connection.cursor()
+        cursor.execute(
+            """CREATE TABLE IF NOT EXISTS public.schema_migrations (
+                version integer PRIMARY KEY,
+                description text NOT NULL,
+                applied_at timestamptz NOT NULL DEFAULT now()
+            )"""
+        )
+        cursor.execute("SELECT version FROM public.schema_migrations")
+        return {row[0] for row in cursor.fetchall()}
+
+
+def apply_migrations(
+    connection: Any, migrations: list[Migration] = MIGRATIONS
+) -> list[int]:
+    """
+    Applies every migration not yet recorded in public.schema_migrations.
+
+    Params:
+        connection: An open psycopg2 connection. Each migration is committed separately.
+        migrations: The migrations to apply, defaults to MIGRATIONS.
+
+    Returns the versions that were applied, in order.
+    """
+    applied = applied_versions(connection)
+    newly_applied = []
+    for migration in sorted(migrations, key=lambda m: m.version):
+        if migration.version in applied:
+            continue
+        with connection:
+            cursor = connection.cursor()
+            cursor.execute("SELECT pg_advisory_xact_lock(%s)", (MIGRATION_LOCK_ID,))
+            # Another instance may have applied it while we waited on the lock.
+            cursor.execute(
+                "SELECT 1 FROM public.schema_migrations WHERE version = %s",
+                (migration.version,),
+            )
+            if cursor.fetchone():
+                continue
+            for statement in migration.statements:
+                cursor.execute(statement)
+            cursor.execute(
+                "INSERT INTO public.schema_migrations (version, description) VALUES (%s, %s)",
+                (migration.version, migration.description),
+            )
+        newly_applied.append(migration.version)
+    return newly_applied
@@ -414,8 +414,8 @@ class RedditBridge:
                         break
                     self.last_modmail = datetime.now()
 
-                    global_settings.rleb_log_info(
-                        f"[REDDIT]: Modmail - {conversation.id}"
+                    global_settings.rleb_log_debug(
+                        "REDDIT", "Modmail - {id}", id=conversation.id
                     )
 
                     # Handle multiflairs from subreddit.
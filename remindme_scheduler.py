@@ -0,0 +1,118 @@
+import asyncio
+import heapq
+import time
+from typing import Optional
+
+from data_bridge import AsyncData, Remindme
+
+
+class RemindmeScheduler(object):
+    """In-process schedule of pending !remindme notifications.
+
+    Pending remindmes are read from the db once and kept in a min-heap keyed by
+    trigger_timestamp. Reminders scheduled or cancelled through the scheduler wake
+    up wait_for_next(), so the remindme loop sleeps exactly until the next one is due.
+    """
+
+    _singleton = None
+
+    def __init__(self) -> None:
+        # (trigger_timestamp, remindme_id). Cancelled entries stay in the heap and
+        # are skipped when they reach the top.
+        self._heap: list[tuple[int, int]] = []
+        self._remindmes: dict[int, Remindme] = {}
+        self._loaded = False
+        self._wakeup = asyncio.Event()
+
+    @classmethod
+    def singleton(cls) -> "RemindmeScheduler":
+        if cls._singleton is None:
+            cls._singleton = cls()
+        return cls._singleton
+
+    async def load(self) -> None:
+        """Reads all pending remindmes from the db. Only the first call hits the db."""
+        if self._loaded:
+            return
+        for remindme in await AsyncData.singleton().read_remindmes():
+            self.add(remindme)
+        self._loaded = True
+
+    def add(self, remindme: Remindme) -> None:
+        """Tracks `remindme` and wakes the loop in case it is now the next one due."""
+        self._remindmes[remindme.remindme_id] = remindme
+        heapq.heappush(self._heap, (remindme.trigger_timestamp, remindme.remindme_id))
+        self._wakeup.set()
+
+    def remove(self, remindme_id: int) -> Optional[Remindme]:
+        """Stops tracking a remindme. Returns the remindme, or None if it wasn't tracked."""
+        remindme = self._remindmes.pop(remindme_id, None)
+        if remindme is not None:
+            self._wakeup.set()
+        return remindme
+
+    def get(self, remindme_id: int) -> Optional[Remindme]:
+        return self._remindmes.get(remindme_id)
+
+    def __len__(self) -> int:
+        return len(self._remindmes)
+
+    async def schedule(
+        self, user: str, message: str, elapsed_time: int, channel_id: int
+    ) -> Remindme:
+        """Writes a remindme to the db and schedules it."""
+        remindme = await AsyncData.singleton().write_remindme(
+            user, message, elapsed_time, channel_id
+        )
+        self.add(remindme)
+        return remindme
+
+    async def cancel(self, remindme_id: int) -> None:
+        """Deletes a remindme from the db and unschedules it."""
+        await AsyncData.singleton().delete_remindme(remindme_id)
+        self.remove(remindme_id)
+
+    def _peek(self) -> Optional[tuple[int, int]]:
+        """Returns the earliest live heap entry, dropping cancelled ones on the way."""
+        while self._heap:
+            trigger_timestamp, remindme_id = self._heap[0]
+            remindme = self._remindmes.get(remindme_id)
+            if remindme is not None and remindme.trigger_timestamp == trigger_timestamp:
+                return self._heap[0]
+            heapq.heappop(self._heap)
+        return None
+
+    def seconds_until_next(self, now: Optional[float] = None) -> Optional[float]:
+        """Seconds until the next remindme is due (0 if overdue), or None if none are pending."""
+        entry = self._peek()
+        if entry is None:
+            return None
+        if now is None:
+            now = time.time()
+        return max(0.0, entry[0] - now)
+
+    def pop_due(self, now: Optional[float] = None) -> list[Remindme]:
+        """Removes and returns every remindme due at `now`, earliest first."""
+        if now is None:
+            now = time.time()
+        due = []
+        while True:
+            entry = self._peek()
+            if entry is None or entry[0] > now:
+                break
+            heapq.heappop(self._heap)
+            due.append(self._remindmes.pop(entry[1]))
+        return due
+
+    async def wait_for_next(self, max_seconds: float) -> None:
+        """Sleeps until the next remindme is due, the schedule changes, or `max_seconds` pass."""
+        self._wakeup.clear()
+        timeout = self.seconds_until_next()
+        if timeout is None or timeout > max_seconds:
+            timeout = max_seconds
+        if timeout <= 0:
+            return
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
@@ -2,7 +2,8 @@ import asyncio
 import os
 import discord_bridge
 import global_settings
-from global_settings import rleb_log_info
+from data_bridge import Data
+from global_settings import rleb_log_error, rleb_log_info
 
 
 def start() -> None:
@@ -15,13 +16,32 @@ def start() -> None:
         )
     )
 
+    # Bring the db schema up to date before anything reads from it. The bot still starts
+    # if the db is down, the log partition maintenance loop retries both.
+    try:
+        applied_migrations = Data.singleton().migrate()
+        if applied_migrations:
+            rleb_log_info(f"Applied db migrations {applied_migrations}.")
+        Data.singleton().maintain_log_partitions()
+    except Exception as e:
+        rleb_log_error(
+            f"Startup db migrations or log partition maintenance failed: {e}"
+        )
+
     # Load remindmes and autoupdates from database
     global_settings.refresh_remindmes()
     global_settings.refresh_autoupdates()
 
     # Start the discord bot on main thread. All monitoring now happens in asyncio tasks.
     rleb_log_info("Starting discord bot (all monitoring will run in asyncio tasks).")
-    discord_bridge.start()
+    try:
+        discord_bridge.start()
+    finally:
+        # Discord client has shut down, write buffered logs and release pooled db connections.
+        try:
+            global_settings.flush_memory_log()
+        finally:
+            Data.singleton().close()
 
 
 # Here's where it all begins.
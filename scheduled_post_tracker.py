@@ -0,0 +1,112 @@
+import time
+from typing import Optional
+
+from data_bridge import AsyncData
+
+# Scheduled posts are tracked for as long as task alerts read them back from the db.
+SCHEDULED_POST_WINDOW_SECONDS = 7 * 86400
+# Incremental syncs re-read this far behind the last sync, for rows written by other
+# instances whose clocks or commits lag behind ours.
+SYNC_OVERLAP_SECONDS = 5 * 60
+
+
+class ScheduledPostTracker(object):
+    """In-process record of the scheduled posts task alerts already warned about or confirmed.
+
+    Ids are kept in dicts (used as sets) mapping to when they were recorded, and are
+    evicted once they fall out of the one week db window. sync() only reads rows newer
+    than the previous sync, and marked posts are written to the db in one batch per
+    table by flush().
+    """
+
+    _singleton = None
+
+    def __init__(self, window_seconds: float = SCHEDULED_POST_WINDOW_SECONDS) -> None:
+        self._window_seconds = window_seconds
+        self._warned: dict[int, float] = {}
+        self._confirmed: dict[int, float] = {}
+        # (id, seconds_since_epoch) rows not yet written to the db.
+        self._pending_warned: list[tuple[int, int]] = []
+        self._pending_confirmed: list[tuple[int, int]] = []
+        # When the last sync() started, None until the first one.
+        self._synced_at: Optional[float] = None
+
+    @classmethod
+    def singleton(cls) -> "ScheduledPostTracker":
+        if cls._singleton is None:
+            cls._singleton = cls()
+        return cls._singleton
+
+    def is_warned(self, post_id: int) -> bool:
+        return post_id in self._warned
+
+    def is_confirmed(self, post_id: int) -> bool:
+        return post_id in self._confirmed
+
+    def mark_warned(self, post_id: int, now: Optional[float] = None) -> None:
+        """Records a warned post. It is written to the db by the next flush()."""
+        if now is None:
+            now = time.time()
+        if post_id not in self._warned:
+            self._pending_warned.append((post_id, int(now)))
+        self._warned[post_id] = now
+
+    def mark_confirmed(self, post_id: int, now: Optional[float] = None) -> None:
+        """Records a confirmed post. It is written to the db by the next flush()."""
+        if now is None:
+            now = time.time()
+        if post_id not in self._confirmed:
+            self._pending_confirmed.append((post_id, int(now)))
+        self._confirmed[post_id] = now
+
+    def __len__(self) -> int:
+        return len(self._warned) + len(self._confirmed)
+
+    async def flush(self) -> None:
+        """Writes every marked post since the last flush, one INSERT per table."""
+        warned, self._pending_warned = self._pending_warned, []
+        confirmed, self._pending_confirmed = self._pending_confirmed, []
+        try:
+            if warned:
+                await AsyncData.singleton().write_already_warned_scheduled_posts(warned)
+                warned = []
+            if confirmed:
+                await AsyncData.singleton().write_already_confirmed_scheduled_posts(
+                    confirmed
+                )
+        except Exception:
+            # Put unwritten rows back so the next flush retries them.
+            self._pending_warned = warned + self._pending_warned
+            self._pending_confirmed = confirmed + self._pending_confirmed
+            raise
+
+    async def sync(self, now: Optional[float] = None) -> None:
+        """Flushes marked posts, then reads posts recorded since the last sync and evicts expired ones."""
+        if now is None:
+            now = time.time()
+        await self.flush()
+
+        window_start = now - self._window_seconds
+        since = window_start
+        if self._synced_at is not None:
+            since = max(window_start, self._synced_at - SYNC_OVERLAP_SECONDS)
+
+        # The db only returns ids, so synced posts are timed from when they were first
+        # seen here. That can only keep them a little past the db window, never evict early.
+        data = AsyncData.singleton()
+        for post_id in await data.read_already_warned_scheduled_posts(int(since)):
+            self._warned.setdefault(post_id, now)
+        for post_id in await data.read_already_confirmed_scheduled_posts(int(since)):
+            self._confirmed.setdefault(post_id, now)
+        # Only advanced once both reads succeed, so a failed sync is retried in full.
+        self._synced_at = now
+        self.evict(now)
+
+    def evict(self, now: Optional[float] = None) -> None:
+        """Forgets posts recorded before the window."""
+        if now is None:
+            now = time.time()
+        window_start = now - self._window_seconds
+        for posts in (self._warned, self._confirmed):
+            for post_id in [p for p, seen in posts.items() if seen < window_start]:
+                del posts[post_id]
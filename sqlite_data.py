@@ -0,0 +1,643 @@
+"""
+SQLite backend for single-node deployments that don't want to run postgres.
+
+Set DATA_MODE to "sqlite" to use it. Everything is stored in the SQLITE_PATH file,
+which is opened in WAL mode so reads never wait on the log and statistics writers.
+"""
+
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+import os
+from pathlib import Path
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Iterator, Optional
+
+from data_bridge import (
+    LOG_RETENTION_DAYS,
+    YOLO_QUERY_BLOCKED_COMMANDS,
+    YOLO_QUERY_MAX_ROW_CHARS,
+    YOLO_QUERY_PAGE_SIZE,
+    YOLO_QUERY_SESSION_SECONDS,
+    YOLO_QUERY_TIMEOUT_MS,
+    AutoUpdate,
+    DataStub,
+    QueryPage,
+    Remindme,
+    UserStatistics,
+    _reject_blocked_commands,
+    _YoloQuerySession,
+    config,
+)
+from migrations import Migration
+
+SQLITE_PATH = (
+    os.environ.get("SQLITE_PATH")
+    or config.get("General", "SQLITE_PATH", fallback=None)
+    or "rleb.sqlite3"
+)
+# Seconds a writer waits for another connection's write transaction to finish.
+SQLITE_BUSY_TIMEOUT_SECONDS = 5.0
+
+# Fixed width, so log_time text sorts in time order.
+LOG_TIME_FORMAT = "%Y-%m-%d %H:%M:%S.%f"
+
+# SQLite has no read-only transactions, !sql also runs on a mode=ro connection.
+SQLITE_BLOCKED_COMMANDS = YOLO_QUERY_BLOCKED_COMMANDS + ["ATTACH", "DETACH", "PRAGMA"]
+
+# Applied in order, the schema version is kept in PRAGMA user_version.
+SQLITE_MIGRATIONS: list[Migration] = [
+    Migration(
+        1,
+        "Baseline tables and indexes",
+        [
+            """CREATE TABLE IF NOT EXISTS user_statistics (
+                discord_user_name TEXT PRIMARY KEY,
+                commands_used INTEGER NOT NULL DEFAULT 0,
+                thanks_given INTEGER NOT NULL DEFAULT 0
+            ) WITHOUT ROWID""",
+            # Unlike postgres, adding an existing alias replaces it.
+            """CREATE TABLE IF NOT EXISTS aliases (
+                long_name TEXT PRIMARY KEY,
+                short_name TEXT NOT NULL
+            ) WITHOUT ROWID""",
+            """CREATE TABLE IF NOT EXISTS auto_updates (
+                auto_update_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                reddit_thread_url TEXT NOT NULL,
+                liquipedia_url TEXT NOT NULL,
+                thread_type TEXT NOT NULL,
+                thread_options TEXT NOT NULL,
+                seconds_since_epoch INTEGER NOT NULL,
+                day_number INTEGER NOT NULL
+            )""",
+            """CREATE INDEX IF NOT EXISTS auto_updates_reddit_thread_url_idx
+                ON auto_updates (reddit_thread_url)""",
+            """CREATE TABLE IF NOT EXISTS remindme (
+                remindme_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                discord_username TEXT NOT NULL,
+                remindme_message TEXT NOT NULL,
+                channel_id INTEGER NOT NULL,
+                trigger_timestamp INTEGER NOT NULL
+            )""",
+            """CREATE TABLE IF NOT EXISTS already_warned_scheduled_posts (
+                id TEXT NOT NULL,
+                seconds_since_epoch INTEGER NOT NULL
+            )""",
+            """CREATE INDEX IF NOT EXISTS already_warned_scheduled_posts_seconds_idx
+                ON already_warned_scheduled_posts (seconds_since_epoch)""",
+            """CREATE TABLE IF NOT EXISTS already_confirmed_scheduled_posts (
+                post_id TEXT NOT NULL,
+                seconds_since_epoch INTEGER NOT NULL
+            )""",
+            """CREATE INDEX IF NOT EXISTS already_confirmed_scheduled_posts_seconds_idx
+                ON already_confirmed_scheduled_posts (seconds_since_epoch)""",
+            """CREATE TABLE IF NOT EXISTS logs (
+                log_time TEXT NOT NULL,
+                log TEXT NOT NULL
+            )""",
+            # !logs and retention pruning both walk log_time.
+            """CREATE INDEX IF NOT EXISTS logs_log_time_idx ON logs (log_time)""",
+            """CREATE TABLE IF NOT EXISTS dualflairs (
+                dualflair TEXT PRIMARY KEY
+            ) WITHOUT ROWID""",
+        ],
+    ),
+]
+
+
+def _interrupt_after(connection: sqlite3.Connection, milliseconds: int) -> None:
+    """Aborts whatever `connection` runs next once `milliseconds` have passed."""
+    deadline = time.monotonic() + milliseconds / 1000
+    handler: Callable[[], int] = lambda: int(time.monotonic() > deadline)
+    connection.set_progress_handler(handler, 1000)
+
+
+class SqliteData(DataStub):
+    """Bridge between RLEB and a local SQLite file."""
+
+    _singleton: Optional["SqliteData"] = None
+
+    def __init__(self) -> None:
+        raise RuntimeError("Call singleton() instead")
+
+    @classmethod
+    def singleton(cls) -> "SqliteData":
+        if cls._singleton is None:
+            cls._singleton = cls.__new__(cls)
+            cls._singleton._initialize(SQLITE_PATH)
+        return cls._singleton
+
+    def _initialize(self, path: str) -> None:
+        """Sets up per-instance state, since singleton() bypasses __init__."""
+        self._path = path
+
+        # One connection per thread, WAL lets them read while another one writes.
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+
+        # Unflushed user_statistics deltas, mapping username to [commands_used, thanks_given].
+        self._pending_user_statistics: dict[str, list[int]] = {}
+        self._pending_lock = threading.Lock()
+
+        # Open !sql queries, keyed by session_key (the discord channel).
+        self._yolo_sessions: dict[str, _YoloQuerySession] = {}
+        self._yolo_lock = threading.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        """Returns this thread's connection, opening it on first use."""
+        connection: Optional[sqlite3.Connection] = getattr(
+            self._local, "connection", None
+        )
+        if connection is None:
+            # Autocommit, writes open their own transaction in _transaction().
+            connection = sqlite3.connect(
+                self._path,
+                timeout=SQLITE_BUSY_TIMEOUT_SECONDS,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            # Safe in WAL mode, a crash can only lose the last commits, never corrupt the db.
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+            with self._connections_lock:
+                self._connections.append(connection)
+        return connection
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Yields this thread's connection inside a write transaction."""
+        connection = self._connection()
+        # IMMEDIATE takes the write lock up front, so the transaction can't fail to
+        # upgrade from a read lock halfway through.
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield connection
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+
+    def migrate(self) -> list[int]:
+        """Applies pending schema migrations. Returns the versions that were applied."""
+        applied = []
+        for migration in sorted(SQLITE_MIGRATIONS, key=lambda m: m.version):
+            with self._transaction() as db:
+                if migration.version <= db.execute("PRAGMA user_version").fetchone()[0]:
+                    continue
+                for statement in migration.statements:
+                    db.execute(statement)
+                # PRAGMA can't take parameters, version is always an int.
+                db.execute(f"PRAGMA user_version = {int(migration.version)}")
+            applied.append(migration.version)
+        return applied
+
+    def close(self) -> None:
+        """Flushes buffered writes and closes every connection. Should be called once on shutdown."""
+        self.flush_user_statistics()
+        with self._yolo_lock:
+            sessions = list(self._yolo_sessions.values())
+            self._yolo_sessions = {}
+        for session in sessions:
+            self._close_yolo_session(session)
+        with self._connections_lock:
+            connections = self._connections
+            self._connections = []
+        for connection in connections:
+            connection.execute("PRAGMA optimize")
+            connection.close()
+        self._local = threading.local()
+
+    def pool_stats(self) -> dict[str, int]:
+        """Returns the number of open connections, for !status."""
+        with self._connections_lock:
+            return {"connections": len(self._connections)}
+
+    def yolo_query(self, sql: str, session_key: str = "") -> QueryPage:
+        """
+        Runs a read-only query and returns its first page of rows.
+
+        The query runs on its own read-only connection. If there are more rows, it stays
+        open under `session_key` for yolo_query_next(), until it is exhausted or idle
+        for YOLO_QUERY_SESSION_SECONDS.
+        """
+        # Security: Denylist dangerous SQL commands (backup to read-only connection)
+        _reject_blocked_commands(sql, SQLITE_BLOCKED_COMMANDS)
+
+        for session in self._take_yolo_sessions(session_key):
+            self._close_yolo_session(session)
+
+        db = sqlite3.connect(
+            Path(self._path).absolute().as_uri() + "?mode=ro",
+            uri=True,
+            check_same_thread=False,
+        )
+        try:
+            _interrupt_after(db, YOLO_QUERY_TIMEOUT_MS)
+            session = _YoloQuerySession(db, db.execute(sql), 0, 0.0)
+            page = self._fetch_yolo_page(session)
+        except Exception as e:
+            db.close()
+            raise self._yolo_error(e) from e
+        self._keep_yolo_session(session_key, session, page)
+        return page
+
+    def yolo_query_next(self, session_key: str = "") -> Optional[QueryPage]:
+        """Returns the next page of the open query for `session_key`, or None if there is none."""
+        with self._yolo_lock:
+            session = self._yolo_sessions.pop(session_key, None)
+        if session is None:
+            return None
+        if session.expires_at <= time.time():
+            self._close_yolo_session(session)
+            return None
+        try:
+            page = self._fetch_yolo_page(session)
+        except Exception as e:
+            self._close_yolo_session(session)
+            raise self._yolo_error(e) from e
+        self._keep_yolo_session(session_key, session, page)
+        return page
+
+    def close_expired_yolo_sessions(self) -> None:
+        """Closes !sql queries left idle past YOLO_QUERY_SESSION_SECONDS."""
+        for session in self._take_yolo_sessions():
+            self._close_yolo_session(session)
+
+    def _take_yolo_sessions(
+        self, session_key: Optional[str] = None
+    ) -> list[_YoloQuerySession]:
+        """Removes the expired sessions, and `session_key`'s, for the caller to close."""
+        now = time.time()
+        with self._yolo_lock:
+            taken = [
+                key
+                for key, session in self._yolo_sessions.items()
+                if key == session_key or session.expires_at <= now
+            ]
+            return [self._yolo_sessions.pop(key) for key in taken]
+
+    def _keep_yolo_session(
+        self, session_key: str, session: _YoloQuerySession, page: QueryPage
+    ) -> None:
+        """Keeps a session open for its next page, or closes it once it's out of rows."""
+        if not page.has_more:
+            self._close_yolo_session(session)
+            return
+        session.expires_at = time.time() + YOLO_QUERY_SESSION_SECONDS
+        with self._yolo_lock:
+            # A newer query from the same channel replaces this one.
+            replaced = self._yolo_sessions.pop(session_key, None)
+            self._yolo_sessions[session_key] = session
+        if replaced is not None:
+            self._close_yolo_session(replaced)
+
+    def _fetch_yolo_page(self, session: _YoloQuerySession) -> QueryPage:
+        """Fetches one page from an open query."""
+        _interrupt_after(session.connection, YOLO_QUERY_TIMEOUT_MS)
+        rows = [session.lookahead] if session.lookahead is not None else []
+        rows.extend(session.cursor.fetchmany(YOLO_QUERY_PAGE_SIZE + 1 - len(rows)))
+        has_more = len(rows) > YOLO_QUERY_PAGE_SIZE
+        session.lookahead = rows[YOLO_QUERY_PAGE_SIZE] if has_more else None
+        session.page_number += 1
+        return QueryPage(
+            "\n".join(
+                [str(r)[:YOLO_QUERY_MAX_ROW_CHARS] for r in rows[:YOLO_QUERY_PAGE_SIZE]]
+            ),
+            session.page_number,
+            has_more,
+        )
+
+    def _close_yolo_session(self, session: _YoloQuerySession) -> None:
+        session.connection.close()
+
+    def _yolo_error(self, e: Exception) -> ValueError:
+        """Turns an error from a !sql query into a ValueError with a readable message."""
+        if isinstance(e, ValueError):
+            return e
+        if isinstance(e, sqlite3.OperationalError) and str(e) == "interrupted":
+            return ValueError(
+                f"Database error: query ran longer than {YOLO_QUERY_TIMEOUT_MS}ms."
+            )
+        if isinstance(e, sqlite3.Error):
+            return ValueError(f"Database error: {e}")
+        return ValueError(
+            f"Unexpected error executing query: {type(e).__name__}: {str(e)}"
+        )
+
+    def get_db_tables(self) -> int:
+        count: int = (
+            self._connection()
+            .execute(
+                "SELECT count(*) FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%'"
+            )
+            .fetchone()[0]
+        )
+        return count
+
+    def read_all_user_statistics(self) -> list[UserStatistics]:
+        # Buffered increments are local writes, cheap enough to flush before reading.
+        self.flush_user_statistics()
+        rows = self._connection().execute(
+            "SELECT discord_user_name, commands_used, thanks_given FROM user_statistics"
+        )
+        return [UserStatistics(s[0], s[1], s[2]) for s in rows]
+
+    def read_user_statistics(self, discord_username: str) -> Optional[UserStatistics]:
+        self.flush_user_statistics()
+        s = (
+            self._connection()
+            .execute(
+                "SELECT discord_user_name, commands_used, thanks_given FROM user_statistics WHERE discord_user_name = ?",
+                (discord_username,),
+            )
+            .fetchone()
+        )
+        return UserStatistics(s[0], s[1], s[2]) if s else None
+
+    def increment_user_statistics_commands_used(self, discord_username: str) -> None:
+        """Buffers the increment in memory. It is written by the next flush_user_statistics()."""
+        with self._pending_lock:
+            self._pending_user_statistics.setdefault(discord_username, [0, 0])[0] += 1
+
+    def increment_user_statistics_thanks_given(self, discord_username: str) -> None:
+        """Buffers the increment in memory. It is written by the next flush_user_statistics()."""
+        with self._pending_lock:
+            self._pending_user_statistics.setdefault(discord_username, [0, 0])[1] += 1
+
+    def flush_user_statistics(self) -> None:
+        """Writes all buffered user_statistics increments in one transaction."""
+        with self._pending_lock:
+            pending = self._pending_user_statistics
+            self._pending_user_statistics = {}
+        if not pending:
+            return
+
+        try:
+            with self._transaction() as db:
+                db.executemany(
+                    """INSERT INTO user_statistics (discord_user_name, commands_used, thanks_given)
+                    VALUES (?, ?, ?)
+                    ON CONFLICT (discord_user_name)
+                    DO UPDATE SET commands_used = commands_used + excluded.commands_used,
+                    thanks_given = thanks_given + excluded.thanks_given""",
+                    [(username, *deltas) for username, deltas in pending.items()],
+                )
+        except Exception:
+            # Put the deltas back so the next flush retries them.
+            with self._pending_lock:
+                for username, (commands_used, thanks_given) in pending.items():
+                    deltas = self._pending_user_statistics.setdefault(username, [0, 0])
+                    deltas[0] += commands_used
+                    deltas[1] += thanks_given
+            raise
+
+    def add_alias(self, long_name: str, short_name: str) -> None:
+        with self._transaction() as db:
+            db.execute(
+                "INSERT OR REPLACE INTO aliases (long_name, short_name) VALUES (?, ?)",
+                (long_name, short_name),
+            )
+
+    def remove_alias(self, long_name: str) -> None:
+        with self._transaction() as db:
+            db.execute("DELETE FROM aliases WHERE long_name = ?", (long_name,))
+
+    def read_all_aliases(self) -> dict[str, str]:
+        """Returns a mapping of long_name to short_name for each alias"""
+        rows = self._connection().execute("SELECT long_name, short_name FROM aliases")
+        return {long: short for long, short in rows}
+
+    def _read_auto_updates(
+        self, where: str, params: tuple[Any, ...]
+    ) -> list[AutoUpdate]:
+        rows = self._connection().execute(
+            f"""SELECT auto_update_id, reddit_thread_url, liquipedia_url, thread_type, thread_options, seconds_since_epoch, day_number
+            FROM auto_updates WHERE {where} ORDER BY auto_update_id""",
+            params,
+        )
+        return [AutoUpdate(*r) for r in rows]
+
+    def read_auto_update_from_id(self, auto_update_id: int) -> Optional[AutoUpdate]:
+        auto_updates = self._read_auto_updates("auto_update_id = ?", (auto_update_id,))
+        return auto_updates[0] if auto_updates else None
+
+    def read_auto_update_from_reddit_thread(
+        self, reddit_thread_url: str
+    ) -> Optional[AutoUpdate]:
+        auto_updates = self._read_auto_updates(
+            "reddit_thread_url = ?", (reddit_thread_url,)
+        )
+        return auto_updates[0] if auto_updates else None
+
+    def read_all_auto_updates(self) -> list[AutoUpdate]:
+        return self._read_auto_updates("1", ())
+
+    def delete_auto_update(self, auto_update: AutoUpdate) -> None:
+        with self._transaction() as db:
+            db.execute(
+                "DELETE FROM auto_updates WHERE auto_update_id = ?",
+                (auto_update.auto_update_id,),
+            )
+
+    def write_auto_update(
+        self,
+        reddit_thread_url: str,
+        liquipedia_url: str,
+        tourney_system: str,
+        thread_options: str,
+        day_number: int,
+    ) -> AutoUpdate:
+        """Writes a new autoupdate for an RL tourney, see Data.write_auto_update()."""
+        seconds_since_epoch = int(datetime.now().timestamp())
+        liquipedia_url = liquipedia_url.split("#")[0]
+        with self._transaction() as db:
+            cursor = db.execute(
+                """INSERT INTO auto_updates (reddit_thread_url, liquipedia_url, thread_type, thread_options, seconds_since_epoch, day_number)
+                VALUES (?, ?, ?, ?, ?, ?)""",
+                (
+                    reddit_thread_url,
+                    liquipedia_url,
+                    tourney_system,
+                    thread_options,
+                    seconds_since_epoch,
+                    day_number,
+                ),
+            )
+            auto_update_id = cursor.lastrowid
+        return AutoUpdate(
+            auto_update_id,  # type: ignore[arg-type]
+            reddit_thread_url,
+            liquipedia_url,
+            tourney_system,
+            thread_options,
+            seconds_since_epoch,
+            day_number,
+        )
+
+    def write_remindme(
+        self, user: str, message: str, elapsed_time: int, channel_id: int
+    ) -> Remindme:
+        """Adds a remindme notification to the database."""
+        target_timestamp = int(elapsed_time + time.time())
+        with self._transaction() as db:
+            cursor = db.execute(
+                """INSERT INTO remindme (discord_username, remindme_message, channel_id, trigger_timestamp)
+                VALUES (?, ?, ?, ?)""",
+                (user, message, channel_id, target_timestamp),
+            )
+            remindme_id = cursor.lastrowid
+        return Remindme(remindme_id, user, message, target_timestamp, channel_id)  # type: ignore[arg-type]
+
+    def delete_remindme(self, remindme_id: int) -> None:
+        """Deletes a remindme notification from db. Should be used after a remindme is triggered."""
+        with self._transaction() as db:
+            db.execute("DELETE FROM remindme WHERE remindme_id = ?", (remindme_id,))
+
+    def _read_remindmes(self, where: str, params: tuple[Any, ...]) -> list[Remindme]:
+        rows = self._connection().execute(
+            f"""SELECT remindme_id, discord_username, remindme_message, trigger_timestamp, channel_id
+            FROM remindme WHERE {where}""",
+            params,
+        )
+        return [Remindme(int(r[0]), r[1], r[2], int(r[3]), int(r[4])) for r in rows]
+
+    def read_remindme(self, remindme_id: int) -> Optional[Remindme]:
+        """Returns the remindme with `remindme_id`, or None if it doesn't exist."""
+        remindmes = self._read_remindmes("remindme_id = ?", (remindme_id,))
+        return remindmes[0] if remindmes else None
+
+    def read_remindmes(self) -> list[Remindme]:
+        """Returns all remindmes stored in the db."""
+        return self._read_remindmes("1", ())
+
+    def write_already_warned_scheduled_post(
+        self, log_id: int, seconds_since_epoch: int
+    ) -> None:
+        with self._transaction() as db:
+            db.execute(
+                "INSERT INTO already_warned_scheduled_posts VALUES (?, ?)",
+                (log_id, seconds_since_epoch),
+            )
+
+    def read_already_warned_scheduled_posts(
+        self, min_seconds_since_epoch: int
+    ) -> list[int]:
+        """Returns a list of log ids for already warned scheduled posts."""
+        rows = self._connection().execute(
+            "SELECT id FROM already_warned_scheduled_posts WHERE seconds_since_epoch > ?",
+            (min_seconds_since_epoch,),
+        )
+        return [r[0] for r in rows]
+
+    def write_already_warned_confirmed_post(
+        self, log_id: int, seconds_since_epoch: int
+    ) -> None:
+        with self._transaction() as db:
+            db.execute(
+                "INSERT INTO already_confirmed_scheduled_posts VALUES (?, ?)",
+                (log_id, seconds_since_epoch),
+            )
+
+    def read_already_confirmed_scheduled_posts(
+        self, min_seconds_since_epoch: int
+    ) -> list[int]:
+        """Returns a list of log ids for already confirmed scheduled posts."""
+        rows = self._connection().execute(
+            "SELECT post_id FROM already_confirmed_scheduled_posts WHERE seconds_since_epoch > ?",
+            (min_seconds_since_epoch,),
+        )
+        return [r[0] for r in rows]
+
+    def write_already_warned_scheduled_posts(self, posts: list[tuple[int, int]]) -> None:
+        """Writes (id, seconds_since_epoch) rows of warned scheduled posts in one transaction."""
+        with self._transaction() as db:
+            db.executemany(
+                "INSERT INTO already_warned_scheduled_posts VALUES (?, ?)", posts
+            )
+
+    def write_already_confirmed_scheduled_posts(
+        self, posts: list[tuple[int, int]]
+    ) -> None:
+        """Writes (post_id, seconds_since_epoch) rows of confirmed scheduled posts in one transaction."""
+        with self._transaction() as db:
+            db.executemany(
+                "INSERT INTO already_confirmed_scheduled_posts VALUES (?, ?)", posts
+            )
+
+    def write_to_logs(self, logs: list[tuple[datetime, str]]) -> None:
+        """Writes all logs to the database in one transaction."""
+        if not logs:
+            return
+        with self._transaction() as db:
+            db.executemany(
+                "INSERT INTO logs (log_time, log) VALUES (?, ?)",
+                [(log_time.strftime(LOG_TIME_FORMAT), log) for log_time, log in logs],
+            )
+
+    def _read_logs(
+        self, where: str, params: tuple[Any, ...], count: int
+    ) -> list[tuple[datetime, str]]:
+        """Reads the newest `count` logs matching `where`, newest first."""
+        rows = self._connection().execute(
+            f"SELECT log_time, log FROM logs WHERE {where} ORDER BY log_time DESC LIMIT ?",
+            (*params, count),
+        )
+        return [(datetime.fromisoformat(log_time), log) for log_time, log in rows]
+
+    def read_logs(
+        self, count: int = 10, before: Optional[datetime] = None
+    ) -> list[tuple[datetime, str]]:
+        """Reads logs to the database, only ones older than `before` if given."""
+        if before is not None:
+            return self._read_logs(
+                "log_time < ?", (before.strftime(LOG_TIME_FORMAT),), count
+            )
+        return self._read_logs("1", (), count)
+
+    def read_logs_matching(
+        self, search_string: str, count: int = 10, before: Optional[datetime] = None
+    ) -> list[tuple[datetime, str]]:
+        """Reads logs matching a search string from the database, only ones older than `before` if given."""
+        escaped = (
+            search_string.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        )
+        # LIKE is case-insensitive for ASCII, like postgres' ILIKE.
+        where = "log LIKE ? ESCAPE '\\'"
+        params: tuple[Any, ...] = (f"%{escaped}%",)
+        if before is not None:
+            where += " AND log_time < ?"
+            params += (before.strftime(LOG_TIME_FORMAT),)
+        return self._read_logs(where, params, count)
+
+    def maintain_log_partitions(self) -> tuple[list[str], list[str]]:
+        """
+        Deletes logs older than LOG_RETENTION_DAYS.
+
+        SQLite has no partitions, so nothing is ever created or dropped.
+        """
+        retention_cutoff = datetime.now() - timedelta(days=LOG_RETENTION_DAYS)
+        with self._transaction() as db:
+            db.execute(
+                "DELETE FROM logs WHERE log_time < ?",
+                (retention_cutoff.strftime(LOG_TIME_FORMAT),),
+            )
+        return [], []
+
+    def add_triflair(self, flair_to_add: str) -> None:
+        """Adds a triflair to the database."""
+        # NOTE: For legacy reasons, triflairs are called "dualflairs", same as postgres.
+        with self._transaction() as db:
+            db.execute("INSERT OR IGNORE INTO dualflairs VALUES (?)", (flair_to_add,))
+
+    def read_triflairs(self) -> list[str]:
+        """Reads all the triflair from the database."""
+        # Rows, same as Data.read_triflairs().
+        return self._connection().execute("SELECT dualflair FROM dualflairs").fetchall()
+
+    def yeet_triflair(self, flair_to_remove: str) -> None:
+        """Yeets a triflair out of the database."""
+        with self._transaction() as db:
+            db.execute("DELETE FROM dualflairs WHERE dualflair = ?", (flair_to_remove,))
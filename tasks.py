@@ -3,6 +3,7 @@ import json
 import random
 import asyncio
 import time
+from typing import Optional
 from google.oauth2 import service_account
 from googleapiclient.discovery import build
 import discord
@@ -13,7 +14,9 @@ import pytz
 import const_wasteland
 import global_settings
 import stdout
-from data_bridge import Data, Remindme
+from data_bridge import Remindme
+from remindme_scheduler import RemindmeScheduler
+from scheduled_post_tracker import ScheduledPostTracker
 
 
 class Task:
@@ -285,11 +288,11 @@ class Event:
 
 
 async def get_scheduled_posts(
-    already_warned_scheduled_posts: list[int] = [],
+    scheduled_post_tracker: Optional[ScheduledPostTracker] = None,
     days_ago: int = 5,
     thread_creation_channel=None,
 ) -> list[Event]:
-    """Returns a list of scheduled posts from the sub starting `days_ago`, ignoring posts already in already_warned_scheduled_posts."""
+    """Returns a list of scheduled posts from the sub starting `days_ago`, ignoring posts already warned in scheduled_post_tracker."""
     scheduled_posts = []
 
     if not global_settings.reddit_bridge:
@@ -303,7 +306,7 @@ async def get_scheduled_posts(
     )
 
     for log in logs:
-        if already_warned_scheduled_posts and log.id in already_warned_scheduled_posts:
+        if scheduled_post_tracker and scheduled_post_tracker.is_warned(log.id):
             continue
 
         # only take posts that have been made x days ago
@@ -328,18 +331,15 @@ async def get_scheduled_posts(
             )
             scheduled_posts.append(scheduled_event)
         except Exception as e:
-            # only send warnings if the caller provided a channel and a list to be filled out
+            # only send warnings if the caller provided a channel and a tracker to be filled out
             if (
-                already_warned_scheduled_posts is not None
+                scheduled_post_tracker is not None
                 and thread_creation_channel is not None
             ):
                 await thread_creation_channel.send(
                     f"Failed to parse scheduled post **{log.details}** {log.description}. Use `!logs db 10` to debug further."
                 )
-                already_warned_scheduled_posts.append(log.id)
-                Data.singleton().write_already_warned_scheduled_post(
-                    log.id, int(datetime.now().timestamp())
-                )
+                scheduled_post_tracker.mark_warned(log.id)
             global_settings.rleb_log_error(
                 f"Failed to handle get_scheduled_posts: {str(e)}"
             )
@@ -378,39 +378,26 @@ def get_weekly_events() -> list[Event]:
 async def task_alert_check(thread_creation_channel, client):
     """Check for missing scheduled posts and send alerts."""
 
-    # List of scheduled post ids that weren't misformatted and already warned.
-    one_week_ago_seconds_since_epoch = datetime.now().timestamp() - 7 * 86400
-    already_warned_scheduled_posts = (
-        Data.singleton().read_already_warned_scheduled_posts(
-            int(one_week_ago_seconds_since_epoch)
-        )
-    )
-
-    # List of scheduled post ids have already been confirmed to be scheduled.
-    already_confirmed_scheduled_posts = (
-        Data.singleton().read_already_confirmed_scheduled_posts(
-            int(one_week_ago_seconds_since_epoch)
-        )
-    )
+    # Scheduled post ids that were misformatted and already warned, or already confirmed
+    # to be scheduled. Synced with the db every cycle.
+    scheduled_post_tracker = ScheduledPostTracker.singleton()
 
     # List of (task_creator, timestamp) tuple of tasks that were already warned.
     already_warned_late_posts = []
     last_emptied_already_late_posts = datetime.now().timestamp()
 
-    # Every 10 cycles of loop, use the counter to enable enhanced logging.
-    counter = 0
-
     await asyncio.sleep(global_settings.task_alerts_startup_latency)
 
     while True:
         global_settings.asyncio_threads_heartbeats["task_alerts"] = datetime.now()
 
-        use_enhanced_logging = counter % 10 == 0
-        if use_enhanced_logging:
-            global_settings.rleb_log_info(
-                f"TASK CHECK: At {counter} cycles: enabled enhanced logging."
+        # Write last cycle's warnings and confirmations, then pick up other instances'.
+        try:
+            await scheduled_post_tracker.sync()
+        except Exception as e:
+            global_settings.rleb_log_error(
+                f"TASK CHECK: Failed to sync scheduled posts: {e}"
             )
-        counter += 1
 
         # Every 3 hours, empty the already warned posts list and rewarn the world.
         if (datetime.now().timestamp() - last_emptied_already_late_posts) > 60 * 60 * 3:
@@ -426,7 +413,7 @@ async def task_alert_check(thread_creation_channel, client):
                 asyncio.gather(
                     asyncio.to_thread(get_weekly_events),
                     get_scheduled_posts(
-                        already_warned_scheduled_posts,
+                        scheduled_post_tracker,
                         thread_creation_channel=thread_creation_channel,
                     ),
                     return_exceptions=True,
@@ -453,12 +440,13 @@ async def task_alert_check(thread_creation_channel, client):
             tasks = None
             new_scheduled_posts = None
 
-        if use_enhanced_logging:
-            tasks_num = len(tasks) if tasks else "0"
-            post_num = len(new_scheduled_posts) if new_scheduled_posts else "0"
-            global_settings.rleb_log_info(
-                f"TASK CHECK: Found {tasks_num} weekly tasks & {post_num} posts already scheduled."
-            )
+        # Debug logs are sampled, see global_settings.log_sampler.
+        global_settings.rleb_log_debug(
+            "TASK CHECK",
+            "Found {tasks_num} weekly tasks & {post_num} posts already scheduled.",
+            tasks_num=len(tasks) if tasks else 0,
+            post_num=len(new_scheduled_posts) if new_scheduled_posts else 0,
+        )
 
         # If the data was unobtainable, wait 5m and try again.
         if tasks == None or new_scheduled_posts == None:
@@ -479,10 +467,12 @@ async def task_alert_check(thread_creation_channel, client):
                     new_scheduled_posts,
                 )
             )
-            if use_enhanced_logging:
-                global_settings.rleb_log_info(
-                    f"TASK CHECK: Found {len(post_at_same_time)} tasks at the same time as {task.event_name}."
-                )
+            global_settings.rleb_log_debug(
+                "TASK CHECK",
+                "Found {count} tasks at the same time as {event_name}.",
+                count=len(post_at_same_time),
+                event_name=task.event_name,
+            )
 
             if len(post_at_same_time) == 0:
                 # todo, also try to compare task.event_name and posts that share a similar name
@@ -491,7 +481,7 @@ async def task_alert_check(thread_creation_channel, client):
             # Task is scheduled.
             else:
                 scheduled_post = post_at_same_time[0]
-                if scheduled_post.id not in already_confirmed_scheduled_posts:
+                if not scheduled_post_tracker.is_confirmed(scheduled_post.id):
                     global_settings.rleb_log_info(
                         f"TASK CHECK: Found new scheduled post: {task.event_name}."
                     )
@@ -503,7 +493,7 @@ async def task_alert_check(thread_creation_channel, client):
                     )
 
                     if updater != "" and updater != "No one needed":
-                        Data.singleton().write_remindme(
+                        await RemindmeScheduler.singleton().schedule(
                             user=updater,
                             message=f"**{task.event_name}** is starting now. Don't forget to set the post flair to LIVE.",
                             elapsed_time=time_until_alert,
@@ -513,17 +503,23 @@ async def task_alert_check(thread_creation_channel, client):
                     message = random.choice(global_settings.success_emojis)
                     message += f" Task is scheduled: **{task.event_name}** by {task.event_creator}.\nhttps://sh.reddit.com/mod/RocketLeagueEsports/scheduledposts/"
                     await thread_creation_channel.send(message)
-                    already_confirmed_scheduled_posts.append(scheduled_post.id)
-                    Data.singleton().write_already_warned_confirmed_post(
-                        scheduled_post.id, int(datetime.now().timestamp())
-                    )
+                    scheduled_post_tracker.mark_confirmed(scheduled_post.id)
 
-        # Warn for each unscheduled task.
-        if use_enhanced_logging:
-            global_settings.rleb_log_info(
-                f"TASK CHECK: Found {len(unscheduled_tasks)} unscheduled posts."
+        # Every confirmation from this cycle in one write.
+        try:
+            await scheduled_post_tracker.flush()
+        except Exception as e:
+            global_settings.rleb_log_error(
+                f"TASK CHECK: Failed to write scheduled posts: {e}"
             )
 
+        # Warn for each unscheduled task.
+        global_settings.rleb_log_debug(
+            "TASK CHECK",
+            "Found {count} unscheduled posts.",
+            count=len(unscheduled_tasks),
+        )
+
         for unscheduled_task in unscheduled_tasks:
             now = datetime.now().timestamp()
             seconds_remaining = unscheduled_task.event_seconds_since_epoch - now
@@ -535,10 +531,11 @@ async def task_alert_check(thread_creation_channel, client):
             ) in already_warned_late_posts:
                 continue
 
-            if use_enhanced_logging:
-                global_settings.rleb_log_info(
-                    f"TASK CHECK: Check if needs warning for unscheduled post: {unscheduled_task.event_name}."
-                )
+            global_settings.rleb_log_debug(
+                "TASK CHECK",
+                "Check if needs warning for unscheduled post: {event_name}.",
+                event_name=unscheduled_task.event_name,
+            )
 
             # Only warn about events that are 2 hours late or are due in 8 hours
             if (seconds_remaining < 60 * 60 * 8) and (seconds_remaining > -60 * 60 * 2):
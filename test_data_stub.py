@@ -9,12 +9,13 @@ Usage:
     Set DATA_MODE environment variable to "test" to use this stub with sample data.
     Set DATA_MODE to "stubbed" for empty stub.
     Set DATA_MODE to "real" for actual database.
+    Set DATA_MODE to "sqlite" for a local SQLite file (see sqlite_data.py).
 """
 
 from datetime import datetime
 from typing import Optional
 import time
-from data_bridge import DataStub, UserStatistics, Remindme, AutoUpdate
+from data_bridge import DataStub, UserStatistics, Remindme, AutoUpdate, QueryPage
 
 
 class DataStubWithSampleData(DataStub):
@@ -223,6 +224,9 @@ class DataStubWithSampleData(DataStub):
         if remindme_id in self._remindmes:
             del self._remindmes[remindme_id]
 
+    def read_remindme(self, remindme_id: int) -> Optional[Remindme]:
+        return self._remindmes.get(remindme_id)
+
     def read_remindmes(self) -> list[Remindme]:
         return list(self._remindmes.values())
 
@@ -250,6 +254,14 @@ class DataStubWithSampleData(DataStub):
         # In a real DB, would filter by timestamp
         return list(self._confirmed_posts)
 
+    def write_already_warned_scheduled_posts(self, posts: list[tuple[int, int]]) -> None:
+        self._warned_posts.update(log_id for log_id, _ in posts)
+
+    def write_already_confirmed_scheduled_posts(
+        self, posts: list[tuple[int, int]]
+    ) -> None:
+        self._confirmed_posts.update(log_id for log_id, _ in posts)
+
     # === Logging Methods ===
 
     def write_to_logs(self, logs: list[tuple[datetime, str]]) -> None:
@@ -258,8 +270,11 @@ class DataStubWithSampleData(DataStub):
         if len(self._logs) > 1000:
             self._logs = self._logs[-1000:]
 
-    def read_logs(self, count: int = 10) -> list[tuple[datetime, str]]:
-        return self._logs[-count:] if self._logs else []
+    def read_logs(
+        self, count: int = 10, before: Optional[datetime] = None
+    ) -> list[tuple[datetime, str]]:
+        logs = [log for log in self._logs if before is None or log[0] < before]
+        return logs[-count:] if logs else []
 
     # === Triflair Methods ===
 
@@ -280,9 +295,9 @@ class DataStubWithSampleData(DataStub):
         """Return count of 'tables' (data structures) in the stub."""
         return 8  # user_stats, aliases, auto_updates, remindmes, warned, confirmed, logs, triflairs
 
-    def yolo_query(self, sql: str) -> str:
+    def yolo_query(self, sql: str, session_key: str = "") -> QueryPage:
         """Return sample data for debugging."""
-        return f"STUB MODE: Would execute query: {sql[:100]}..."
+        return QueryPage(f"STUB MODE: Would execute query: {sql[:100]}...", 1, False)
 
     # === Additional Helper Methods ===
 
@@ -3,11 +3,27 @@ from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime
 import sys
 import os
+import threading
 import time
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
 
-from data_bridge import Data, DataStub, UserStatistics, Remindme, AutoUpdate
+import psycopg2
+import psycopg2.errors
+
+from data_bridge import (
+    AsyncData,
+    ConnectionPool,
+    Data,
+    DataCache,
+    DataStub,
+    QueryPage,
+    UserStatistics,
+    Remindme,
+    AutoUpdate,
+    YOLO_QUERY_SESSION_SECONDS,
+    YOLO_QUERY_TIMEOUT_MS,
+)
 
 
 class TestDataStub(unittest.TestCase):
@@ -22,7 +38,8 @@ class TestDataStub(unittest.TestCase):
 
     def test_yolo_query_returns_empty(self):
         stub = DataStub.singleton()
-        self.assertEqual(stub.yolo_query("SELECT * FROM test"), "")
+        self.assertEqual(stub.yolo_query("SELECT * FROM test"), QueryPage("", 1, False))
+        self.assertIsNone(stub.yolo_query_next())
 
     def test_get_db_tables_returns_zero(self):
         stub = DataStub.singleton()
@@ -70,6 +87,7 @@ class TestDataStub(unittest.TestCase):
         self.assertEqual(remindme.remindme_id, -1)
 
         stub.delete_remindme(1)
+        self.assertIsNone(stub.read_remindme(1))
 
     def test_scheduled_post_methods(self):
         stub = DataStub.singleton()
@@ -83,6 +101,7 @@ class TestDataStub(unittest.TestCase):
         stub = DataStub.singleton()
         stub.write_to_logs([(datetime.now(), "test log")])
         self.assertEqual(stub.read_logs(10), [])
+        self.assertEqual(stub.maintain_log_partitions(), ([], []))
 
     def test_triflair_methods(self):
         stub = DataStub.singleton()
@@ -90,11 +109,185 @@ class TestDataStub(unittest.TestCase):
         self.assertEqual(stub.read_triflairs(), [])
         stub.yeet_triflair("test_flair")
 
+    def test_pool_methods(self):
+        stub = DataStub.singleton()
+        self.assertEqual(stub.pool_stats(), {})
+        stub.close()
+
+
+class TestConnectionPool(unittest.TestCase):
+    def _mock_connection(self):
+        conn = Mock()
+        conn.__enter__ = Mock(return_value=conn)
+        conn.__exit__ = Mock(return_value=False)
+        return conn
+
+    def test_reuses_connections(self):
+        connect = Mock(side_effect=lambda: self._mock_connection())
+        pool = ConnectionPool(connect, min_size=1, max_size=2)
+
+        with pool.connection() as first:
+            pass
+        with pool.connection() as second:
+            pass
+
+        self.assertIs(first, second)
+        self.assertEqual(connect.call_count, 1)
+        self.assertEqual(pool.stats()["checkouts"], 2)
+        self.assertEqual(pool.stats()["idle"], 1)
+
+    def test_opens_up_to_max_size(self):
+        connect = Mock(side_effect=lambda: self._mock_connection())
+        pool = ConnectionPool(connect, min_size=0, max_size=2, checkout_timeout=0)
+
+        first = pool.checkout()
+        second = pool.checkout()
+        self.assertIsNot(first, second)
+        self.assertEqual(pool.stats()["in_use"], 2)
+
+        with self.assertRaises(RuntimeError):
+            pool.checkout()
+
+        pool.checkin(first)
+        self.assertIs(pool.checkout(), first)
+
+    def test_discards_broken_connections(self):
+        connect = Mock(side_effect=lambda: self._mock_connection())
+        pool = ConnectionPool(connect, min_size=1, max_size=2)
+
+        with self.assertRaises(psycopg2.OperationalError):
+            with pool.connection() as broken:
+                raise psycopg2.OperationalError("server closed the connection")
+
+        broken.close.assert_called_once()
+        self.assertEqual(pool.stats()["idle"], 0)
+        self.assertEqual(pool.stats()["discarded"], 1)
+
+        with pool.connection() as fresh:
+            self.assertIsNot(fresh, broken)
+
+    def test_health_checks_stale_connections(self):
+        stale = self._mock_connection()
+        stale.cursor.return_value.execute.side_effect = psycopg2.InterfaceError()
+        connect = Mock(side_effect=[stale, self._mock_connection()])
+        pool = ConnectionPool(connect, min_size=1, max_size=1, healthcheck_seconds=0)
+
+        connection = pool.checkout()
+
+        self.assertIsNot(connection, stale)
+        stale.close.assert_called_once()
+        self.assertEqual(connect.call_count, 2)
+
+    def test_slow_connect_does_not_block_other_checkouts(self):
+        connecting = threading.Event()
+        connected = threading.Event()
+        calls = []
+
+        def connect():
+            calls.append(1)
+            if len(calls) == 1:
+                # The first connect hangs until the rest of the test is done.
+                connecting.set()
+                connected.wait(5)
+            return self._mock_connection()
+
+        pool = ConnectionPool(connect, min_size=0, max_size=2, checkout_timeout=1)
+        thread = threading.Thread(target=pool.checkout)
+        thread.start()
+        connecting.wait(5)
+
+        # While one checkout is still connecting, others check in and out freely.
+        other = threading.Thread(
+            target=lambda: [pool.checkin(pool.checkout()) for _ in range(2)]
+        )
+        other.start()
+        other.join(1)
+        self.assertFalse(other.is_alive())
+        self.assertEqual(pool.stats()["in_use"], 1)
+        connected.set()
+        thread.join(5)
+        self.assertEqual(pool.stats()["created"], 2)
+
+    def test_failed_connect_frees_its_slot(self):
+        connect = Mock(side_effect=[psycopg2.OperationalError("down"), Mock()])
+        pool = ConnectionPool(connect, min_size=0, max_size=1, checkout_timeout=0)
+
+        with self.assertRaises(psycopg2.OperationalError):
+            pool.checkout()
+
+        self.assertEqual(pool.stats()["in_use"], 0)
+        self.assertIsNotNone(pool.checkout())
+
+    def test_close(self):
+        connect = Mock(side_effect=lambda: self._mock_connection())
+        pool = ConnectionPool(connect, min_size=2, max_size=2)
+        idle = [c for c, _ in pool._idle]
+
+        pool.close()
+
+        for conn in idle:
+            conn.close.assert_called_once()
+        with self.assertRaises(RuntimeError):
+            pool.checkout()
+
+
+class TestDataCache(unittest.TestCase):
+    def test_get_and_put(self):
+        cache = DataCache()
+        self.assertIs(cache.get("aliases"), DataCache.MISS)
+
+        cache.put("aliases", {"long": "short"})
+        cache.put("user_statistics", None, "user1")
+
+        self.assertEqual(cache.get("aliases"), {"long": "short"})
+        self.assertIsNone(cache.get("user_statistics", "user1"))
+        self.assertEqual(
+            cache.stats(),
+            {
+                "aliases": {"hits": 1, "misses": 1, "entries": 1},
+                "user_statistics": {"hits": 1, "misses": 0, "entries": 1},
+            },
+        )
+
+    @patch("data_bridge.time.time")
+    def test_entries_expire_per_table(self, mock_time):
+        mock_time.return_value = 1000.0
+        cache = DataCache()
+        cache.put("aliases", {})
+        cache.put("user_statistics", [])
+
+        mock_time.return_value = 1000.0 + DataCache.TTLS["user_statistics"] + 1
+        self.assertIs(cache.get("user_statistics"), DataCache.MISS)
+        self.assertEqual(cache.get("aliases"), {})
+        self.assertNotIn("user_statistics", cache)
+
+    def test_evicts_least_recently_used(self):
+        cache = DataCache(max_entries=2)
+        cache.put("user_statistics", 1, "a")
+        cache.put("user_statistics", 2, "b")
+        cache.get("user_statistics", "a")
+        cache.put("user_statistics", 3, "c")
+
+        self.assertEqual(cache.get("user_statistics", "a"), 1)
+        self.assertIs(cache.get("user_statistics", "b"), DataCache.MISS)
+        self.assertEqual(cache.get("user_statistics", "c"), 3)
+
+    def test_invalidate_drops_whole_table(self):
+        cache = DataCache()
+        cache.put("user_statistics", [])
+        cache.put("user_statistics", 1, "a")
+        cache.put("aliases", {})
+
+        cache.invalidate("user_statistics")
+
+        self.assertNotIn("user_statistics", cache)
+        self.assertIn("aliases", cache)
+
 
 class TestData(unittest.TestCase):
     def setUp(self):
         Data._singleton = None
-        Data._cache = {}
+        Data._cache = DataCache()
         self.original_data_mode = os.environ.get("DATA_MODE")
 
     def tearDown(self):
@@ -155,11 +348,34 @@ class TestData(unittest.TestCase):
         # since they differ between local (rleb_secrets) and CI (env vars)
         mock_connect.assert_called_once()
 
+    @patch("data_bridge.psycopg2.connect")
+    @patch.dict(os.environ, {"DATA_MODE": "real"})
+    def test_queries_share_pooled_connection(self, mock_connect):
+        mock_cursor = Mock()
+        mock_cursor.fetchone.return_value = (5,)
+        mock_conn = Mock()
+        mock_conn.cursor.return_value = mock_cursor
+        mock_conn.__enter__ = Mock(return_value=mock_conn)
+        mock_conn.__exit__ = Mock(return_value=False)
+        mock_connect.return_value = mock_conn
+
+        Data._singleton = None
+        data = Data.singleton()
+        data.get_db_tables()
+        data.get_db_tables()
+
+        mock_connect.assert_called_once()
+        self.assertEqual(data.pool_stats()["checkouts"], 2)
+
+        data.close()
+        mock_conn.close.assert_called_once()
+        self.assertEqual(data.pool_stats(), {})
+
     @patch("data_bridge.psycopg2.connect")
     @patch.dict(os.environ, {"DATA_MODE": "real"})
     def test_yolo_query_executes_sql(self, mock_connect):
         mock_cursor = Mock()
-        mock_cursor.fetchall.return_value = [("result1",), ("result2",)]
+        mock_cursor.fetchmany.return_value = [("result1",), ("result2",)]
         mock_conn = Mock()
         mock_conn.cursor.return_value = mock_cursor
         mock_conn.__enter__ = Mock(return_value=mock_conn)
@@ -170,12 +386,208 @@ class TestData(unittest.TestCase):
         data = Data.singleton()
         result = data.yolo_query("SELECT * FROM test")
 
-        self.assertIn("result1", result)
-        self.assertIn("result2", result)
-        # Verify both the read-only transaction and the actual query were executed
-        self.assertEqual(mock_cursor.execute.call_count, 2)
+        self.assertIn("result1", result.text)
+        self.assertIn("result2", result.text)
+        self.assertFalse(result.has_more)
+        # Verify the read-only transaction, timeouts and the actual query were executed
+        self.assertEqual(mock_cursor.execute.call_count, 4)
         mock_cursor.execute.assert_any_call("SET TRANSACTION READ ONLY;")
+        mock_cursor.execute.assert_any_call(
+            "SET LOCAL statement_timeout = %s;", (YOLO_QUERY_TIMEOUT_MS,)
+        )
+        mock_cursor.execute.assert_any_call(
+            "SET LOCAL idle_in_transaction_session_timeout = %s;",
+            (YOLO_QUERY_SESSION_SECONDS * 1000,),
+        )
         mock_cursor.execute.assert_any_call("SELECT * FROM test")
+        # The query streams from a named server-side cursor, closed once exhausted.
+        mock_conn.cursor.assert_any_call(name="yolo_query")
+        mock_conn.close.assert_called_once()
+
+    @patch("data_bridge.select.select")
+    @patch("data_bridge.psycopg2.connect")
+    @patch.dict(os.environ, {"DATA_MODE": "real"})
+    def test_wait_for_table_changes(self, mock_connect, mock_select):
+        mock_cursor = Mock()
+        mock_conn = Mock()
+        mock_conn.cursor.return_value = mock_cursor
+        mock_conn.notifies = []
+        mock_connect.return_value = mock_conn
+
+        Data._singleton = None
+        Data._cache = DataCache()
+        data = Data.singleton()
+
+        # Connecting the listener reports every table, since earlier changes were missed.
+        Data._cache.put("triflairs", [])
+        self.assertEqual(
+            data.wait_for_table_changes(5), {"aliases", "dualflairs", "auto_updates"}
+        )
+        mock_cursor.execute.assert_called_once_with("LISTEN rleb_table_changes;")
+        self.assertTrue(mock_conn.autocommit)
+        self.assertNotIn("triflairs", Data._cache)
+
+        # Nothing changed before the timeout.
+        self.assertEqual(data.wait_for_table_changes(5), set())
+        mock_select.assert_called_once_with([mock_conn], [], [], 5)
+
+        Data._cache.put("aliases", {})
+        Data._cache.put("triflairs", [])
+        mock_conn.poll.side_effect = lambda: mock_conn.notifies.extend(
+            [Mock(payload="aliases"), Mock(payload="aliases"), Mock(payload="other")]
+        )
+        self.assertEqual(data.wait_for_table_changes(5), {"aliases"})
+        self.assertNotIn("aliases", Data._cache)
+        self.assertIn("triflairs", Data._cache)
+        self.assertEqual(mock_conn.notifies, [])
+
+        data.close()
+        mock_conn.close.assert_called_once()
+
+    @patch("data_bridge.select.select")
+    @patch("data_bridge.psycopg2.connect")
+    @patch.dict(os.environ, {"DATA_MODE": "real"})
+    def test_wait_for_table_changes_reconnects(self, mock_connect, mock_select):
+        mock_conn = Mock()
+        mock_conn.notifies = []
+        mock_conn.poll.side_effect = psycopg2.OperationalError("server closed")
+        mock_connect.return_value = mock_conn
+
+        Data._singleton = None
+        data = Data.singleton()
+        data.wait_for_table_changes(5)
+
+        with self.assertRaises(psycopg2.OperationalError):
+            data.wait_for_table_changes(5)
+        mock_conn.close.assert_called_once()
+
+        self.assertEqual(
+            data.wait_for_table_changes(5), {"aliases", "dualflairs", "auto_updates"}
+        )
+        self.assertEqual(mock_connect.call_count, 2)
+
+    @patch("data_bridge.YOLO_QUERY_PAGE_SIZE", 2)
+    @patch("data_bridge.psycopg2.connect")
+    @patch.dict(os.environ, {"DATA_MODE": "real"})
+    def test_yolo_query_pages(self, mock_connect):
+        rows = iter([("r1",), ("r2",), ("r3",), ("r4",), ("r5",)])
+        mock_cursor = Mock()
+        mock_cursor.fetchmany.side_effect = lambda n: [
+            row for _, row in zip(range(n), rows)
+        ]
+        mock_conn = Mock()
+        mock_conn.cursor.return_value = mock_cursor
+        mock_connect.return_value = mock_conn
+
+        Data._singleton = None
+        data = Data.singleton()
+
+        self.assertEqual(
+            data.yolo_query("SELECT * FROM test", "channel"),
+            QueryPage("('r1',)\n('r2',)", 1, True),
+        )
+        # Only a page (plus one row of lookahead) is ever fetched at a time.
+        self.assertEqual([c[0][0] for c in mock_cursor.fetchmany.call_args_list], [3])
+        self.assertIsNone(data.yolo_query_next("other channel"))
+        self.assertEqual(
+            data.yolo_query_next("channel"), QueryPage("('r3',)\n('r4',)", 2, True)
+        )
+        mock_conn.close.assert_not_called()
+        self.assertEqual(
+            data.yolo_query_next("channel"), QueryPage("('r5',)", 3, False)
+        )
+        mock_conn.close.assert_called_once()
+        self.assertIsNone(data.yolo_query_next("channel"))
+
+    @patch("data_bridge.YOLO_QUERY_PAGE_SIZE", 1)
+    @patch("data_bridge.time.time")
+    @patch("data_bridge.psycopg2.connect")
+    @patch.dict(os.environ, {"DATA_MODE": "real"})
+    def test_yolo_query_expires_idle_sessions(self, mock_connect, mock_time):
+        mock_time.return_value = 1000.0
+        mock_cursor = Mock()
+        mock_cursor.fetchmany.return_value = [("r1",), ("r2",)]
+        mock_conn = Mock()
+        mock_conn.cursor.return_value = mock_cursor
+        mock_connect.return_value = mock_conn
+
+        Data._singleton = None
+        data = Data.singleton()
+        self.assertTrue(data.yolo_query("SELECT * FROM test").has_more)
+
+        mock_time.return_value = 1000.0 + YOLO_QUERY_SESSION_SECONDS
+        self.assertIsNone(data.yolo_query_next())
+        mock_conn.rollback.assert_called_once()
+        mock_conn.close.assert_called_once()
+
+    @patch("data_bridge.YOLO_QUERY_PAGE_SIZE", 1)
+    @patch("data_bridge.time.time")
+    @patch("data_bridge.psycopg2.connect")
+    @patch.dict(os.environ, {"DATA_MODE": "real"})
+    def test_close_expired_yolo_sessions(self, mock_connect, mock_time):
+        mock_time.return_value = 1000.0
+        mock_cursor = Mock()
+        mock_cursor.fetchmany.return_value = [("r1",), ("r2",)]
+        mock_conn = Mock()
+        mock_conn.cursor.return_value = mock_cursor
+        mock_connect.return_value = mock_conn
+
+        Data._singleton = None
+        data = Data.singleton()
+        data.yolo_query("SELECT * FROM test", "channel")
+
+        data.close_expired_yolo_sessions()
+        mock_conn.close.assert_not_called()
+
+        # Abandoned queries are closed without waiting for the next !sql.
+        mock_time.return_value = 1000.0 + YOLO_QUERY_SESSION_SECONDS
+        data.close_expired_yolo_sessions()
+        mock_conn.rollback.assert_called_once()
+        mock_conn.close.assert_called_once()
+
+    @patch("data_bridge.psycopg2.connect")
+    @patch.dict(os.environ, {"DATA_MODE": "real"})
+    def test_yolo_query_runs_without_session_lock(self, mock_connect):
+        Data._singleton = None
+        data = Data.singleton()
+        lock_held = []
+        mock_cursor = Mock()
+        mock_cursor.fetchmany.side_effect = lambda n: lock_held.append(
+            data._yolo_lock.locked()
+        ) or [("r1",)]
+        mock_conn = Mock()
+        mock_conn.cursor.return_value = mock_cursor
+        mock_connect.return_value = mock_conn
+
+        data.yolo_query("SELECT * FROM test", "channel")
+
+        # A slow query in one channel must not block !sql in the others.
+        self.assertEqual(lock_held, [False])
+
+    @patch("data_bridge.psycopg2.connect")
+    @patch.dict(os.environ, {"DATA_MODE": "real"})
+    def test_yolo_query_timeout_closes_session(self, mock_connect):
+        mock_cursor = Mock()
+        mock_cursor.execute.side_effect = [
+            None,
+            None,
+            None,
+            psycopg2.errors.QueryCanceled(
+                "canceling statement due to statement timeout"
+            ),
+        ]
+        mock_conn = Mock()
+        mock_conn.cursor.return_value = mock_cursor
+        mock_connect.return_value = mock_conn
+
+        Data._singleton = None
+        data = Data.singleton()
+        with self.assertRaises(ValueError) as context:
+            data.yolo_query("SELECT pg_sleep(60)")
+
+        self.assertIn("statement timeout", str(context.exception))
+        mock_conn.close.assert_called_once()
+        self.assertIsNone(data.yolo_query_next())
 
     @patch("data_bridge.psycopg2.connect")
     @patch.dict(os.environ, {"DATA_MODE": "real"})
@@ -251,7 +663,7 @@ class TestData(unittest.TestCase):
         mock_connect.return_value = mock_conn
 
         Data._singleton = None
-        Data._cache = {}
+        Data._cache = DataCache()
         data = Data.singleton()
         stats = data.read_all_user_statistics()
 
@@ -263,7 +675,8 @@ class TestData(unittest.TestCase):
     @patch.dict(os.environ, {"DATA_MODE": "real"})
     def test_read_all_user_statistics_uses_cache(self, mock_connect):
         Data._singleton = None
-        Data._cache = {"user_statistics": [UserStatistics("cached", 1, 1)]}
+        Data._cache = DataCache()
+        Data._cache.put("user_statistics", [UserStatistics("cached", 1, 1)])
         data = Data.singleton()
         stats = data.read_all_user_statistics()
 
@@ -283,7 +696,7 @@ class TestData(unittest.TestCase):
         mock_connect.return_value = mock_conn
 
         Data._singleton = None
-        Data._cache = {}
+        Data._cache = DataCache()
         data = Data.singleton()
         stat = data.read_user_statistics("nonexistent")
 
@@ -301,7 +714,7 @@ class TestData(unittest.TestCase):
         mock_connect.return_value = mock_conn
 
         Data._singleton = None
-        Data._cache = {}
+        Data._cache = DataCache()
         data = Data.singleton()
         stat = data.read_user_statistics("user1")
 
@@ -320,13 +733,23 @@ class TestData(unittest.TestCase):
         mock_connect.return_value = mock_conn
 
         Data._singleton = None
-        Data._cache = {"user_statistics": [], "user_statistics_test": Mock()}
+        Data._cache = DataCache()
+        Data._cache.put("user_statistics", [])
+        Data._cache.put("user_statistics", Mock(), "test")
         data = Data.singleton()
         data.increment_user_statistics_commands_used("test")
+        data.increment_user_statistics_commands_used("test")
+
+        # Increments are buffered until the next flush.
+        mock_cursor.execute.assert_not_called()
+        self.assertIn("user_statistics", Data._cache)
+
+        data.flush_user_statistics()
 
-        self.assertNotIn("user_statistics", Data._cache)
-        self.assertNotIn("user_statistics_test", Data._cache)
         mock_cursor.execute.assert_called_once()
+        self.assertEqual(mock_cursor.execute.call_args[0][1], ["test", 2, 0])
+        self.assertNotIn("user_statistics", Data._cache)
+        self.assertIs(Data._cache.get("user_statistics", "test"), DataCache.MISS)
 
     @patch("data_bridge.psycopg2.connect")
     @patch.dict(os.environ, {"DATA_MODE": "real"})
@@ -339,12 +762,93 @@ class TestData(unittest.TestCase):
         mock_connect.return_value = mock_conn
 
         Data._singleton = None
-        Data._cache = {}
+        Data._cache = DataCache()
         data = Data.singleton()
         data.increment_user_statistics_thanks_given("test")
+        data.increment_user_statistics_commands_used("other")
+        data.flush_user_statistics()
 
+        # Every buffered user is written by a single multi-row upsert.
+        mock_cursor.execute.assert_called_once()
+        self.assertEqual(
+            mock_cursor.execute.call_args[0][1], ["test", 0, 1, "other", 1, 0]
+        )
+
+        # Nothing left to write.
+        data.flush_user_statistics()
         mock_cursor.execute.assert_called_once()
 
+    @patch("data_bridge.psycopg2.connect")
+    @patch.dict(os.environ, {"DATA_MODE": "real"})
+    def test_reads_include_unflushed_user_statistics(self, mock_connect):
+        mock_cursor = Mock()
+        mock_cursor.fetchone.return_value = ("user1", 10, 5)
+        mock_cursor.fetchall.return_value = [("user1", 10, 5)]
+        mock_conn = Mock()
+        mock_conn.cursor.return_value = mock_cursor
+        mock_conn.__enter__ = Mock(return_value=mock_conn)
+        mock_conn.__exit__ = Mock(return_value=False)
+        mock_connect.return_value = mock_conn
+
+        Data._singleton = None
+        Data._cache = DataCache()
+        data = Data.singleton()
+        data.increment_user_statistics_commands_used("user1")
+        data.increment_user_statistics_thanks_given("user1")
+        data.increment_user_statistics_commands_used("user2")
+
+        stat = data.read_user_statistics("user1")
+        self.assertEqual(stat.commands_used, 11)  # type: ignore
+        self.assertEqual(stat.thanks_given, 6)  # type: ignore
+
+        stats = data.read_all_user_statistics()
+        self.assertEqual(
+            [(s.discord_username, s.commands_used, s.thanks_given) for s in stats],
+            [("user1", 11, 6), ("user2", 1, 0)],
+        )
+
+    @patch("data_bridge.psycopg2.connect")
+    @patch.dict(os.environ, {"DATA_MODE": "real"})
+    def test_failed_flush_keeps_user_statistics_buffered(self, mock_connect):
+        mock_cursor = Mock()
+        mock_cursor.execute.side_effect = [psycopg2.DatabaseError("boom"), None]
+        mock_conn = Mock()
+        mock_conn.cursor.return_value = mock_cursor
+        mock_conn.__enter__ = Mock(return_value=mock_conn)
+        mock_conn.__exit__ = Mock(return_value=False)
+        mock_connect.return_value = mock_conn
+
+        Data._singleton = None
+        Data._cache = DataCache()
+        data = Data.singleton()
+        data.increment_user_statistics_commands_used("test")
+
+        with self.assertRaises(psycopg2.DatabaseError):
+            data.flush_user_statistics()
+        data.increment_user_statistics_commands_used("test")
+        data.flush_user_statistics()
+
+        self.assertEqual(mock_cursor.execute.call_args[0][1], ["test", 2, 0])
+
+    @patch("data_bridge.psycopg2.connect")
+    @patch.dict(os.environ, {"DATA_MODE": "real"})
+    def test_close_flushes_user_statistics(self, mock_connect):
+        mock_cursor = Mock()
+        mock_conn = Mock()
+        mock_conn.cursor.return_value = mock_cursor
+        mock_conn.__enter__ = Mock(return_value=mock_conn)
+        mock_conn.__exit__ = Mock(return_value=False)
+        mock_connect.return_value = mock_conn
+
+        Data._singleton = None
+        Data._cache = DataCache()
+        data = Data.singleton()
+        data.increment_user_statistics_thanks_given("test")
+        data.close()
+
+        mock_cursor.execute.assert_called_once()
+        mock_conn.close.assert_called_once()
+
     @patch("data_bridge.psycopg2.connect")
     @patch.dict(os.environ, {"DATA_MODE": "real"})
     def test_add_alias(self, mock_connect):
@@ -356,7 +860,8 @@ class TestData(unittest.TestCase):
         mock_connect.return_value = mock_conn
 
         Data._singleton = None
-        Data._cache = {"aliases": {}}
+        Data._cache = DataCache()
+        Data._cache.put("aliases", {})
         data = Data.singleton()
         data.add_alias("long_name", "short")
 
@@ -374,11 +879,15 @@ class TestData(unittest.TestCase):
         mock_connect.return_value = mock_conn
 
         Data._singleton = None
-        Data._cache = {}
+        Data._cache = DataCache()
+        Data._cache.put("aliases", {"long_name": "short"})
         data = Data.singleton()
         data.remove_alias("long_name")
 
-        mock_cursor.execute.assert_called_once()
+        mock_cursor.execute.assert_called_once_with(
+            """DELETE FROM public.aliases WHERE long_name = %s;""", ("long_name",)
+        )
+        self.assertNotIn("aliases", Data._cache)
 
     @patch("data_bridge.psycopg2.connect")
     @patch.dict(os.environ, {"DATA_MODE": "real"})
@@ -392,7 +901,7 @@ class TestData(unittest.TestCase):
         mock_connect.return_value = mock_conn
 
         Data._singleton = None
-        Data._cache = {}
+        Data._cache = DataCache()
         data = Data.singleton()
         aliases = data.read_all_aliases()
 
@@ -592,6 +1101,26 @@ class TestData(unittest.TestCase):
         self.assertEqual(remindmes[0].trigger_timestamp, 12345)
         self.assertEqual(remindmes[0].channel_id, 1500)
 
+    @patch("data_bridge.psycopg2.connect")
+    @patch.dict(os.environ, {"DATA_MODE": "real"})
+    def test_read_remindme(self, mock_connect):
+        mock_cursor = Mock()
+        mock_cursor.fetchone.side_effect = [(1, "user1", "msg1", 12345, 1500), None]
+        mock_conn = Mock()
+        mock_conn.cursor.return_value = mock_cursor
+        mock_conn.__enter__ = Mock(return_value=mock_conn)
+        mock_conn.__exit__ = Mock(return_value=False)
+        mock_connect.return_value = mock_conn
+
+        Data._singleton = None
+        data = Data.singleton()
+
+        self.assertEqual(
+            data.read_remindme(1), Remindme(1, "user1", "msg1", 12345, 1500)
+        )
+        self.assertEqual(mock_cursor.execute.call_args[0][1], (1,))
+        self.assertIsNone(data.read_remindme(2))
+
     @patch("data_bridge.psycopg2.connect")
     @patch.dict(os.environ, {"DATA_MODE": "real"})
     def test_write_already_warned_scheduled_post(self, mock_connect):
@@ -658,6 +1187,26 @@ class TestData(unittest.TestCase):
 
         self.assertEqual(post_ids, [10, 20])
 
+    @patch("data_bridge.psycopg2.extras.execute_values")
+    @patch("data_bridge.psycopg2.connect")
+    @patch.dict(os.environ, {"DATA_MODE": "real"})
+    def test_write_scheduled_posts_in_one_insert(self, mock_connect, mock_execute_values):
+        mock_conn = Mock()
+        mock_conn.__enter__ = Mock(return_value=mock_conn)
+        mock_conn.__exit__ = Mock(return_value=False)
+        mock_connect.return_value = mock_conn
+
+        Data._singleton = None
+        data = Data.singleton()
+        data.write_already_confirmed_scheduled_posts([(1, 100), (2, 200)])
+        data.write_already_warned_scheduled_posts([])
+
+        mock_execute_values.assert_called_once()
+        self.assertIn(
+            "already_confirmed_scheduled_posts", mock_execute_values.call_args[0][1]
+        )
+        self.assertEqual(mock_execute_values.call_args[0][2], [(1, 100), (2, 200)])
+
     @patch("data_bridge.psycopg2.connect")
     @patch.dict(os.environ, {"DATA_MODE": "real"})
     def test_write_to_logs(self, mock_connect):
@@ -670,16 +1219,64 @@ class TestData(unittest.TestCase):
 
         Data._singleton = None
         data = Data.singleton()
-        data.write_to_logs([(datetime.now(), "log1"), (datetime.now(), "log2")])
+        data.write_to_logs(
+            [
+                (datetime(2026, 1, 2, 3, 4, 5), "log1"),
+                (datetime(2026, 1, 2, 3, 4, 6), "tab\there\nnewline \\ slash"),
+            ]
+        )
 
-        mock_cursor.executemany.assert_called_once()
+        mock_cursor.copy_expert.assert_called_once()
+        sql, buffer = mock_cursor.copy_expert.call_args[0]
+        self.assertEqual(sql, "COPY public.logs (log_time, log) FROM STDIN")
+        self.assertEqual(
+            buffer.getvalue(),
+            "2026-01-02T03:04:05\tlog1\n"
+            "2026-01-02T03:04:06\ttab\\there\\nnewline \\\\ slash\n",
+        )
+        mock_cursor.executemany.assert_not_called()
+
+    @patch("data_bridge.psycopg2.extras.execute_values")
+    @patch("data_bridge.psycopg2.connect")
+    @patch.dict(os.environ, {"DATA_MODE": "real"})
+    def test_write_to_logs_falls_back_to_insert(
+        self, mock_connect, mock_execute_values
+    ):
+        mock_cursor = Mock()
+        mock_cursor.copy_expert.side_effect = psycopg2.ProgrammingError("no COPY")
+        mock_conn = Mock()
+        mock_conn.cursor.return_value = mock_cursor
+        mock_conn.__enter__ = Mock(return_value=mock_conn)
+        mock_conn.__exit__ = Mock(return_value=False)
+        mock_connect.return_value = mock_conn
+
+        Data._singleton = None
+        data = Data.singleton()
+        logs = [(datetime.now(), "log1"), (datetime.now(), "log2")]
+        data.write_to_logs(logs)
+
+        mock_execute_values.assert_called_once_with(
+            mock_cursor,
+            "INSERT INTO public.logs (log_time, log) VALUES %s",
+            logs,
+            page_size=500,
+        )
+
+        # Nothing to write means no round trip at all.
+        mock_cursor.reset_mock()
+        data.write_to_logs([])
+        mock_cursor.copy_expert.assert_not_called()
 
     @patch("data_bridge.psycopg2.connect")
     @patch.dict(os.environ, {"DATA_MODE": "real"})
     def test_read_logs(self, mock_connect):
         now = datetime.now()
         mock_cursor = Mock()
-        mock_cursor.fetchall.return_value = [("log1", now), ("log2", now)]
+        # Recent partitions hold 2 logs, older partitions hold 1 more.
+        mock_cursor.fetchall.side_effect = [
+            [(now, "log1"), (now, "log2")],
+            [(now, "log3")],
+        ]
         mock_conn = Mock()
         mock_conn.cursor.return_value = mock_cursor
         mock_conn.__enter__ = Mock(return_value=mock_conn)
@@ -690,7 +1287,83 @@ class TestData(unittest.TestCase):
         data = Data.singleton()
         logs = data.read_logs(10)
 
+        self.assertEqual([log[1] for log in logs], ["log1", "log2", "log3"])
+        recent_query, older_query = mock_cursor.execute.call_args_list
+        self.assertIn("log_time >= %s", recent_query[0][0])
+        self.assertEqual(recent_query[0][1][1], 10)
+        self.assertIn("log_time < %s", older_query[0][0])
+        self.assertEqual(older_query[0][1][1], 8)
+
+    @patch("data_bridge.psycopg2.connect")
+    @patch.dict(os.environ, {"DATA_MODE": "real"})
+    def test_read_logs_matching_skips_old_partitions(self, mock_connect):
+        now = datetime.now()
+        mock_cursor = Mock()
+        mock_cursor.fetchall.return_value = [(now, "match1"), (now, "match2")]
+        mock_conn = Mock()
+        mock_conn.cursor.return_value = mock_cursor
+        mock_conn.__enter__ = Mock(return_value=mock_conn)
+        mock_conn.__exit__ = Mock(return_value=False)
+        mock_connect.return_value = mock_conn
+
+        Data._singleton = None
+        data = Data.singleton()
+        logs = data.read_logs_matching("match", 2)
+
         self.assertEqual(len(logs), 2)
+        mock_cursor.execute.assert_called_once()
+        self.assertEqual(mock_cursor.execute.call_args[0][1][0], "%match%")
+
+        mock_cursor.reset_mock()
+        data.read_logs_matching("match", 2, before=now)
+        self.assertIn("log_time < %s", mock_cursor.execute.call_args[0][0])
+        self.assertIn(now, mock_cursor.execute.call_args[0][1])
+
+    @patch("data_bridge.datetime")
+    @patch("data_bridge.psycopg2.connect")
+    @patch.dict(os.environ, {"DATA_MODE": "real"})
+    def test_maintain_log_partitions(self, mock_connect, mock_datetime):
+        mock_datetime.now.return_value = datetime(2026, 10, 17, 12, 0, 0)
+        mock_datetime.fromisoformat = datetime.fromisoformat
+        mock_datetime.side_effect = lambda *args: datetime(*args)
+        mock_cursor = Mock()
+        mock_cursor.fetchall.return_value = [
+            (
+                "logs_legacy",
+                "FOR VALUES FROM (MINVALUE) TO ('2025-11-01 00:00:00')",
+            ),
+            (
+                "logs_y2025m11",
+                "FOR VALUES FROM ('2025-11-01 00:00:00') TO ('2025-12-01 00:00:00')",
+            ),
+            (
+                "logs_y2026m10",
+                "FOR VALUES FROM ('2026-10-01 00:00:00') TO ('2026-11-01 00:00:00')",
+            ),
+            ("logs_default", "DEFAULT"),
+        ]
+        mock_conn = Mock()
+        mock_conn.cursor.return_value = mock_cursor
+        mock_conn.__enter__ = Mock(return_value=mock_conn)
+        mock_conn.__exit__ = Mock(return_value=False)
+        mock_connect.return_value = mock_conn
+
+        Data._singleton = None
+        data = Data.singleton()
+        with patch("data_bridge.LOG_RETENTION_DAYS", 180):
+            created, dropped = data.maintain_log_partitions()
+
+        self.assertEqual(dropped, ["logs_legacy", "logs_y2025m11"])
+        self.assertEqual(created, ["logs_y2026m11", "logs_y2026m12"])
+        # Logs that landed in the default partition are moved before attaching.
+        mock_cursor.execute.assert_any_call(
+            "WITH moved AS (DELETE FROM public.logs_default WHERE log_time >= %s AND log_time < %s RETURNING *) INSERT INTO public.logs_y2026m12 SELECT * FROM moved;",
+            (datetime(2026, 12, 1), datetime(2027, 1, 1)),
+        )
+        mock_cursor.execute.assert_any_call(
+            "ALTER TABLE public.logs ATTACH PARTITION public.logs_y2026m12 FOR VALUES FROM (%s) TO (%s);",
+            (datetime(2026, 12, 1), datetime(2027, 1, 1)),
+        )
 
     @patch("data_bridge.psycopg2.connect")
     @patch.dict(os.environ, {"DATA_MODE": "real"})
@@ -703,12 +1376,13 @@ class TestData(unittest.TestCase):
         mock_connect.return_value = mock_conn
 
         Data._singleton = None
-        Data._cache = {"triflair": []}
+        Data._cache = DataCache()
+        Data._cache.put("triflairs", [])
         data = Data.singleton()
         data.add_triflair("test_flair")
 
         mock_cursor.execute.assert_called_once()
-        self.assertNotIn("triflair", Data._cache)
+        self.assertNotIn("triflairs", Data._cache)
 
     @patch("data_bridge.psycopg2.connect")
     @patch.dict(os.environ, {"DATA_MODE": "real"})
@@ -722,12 +1396,57 @@ class TestData(unittest.TestCase):
         mock_connect.return_value = mock_conn
 
         Data._singleton = None
-        Data._cache = {}
+        Data._cache = DataCache()
         data = Data.singleton()
         flairs = data.read_triflairs()
 
         self.assertEqual(len(flairs), 2)
 
+    @patch("data_bridge.psycopg2.connect")
+    @patch.dict(os.environ, {"DATA_MODE": "real"})
+    def test_read_triflairs_uses_cache(self, mock_connect):
+        mock_cursor = Mock()
+        mock_cursor.fetchall.return_value = [("flair1",)]
+        mock_conn = Mock()
+        mock_conn.cursor.return_value = mock_cursor
+        mock_conn.__enter__ = Mock(return_value=mock_conn)
+        mock_conn.__exit__ = Mock(return_value=False)
+        mock_connect.return_value = mock_conn
+
+        Data._singleton = None
+        Data._cache = DataCache()
+        data = Data.singleton()
+        data.read_triflairs()
+        flairs = data.read_triflairs()
+
+        self.assertEqual(flairs, [("flair1",)])
+        mock_cursor.execute.assert_called_once()
+        self.assertEqual(data.cache_stats()["triflairs"]["hits"], 1)
+
+    @patch("data_bridge.psycopg2.connect")
+    @patch.dict(os.environ, {"DATA_MODE": "real"})
+    def test_read_user_statistics_populates_cache(self, mock_connect):
+        mock_cursor = Mock()
+        mock_cursor.fetchone.return_value = ("user1", 10, 5)
+        mock_conn = Mock()
+        mock_conn.cursor.return_value = mock_cursor
+        mock_conn.__enter__ = Mock(return_value=mock_conn)
+        mock_conn.__exit__ = Mock(return_value=False)
+        mock_connect.return_value = mock_conn
+
+        Data._singleton = None
+        Data._cache = DataCache()
+        data = Data.singleton()
+        data.read_user_statistics("user1")
+        stat = data.read_user_statistics("user1")
+
+        self.assertEqual(stat.commands_used, 10)  # type: ignore
+        mock_cursor.execute.assert_called_once()
+
+        data.increment_user_statistics_thanks_given("user1")
+        data.flush_user_statistics()
+        self.assertIs(Data._cache.get("user_statistics", "user1"), DataCache.MISS)
+
     @patch("data_bridge.psycopg2.connect")
     @patch.dict(os.environ, {"DATA_MODE": "real"})
     def test_yeet_triflair(self, mock_connect):
@@ -739,12 +1458,53 @@ class TestData(unittest.TestCase):
         mock_connect.return_value = mock_conn
 
         Data._singleton = None
-        Data._cache = {"triflair": []}
+        Data._cache = DataCache()
+        Data._cache.put("triflairs", [])
         data = Data.singleton()
         data.yeet_triflair("test_flair")
 
         mock_cursor.execute.assert_called_once()
-        self.assertNotIn("triflair", Data._cache)
+        self.assertNotIn("triflairs", Data._cache)
+
+
+class TestAsyncData(unittest.IsolatedAsyncioTestCase):
+    async def test_singleton(self):
+        self.assertIs(AsyncData.singleton(), AsyncData.singleton())
+        with self.assertRaises(RuntimeError):
+            AsyncData()
+
+    async def test_runs_queries_off_the_event_loop(self):
+        loop_thread = threading.get_ident()
+        query_threads = []
+
+        def read_all_aliases():
+            query_threads.append(threading.get_ident())
+            return {"long": "short"}
+
+        mock_data = Mock()
+        mock_data.read_all_aliases.side_effect = read_all_aliases
+        with patch("data_bridge.Data.singleton", return_value=mock_data):
+            aliases = await AsyncData.singleton().read_all_aliases()
+
+        self.assertEqual(aliases, {"long": "short"})
+        self.assertEqual(len(query_threads), 1)
+        self.assertNotEqual(query_threads[0], loop_thread)
+
+    async def test_forwards_arguments(self):
+        mock_data = Mock()
+        mock_data.write_remindme.return_value = Remindme(1, "user", "msg", 10, 5)
+        with patch("data_bridge.Data.singleton", return_value=mock_data):
+            remindme = await AsyncData.singleton().write_remindme("user", "msg", 10, 5)
+            await AsyncData.singleton().read_logs_matching("needle", 3)
+
+        self.assertEqual(remindme.remindme_id, 1)
+        mock_data.write_remindme.assert_called_once_with("user", "msg", 10, 5)
+        mock_data.read_logs_matching.assert_called_once_with("needle", 3, None)
+
+    async def test_stub_backend(self):
+        with patch("data_bridge.Data.singleton", return_value=DataStub.singleton()):
+            self.assertEqual(await AsyncData.singleton().read_remindmes(), [])
+            self.assertIsNone(await AsyncData.singleton().read_user_statistics("x"))
 
 
 if __name__ == "__main__":
@@ -277,6 +277,32 @@ class TestDiscord(unittest.IsolatedAsyncioTestCase):
             embed=self.mock_embedded_object
         )
 
+    async def test_failed_remindme_keeps_rest_of_batch_scheduled(self):
+        from data_bridge import AsyncData, Remindme
+        from remindme_scheduler import RemindmeScheduler
+
+        scheduler = RemindmeScheduler()
+        patch.object(RemindmeScheduler, "_singleton", scheduler).start()
+        self.addCleanup(patch.stopall)
+        scheduler.add(Remindme(1, "user", "first", 100, 1))
+        scheduler.add(Remindme(2, "user", "second", 200, 1))
+        self.discord_client.send_remindme = mock.AsyncMock()
+        delete_remindme = mock.AsyncMock(side_effect=[Exception("db down"), None, None])
+        patch.object(
+            AsyncData,
+            "singleton",
+            return_value=mock.Mock(delete_remindme=delete_remindme),
+        ).start()
+
+        with self.assertRaises(Exception):
+            await self.discord_client.send_due_remindmes()
+
+        # Neither reminder is lost until the next restart, both are retried.
+        self.assertEqual(len(scheduler), 2)
+        await self.discord_client.send_due_remindmes()
+        self.assertEqual([c.args[0] for c in delete_remindme.call_args_list], [1, 1, 2])
+        self.assertEqual(len(scheduler), 0)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,9 +1,10 @@
 # Dumb hack to be able to access source code files on both windows and linux
+import json
 import queue
 from threading import Thread
 import time
 import discord
-from data_bridge import Data, Remindme, DataStub
+from data_bridge import Data, QueryPage, Remindme, DataStub
 import unittest
 from unittest.mock import MagicMock
 import unittest.mock as mock
@@ -41,9 +42,10 @@ class TestDiscordCommands(unittest.IsolatedAsyncioTestCase):
     async def asyncSetUp(self):
         await super().asyncSetUp()
 
-        self.data_stub = mock.patch(
+        self.data_stub_patcher = mock.patch(
             "data_bridge.Data.singleton", return_value=DataStub.singleton()
-        ).start()
+        )
+        self.data_stub = self.data_stub_patcher.start()
 
         # Import discord_bridge after setUp is done so that rleb_settings loads with mocks/patches.
         global global_settings
@@ -86,7 +88,7 @@ class TestDiscordCommands(unittest.IsolatedAsyncioTestCase):
         from data_bridge import Data
 
         Data._singleton = None
-        self.data_stub.stop()
+        self.data_stub_patcher.stop()
 
     @mock.patch("global_settings.reddit_bridge.get_flair_census")
     async def test_census(self, mock_get_flair_census):
@@ -111,6 +113,36 @@ class TestDiscordCommands(unittest.IsolatedAsyncioTestCase):
             "Couldn't understand that. Make sure you are passing a :flair_code: and not an emoji 😭. You may have to disable Discord Nitro or auto emoji."
         )
 
+    @mock.patch("discord_bridge.stdout.print_to_channel")
+    async def test_sql_pages(self, mock_print_to_channel):
+        page = QueryPage("(1,)", 1, True)
+        with mock.patch.object(
+            DataStub, "yolo_query", return_value=page
+        ) as mock_yolo_query:
+            await self._send_message("!sql SELECT 1", from_staff_user=True)
+        mock_yolo_query.assert_called_once_with("SELECT 1", "1")
+        mock_print_to_channel.assert_awaited_once_with(
+            self.mock_channel,
+            "(1,)\n\nPage 1. Use `!sql next` for more results.",
+            title="SQL Query Results",
+            use_hook=False,
+        )
+
+        # No open query to page through.
+        await self._send_message("!sql next", from_staff_user=True)
+        self.mock_channel.send.assert_awaited_with(
+            "No query has more results. Use `!sql [query]` to run one."
+        )
+
+    async def test_status_json(self):
+        await self._send_message("!status json", from_staff_user=True)
+
+        attachment = self.mock_channel.send.call_args.kwargs["file"]
+        self.assertEqual(attachment.filename, "rleb_stats.json")
+        stats = json.loads(attachment.fp.read())
+        self.assertEqual(stats["data_backend"], "DataStub")
+        self.assertIn("operations", stats)
+
     async def test_remindme(self):
         global_settings.queues["alerts"] = queue.Queue()
 
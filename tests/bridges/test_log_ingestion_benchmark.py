@@ -0,0 +1,97 @@
+# Dumb hack to be able to access source code files on both windows and linux
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.realpath(__file__)) + "/..")
+
+import time
+import unittest
+from datetime import datetime, timedelta
+
+import psycopg2
+
+from data_bridge import _copy_logs, _insert_logs
+from migrations import apply_migrations
+
+# Sizes of memory_log bursts to time each strategy with.
+BATCH_SIZES = [10, 100, 1000]
+
+
+def _executemany_logs(cursor, logs):
+    """The original write_to_logs: one INSERT round trip per log."""
+    cursor.executemany(
+        "INSERT INTO public.logs (log_time, log) VALUES (%s, %s);", logs
+    )
+
+
+STRATEGIES = {
+    "executemany": _executemany_logs,
+    "values": _insert_logs,
+    "copy": _copy_logs,
+}
+
+
+def sample_logs(count: int) -> list[tuple[datetime, str]]:
+    now = datetime.now()
+    return [
+        (
+            now - timedelta(milliseconds=i),
+            f"INFO: [REDDIT]: stream {i} retrying\tafter error\nTraceback \\ line",
+        )
+        for i in range(count)
+    ]
+
+
+@unittest.skipUnless(
+    os.environ.get("TEST_DATABASE_URL"),
+    "Set TEST_DATABASE_URL to a disposable postgres db to benchmark log ingestion.",
+)
+class TestLogIngestionBenchmark(unittest.TestCase):
+    """Times executemany, multi-row VALUES and COPY writes of the same log bursts.
+
+    Run directly to print the timings:
+        TEST_DATABASE_URL=postgres://... python tests/bridges/test_log_ingestion_benchmark.py
+    """
+
+    def setUp(self):
+        self.connection = psycopg2.connect(os.environ["TEST_DATABASE_URL"])
+        apply_migrations(self.connection)
+
+    def tearDown(self):
+        # Benchmarked rows are never committed.
+        self.connection.rollback()
+        self.connection.close()
+
+    def test_strategies_write_identical_rows(self):
+        logs = sample_logs(50)
+        cursor = self.connection.cursor()
+        written = {}
+        for name, strategy in STRATEGIES.items():
+            cursor.execute("SAVEPOINT benchmark")
+            strategy(cursor, logs)
+            cursor.execute(
+                "SELECT log_time, log FROM public.logs WHERE log_time >= %s ORDER BY log_time",
+                (min(log_time for log_time, _ in logs),),
+            )
+            written[name] = cursor.fetchall()
+            cursor.execute("ROLLBACK TO SAVEPOINT benchmark")
+
+        self.assertEqual(written["values"], written["executemany"])
+        self.assertEqual(written["copy"], written["executemany"])
+
+    def test_benchmark(self):
+        cursor = self.connection.cursor()
+        for batch_size in BATCH_SIZES:
+            logs = sample_logs(batch_size)
+            timings = []
+            for name, strategy in STRATEGIES.items():
+                cursor.execute("SAVEPOINT benchmark")
+                start = time.perf_counter()
+                strategy(cursor, logs)
+                timings.append(f"{name}={(time.perf_counter() - start) * 1000:.1f}ms")
+                cursor.execute("ROLLBACK TO SAVEPOINT benchmark")
+            print(f"\n{batch_size} logs: {', '.join(timings)}")
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,180 @@
+# Dumb hack to be able to access source code files on both windows and linux
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.realpath(__file__)) + "/..")
+
+import json
+import unittest
+from unittest.mock import Mock, patch
+
+import psycopg2
+
+from data_bridge import LOG_RECENT_DAYS, Data, DataStub
+from migrations import MIGRATIONS, Migration, apply_migrations
+
+
+def mock_connection(applied_versions: list[int]) -> tuple[Mock, Mock]:
+    """Returns a mock connection whose schema_migrations table holds `applied_versions`."""
+    cursor = Mock()
+    cursor.fetchall.return_value = [(v,) for v in applied_versions]
+    cursor.fetchone.return_value = None
+    connection = Mock()
+    connection.cursor.return_value = cursor
+    connection.__enter__ = Mock(return_value=connection)
+    connection.__exit__ = Mock(return_value=False)
+    return connection, cursor
+
+
+class TestMigrations(unittest.TestCase):
+    def test_versions_are_unique_and_ordered(self):
+        versions = [m.version for m in MIGRATIONS]
+        self.assertEqual(versions, sorted(set(versions)))
+
+    def test_applies_pending_migrations_in_order(self):
+        connection, cursor = mock_connection(applied_versions=[1])
+        migrations = [
+            Migration(3, "third", ["SELECT 3"]),
+            Migration(1, "first", ["SELECT 1"]),
+            Migration(2, "second", ["SELECT 2a", "SELECT 2b"]),
+        ]
+
+        applied = apply_migrations(connection, migrations)
+
+        self.assertEqual(applied, [2, 3])
+        statements = [c[0][0] for c in cursor.execute.call_args_list]
+        self.assertNotIn("SELECT 1", statements)
+        self.assertLess(statements.index("SELECT 2b"), statements.index("SELECT 3"))
+        cursor.execute.assert_any_call(
+            "INSERT INTO public.schema_migrations (version, description) VALUES (%s, %s)",
+            (3, "third"),
+        )
+
+    def test_skips_migration_applied_by_another_instance(self):
+        connection, cursor = mock_connection(applied_versions=[])
+        # Recorded by the time the advisory lock was acquired.
+        cursor.fetchone.return_value = (1,)
+
+        applied = apply_migrations(connection, [Migration(1, "first", ["SELECT 1"])])
+
+        self.assertEqual(applied, [])
+        statements = [c[0][0] for c in cursor.execute.call_args_list]
+        self.assertNotIn("SELECT 1", statements)
+
+    @patch("data_bridge.psycopg2.connect")
+    @patch.dict(os.environ, {"DATA_MODE": "real"})
+    def test_data_migrate(self, mock_connect):
+        connection, _ = mock_connection(
+            applied_versions=[m.version for m in MIGRATIONS]
+        )
+        mock_connect.return_value = connection
+
+        Data._singleton = None
+        try:
+            self.assertEqual(Data.singleton().migrate(), [])
+        finally:
+            Data._singleton = None
+        connection.close.assert_called_once()
+
+    def test_data_stub_migrate(self):
+        self.assertEqual(DataStub.singleton().migrate(), [])
+
+
+# Hot queries from data_bridge, with the table each one must reach through an index.
+HOT_QUERIES = [
+    # Data._read_recent_logs_first() reads recent partitions first, then older ones.
+    (
+        "logs",
+        f"SELECT log_time, log FROM public.logs WHERE TRUE AND log_time >= now() - interval '{LOG_RECENT_DAYS} days' ORDER BY log_time DESC limit 10",
+    ),
+    (
+        "logs",
+        f"SELECT log_time, log FROM public.logs WHERE log ILIKE '%needle-42%' AND log_time >= now() - interval '{LOG_RECENT_DAYS} days' ORDER BY log_time DESC limit 10",
+    ),
+    (
+        "logs",
+        f"SELECT log_time, log FROM public.logs WHERE log ILIKE '%needle-42%' AND log_time < now() - interval '{LOG_RECENT_DAYS} days' ORDER BY log_time DESC limit 10",
+    ),
+    (
+        "already_warned_scheduled_posts",
+        "SELECT id FROM public.already_warned_scheduled_posts WHERE seconds_since_epoch > 19990",
+    ),
+    (
+        "already_confirmed_scheduled_posts",
+        "SELECT post_id FROM public.already_confirmed_scheduled_posts WHERE seconds_since_epoch > 19990",
+    ),
+    (
+        "auto_updates",
+        "SELECT * FROM public.auto_updates WHERE reddit_thread_url = 'https://reddit.com/r/42'",
+    ),
+    (
+        "user_statistics",
+        "SELECT * FROM public.user_statistics WHERE discord_user_name = 'user42'",
+    ),
+]
+
+SEED_STATEMENTS = [
+    # Spans about 70 days either side of now, so every logs partition holds rows.
+    """INSERT INTO public.logs (log_time, log)
+        SELECT now() + interval '70 days' - n * interval '10 minutes', 'log line needle-' || n
+        FROM generate_series(1, 20000) n""",
+    """INSERT INTO public.already_warned_scheduled_posts (id, seconds_since_epoch)
+        SELECT 'ModAction_' || n, n FROM generate_series(1, 20000) n""",
+    """INSERT INTO public.already_confirmed_scheduled_posts (post_id, seconds_since_epoch)
+        SELECT 'ModAction_' || n, n FROM generate_series(1, 20000) n""",
+    """INSERT INTO public.auto_updates (reddit_thread_url, liquipedia_url, thread_type, thread_options, seconds_since_epoch, day_number)
+        SELECT 'https://reddit.com/r/' || n, 'https://liquipedia.net/' || n, 'bracket', '', n, 1
+        FROM generate_series(1, 20000) n""",
+    """INSERT INTO public.user_statistics (discord_user_name, commands_used, thanks_given)
+        SELECT 'user' || n, n, n FROM generate_series(1, 20000) n""",
+]
+
+
+def seq_scanned_tables(plan: dict) -> list[str]:
+    """
+    Returns the relations read with a Seq Scan anywhere in an EXPLAIN (FORMAT JSON) plan.
+    Partitions of logs (logs_legacy, logs_yYYYYmMM, logs_default) are reported as logs.
+    """
+    tables = []
+    if plan.get("Node Type") == "Seq Scan":
+        relation = plan.get("Relation Name")
+        tables.append("logs" if relation.startswith("logs_") else relation)
+    for child in plan.get("Plans", []):
+        tables.extend(seq_scanned_tables(child))
+    return tables
+
+
+@unittest.skipUnless(
+    os.environ.get("TEST_DATABASE_URL"),
+    "Set TEST_DATABASE_URL to a disposable postgres db to check query plans.",
+)
+class TestQueryPlans(unittest.TestCase):
+    """Fails if a hot query seq scans a seeded table once migrations are applied."""
+
+    def setUp(self):
+        self.connection = psycopg2.connect(os.environ["TEST_DATABASE_URL"])
+        apply_migrations(self.connection)
+
+    def tearDown(self):
+        # Seeded rows are never committed.
+        self.connection.rollback()
+        self.connection.close()
+
+    def test_hot_queries_use_indexes(self):
+        cursor = self.connection.cursor()
+        for statement in SEED_STATEMENTS:
+            cursor.execute(statement)
+        for table, _ in HOT_QUERIES:
+            cursor.execute(f"ANALYZE public.{table}")
+
+        for table, query in HOT_QUERIES:
+            with self.subTest(query=query):
+                cursor.execute(f"EXPLAIN (FORMAT JSON) {query}")
+                explain = cursor.fetchone()[0]
+                if isinstance(explain, str):
+                    explain = json.loads(explain)
+                self.assertNotIn(table, seq_scanned_tables(explain[0]["Plan"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,221 @@
+# Dumb hack to be able to access source code files on both windows and linux
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.realpath(__file__)) + "/..")
+
+import tempfile
+import threading
+import time
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from data_bridge import YOLO_QUERY_SESSION_SECONDS, Data, DataCache
+from sqlite_data import SQLITE_MIGRATIONS, SqliteData
+
+
+class TestSqliteData(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "rleb.sqlite3")
+        self.data = SqliteData.__new__(SqliteData)
+        self.data._initialize(self.path)
+        self.data.migrate()
+
+    def tearDown(self):
+        self.data.close()
+        self.directory.cleanup()
+
+    def test_migrate_once(self):
+        self.assertEqual(self.data.migrate(), [])
+        self.assertEqual(
+            self.data._connection().execute("PRAGMA user_version").fetchone()[0],
+            SQLITE_MIGRATIONS[-1].version,
+        )
+        self.assertEqual(self.data.get_db_tables(), 8)
+
+    def test_wal_mode(self):
+        self.assertEqual(
+            self.data._connection().execute("PRAGMA journal_mode").fetchone()[0],
+            "wal",
+        )
+
+    def test_user_statistics_are_buffered_until_flush(self):
+        self.data.increment_user_statistics_commands_used("user")
+        self.data.increment_user_statistics_commands_used("user")
+        self.data.increment_user_statistics_thanks_given("other")
+        raw = "SELECT count(*) FROM user_statistics"
+        self.assertEqual(self.data._connection().execute(raw).fetchone()[0], 0)
+
+        stats = self.data.read_user_statistics("user")
+
+        self.assertEqual((stats.commands_used, stats.thanks_given), (2, 0))  # type: ignore
+        self.assertEqual(self.data._connection().execute(raw).fetchone()[0], 2)
+        self.data.increment_user_statistics_commands_used("user")
+        self.assertEqual(
+            {
+                s.discord_username: s.commands_used
+                for s in self.data.read_all_user_statistics()
+            },
+            {"user": 3, "other": 0},
+        )
+
+    def test_aliases_and_triflairs(self):
+        self.data.add_alias("Team Vitality", "VIT")
+        self.data.add_alias("Team BDS", "BDS")
+        self.data.remove_alias("Team BDS")
+        self.data.add_triflair(":NRG:")
+        self.data.add_triflair(":G2:")
+        self.data.yeet_triflair(":G2:")
+
+        self.assertEqual(self.data.read_all_aliases(), {"Team Vitality": "VIT"})
+        self.assertEqual(self.data.read_triflairs(), [(":NRG:",)])
+
+    def test_auto_updates(self):
+        auto_update = self.data.write_auto_update(
+            "https://reddit.com/r/1", "https://liquipedia.net/1#Day_1", "bracket", "", 1
+        )
+
+        self.assertEqual(auto_update.liquipedia_url, "https://liquipedia.net/1")
+        self.assertEqual(
+            self.data.read_auto_update_from_id(auto_update.auto_update_id), auto_update
+        )
+        self.assertEqual(
+            self.data.read_auto_update_from_reddit_thread("https://reddit.com/r/1"),
+            auto_update,
+        )
+        self.data.delete_auto_update(auto_update)
+        self.assertEqual(self.data.read_all_auto_updates(), [])
+
+    def test_remindmes(self):
+        remindme = self.data.write_remindme("user", "msg", 60, 1234)
+
+        self.assertEqual(self.data.read_remindme(remindme.remindme_id), remindme)
+        self.assertEqual(self.data.read_remindmes(), [remindme])
+        self.data.delete_remindme(remindme.remindme_id)
+        self.assertIsNone(self.data.read_remindme(remindme.remindme_id))
+
+    def test_scheduled_posts(self):
+        self.data.write_already_warned_scheduled_post("ModAction_old", 100)  # type: ignore
+        self.data.write_already_warned_scheduled_post("ModAction_new", 300)  # type: ignore
+        self.data.write_already_warned_confirmed_post("ModAction_new", 300)  # type: ignore
+        self.data.write_already_confirmed_scheduled_posts(
+            [("ModAction_a", 400), ("ModAction_b", 500)]  # type: ignore
+        )
+
+        self.assertEqual(
+            self.data.read_already_warned_scheduled_posts(200), ["ModAction_new"]
+        )
+        self.assertEqual(
+            self.data.read_already_confirmed_scheduled_posts(200),
+            ["ModAction_new", "ModAction_a", "ModAction_b"],
+        )
+
+    def test_logs_newest_first(self):
+        now = datetime.now().replace(microsecond=0)
+        self.data.write_to_logs(
+            [(now - timedelta(seconds=i), f"log {i} 100%") for i in range(5)]
+        )
+        self.data.write_to_logs([])
+
+        self.assertEqual(
+            self.data.read_logs(2),
+            [(now, "log 0 100%"), (now - timedelta(seconds=1), "log 1 100%")],
+        )
+        self.assertEqual(
+            self.data.read_logs_matching("LOG 3"),
+            [(now - timedelta(seconds=3), "log 3 100%")],
+        )
+        self.assertEqual(len(self.data.read_logs_matching("0%")), 5)
+        self.assertEqual(self.data.read_logs_matching("_"), [])
+        # Only logs older than `before`, e.g. the oldest log still in memory.
+        self.assertEqual(
+            self.data.read_logs(1, before=now - timedelta(seconds=2)),
+            [(now - timedelta(seconds=3), "log 3 100%")],
+        )
+        self.assertEqual(
+            len(self.data.read_logs_matching("log", before=now - timedelta(seconds=2))),
+            2,
+        )
+
+    def test_maintain_log_partitions_prunes_expired_logs(self):
+        now = datetime.now()
+        self.data.write_to_logs([(now - timedelta(days=1000), "old"), (now, "new")])
+
+        self.assertEqual(self.data.maintain_log_partitions(), ([], []))
+        self.assertEqual([log for _, log in self.data.read_logs()], ["new"])
+
+    def test_writes_from_many_threads(self):
+        def write_logs(thread):
+            for i in range(20):
+                self.data.write_to_logs([(datetime.now(), f"{thread} {i}")])
+
+        threads = [threading.Thread(target=write_logs, args=(t,)) for t in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(self.data.read_logs(100)), 80)
+
+    def test_yolo_query_pages(self):
+        self.data.write_to_logs([(datetime.now(), f"log {i}") for i in range(60)])
+
+        page = self.data.yolo_query("SELECT log FROM logs ORDER BY rowid", "channel")
+
+        self.assertEqual((page.page_number, page.has_more), (1, True))
+        self.assertEqual(page.text.splitlines()[0], "('log 0',)")
+        page = self.data.yolo_query_next("channel")
+        self.assertEqual((page.page_number, page.has_more), (2, False))  # type: ignore
+        self.assertEqual(len(page.text.splitlines()), 10)  # type: ignore
+        self.assertIsNone(self.data.yolo_query_next("channel"))
+
+    def test_close_expired_yolo_sessions(self):
+        self.data.write_to_logs([(datetime.now(), f"log {i}") for i in range(60)])
+        self.data.yolo_query("SELECT log FROM logs", "channel")
+
+        with patch(
+            "sqlite_data.time.time",
+            return_value=time.time() + YOLO_QUERY_SESSION_SECONDS,
+        ):
+            self.data.close_expired_yolo_sessions()
+
+        self.assertIsNone(self.data.yolo_query_next("channel"))
+
+    def test_yolo_query_is_read_only(self):
+        with self.assertRaises(ValueError):
+            self.data.yolo_query("PRAGMA user_version = 5")
+        with self.assertRaises(ValueError):
+            # Not caught by the denylist, the read-only connection refuses it.
+            self.data.yolo_query("REPLACE INTO aliases VALUES ('a', 'b')")
+        self.assertEqual(self.data.read_all_aliases(), {})
+
+    @patch("sqlite_data.YOLO_QUERY_TIMEOUT_MS", 1)
+    def test_yolo_query_timeout(self):
+        with self.assertRaisesRegex(ValueError, "longer than"):
+            self.data.yolo_query(
+                "WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n) SELECT count(*) FROM n"
+            )
+
+
+class TestSqliteDataMode(unittest.TestCase):
+    @patch.dict(os.environ, {"DATA_MODE": "sqlite"})
+    def test_data_singleton_uses_sqlite(self):
+        with tempfile.TemporaryDirectory() as directory:
+            Data._singleton = None
+            SqliteData._singleton = None
+            Data._cache = DataCache()
+            with patch("sqlite_data.SQLITE_PATH", os.path.join(directory, "db")):
+                try:
+                    data = Data.singleton()
+                    self.assertIsInstance(data, SqliteData)
+                    self.assertEqual(data.migrate(), [1])
+                    data.close()
+                finally:
+                    Data._singleton = None
+                    SqliteData._singleton = None
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,7 @@
 # Utilities that tests classes may need to share.
 
+from liqui.rate_limiter import TokenBucket
+
 
 class MockRequest:
     """Mock request class for stubbing requests.get()."""
@@ -9,6 +11,14 @@ class MockRequest:
         self.status_code = status_code
 
 
+def unlimited_rate_limits() -> dict[str, TokenBucket]:
+    """Liquipedia rate limit budgets that never wait, to patch over liqui_utils.RATE_LIMITS."""
+    return {
+        budget: TokenBucket(budget, capacity=1_000_000, refill_seconds=1e-6)
+        for budget in ("parse", "query")
+    }
+
+
 def page_id_query_from_url(liqui_url: str) -> str:
     """Takes a liquipedia url and returns an api query to get the url's id."""
     liquipedia_url = (
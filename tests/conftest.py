@@ -16,3 +16,25 @@ def pytest_configure(config):
 def test_data_dir():
     """Return the path to test data directory."""
     return os.path.join(os.path.dirname(__file__), "data")
+
+
+@pytest.fixture(autouse=True)
+def no_log_archive(monkeypatch):
+    """Keeps logs from tests out of the LOG_ARCHIVE_DIR archive."""
+    import log_archive
+    from log_shipper import LogShipper
+
+    monkeypatch.setattr(log_archive, "LOG_ARCHIVE_DIR", None)
+    monkeypatch.setattr(log_archive.LogArchive, "_singleton", None)
+    monkeypatch.setattr(LogShipper, "_singleton", None)
+
+
+@pytest.fixture(autouse=True)
+def memory_only_liqui_caches(monkeypatch):
+    """Keeps fixture pages out of the LIQUIPEDIA_CACHE_DIR caches."""
+    from liqui import page_content_cache, page_id_cache
+
+    monkeypatch.setattr(page_id_cache, "LIQUIPEDIA_CACHE_DIR", None)
+    monkeypatch.setattr(page_content_cache, "LIQUIPEDIA_CACHE_DIR", None)
+    monkeypatch.setattr(page_id_cache.PageIdCache, "_singleton", None)
+    monkeypatch.setattr(page_content_cache.PageContentCache, "_singleton", None)
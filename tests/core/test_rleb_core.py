@@ -89,6 +89,19 @@ class TestRLEBCore(unittest.TestCase):
         # Verify discord bridge is started
         self.discord_bridge_patch.start.assert_called_once()
 
+    def test_start_survives_db_outage(self):
+        """Test that start() still starts the bot when migrations can't reach the db."""
+        with patch('rleb_core.Data') as data_patch, patch(
+            'rleb_core.rleb_log_error'
+        ) as log_error_patch:
+            data_patch.singleton.return_value.migrate.side_effect = Exception(
+                "connection refused"
+            )
+            rleb_core.start()
+
+        log_error_patch.assert_called_once()
+        self.discord_bridge_patch.start.assert_called_once()
+
     def test_start_execution_order(self):
         """Test that start() executes steps in the correct order."""
         call_order = []
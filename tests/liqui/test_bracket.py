@@ -12,6 +12,7 @@ import requests
 sys.path.append(os.path.dirname(os.path.realpath(__file__)) + "/../..")
 
 from data_bridge import Data
+from liqui import liqui_utils
 
 
 class TestBracketLookup(unittest.IsolatedAsyncioTestCase):
@@ -54,12 +55,16 @@ class TestBracketLookup(unittest.IsolatedAsyncioTestCase):
                     status_code=self.forced_status_code,
                 )
 
-        self.mock_requests_get = patch.object(requests, "get", new=mock_request).start()
+        self.mock_requests_get = patch.object(
+            liqui_utils, "http_get", new=mock_request
+        ).start()
         self.mock_requests_post = patch.object(
             requests, "post", new=mock_request
         ).start()
-        self.addCleanup(self.mock_requests_get)
-        self.addCleanup(self.mock_requests_post)
+        patch.dict(
+            liqui_utils.RATE_LIMITS, common_utils.unlimited_rate_limits()
+        ).start()
+        self.addCleanup(patch.stopall)
 
     async def test_bracket(self):
         mock_channel = mock.Mock(spec=discord.TextChannel)
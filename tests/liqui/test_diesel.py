@@ -9,13 +9,12 @@ import unittest.mock as mock
 from unittest.mock import patch, AsyncMock
 import discord
 
-from liqui import diesel
+from liqui import diesel, liqui_utils
 from liqui.liqui_utils import string_to_base64
 
 from data_bridge import Data
 
 from ..common import common_utils
-import requests
 
 
 class TestDiesel(unittest.IsolatedAsyncioTestCase):
@@ -33,7 +32,7 @@ class TestDiesel(unittest.IsolatedAsyncioTestCase):
             "NRG_Esports": "NRG",
         }
 
-        # Mock requests.get to return valid base64-encoded responses
+        # Mock liqui_utils.http_get to return valid base64-encoded responses
         def mock_diesel_request(url, *args, **kwargs):
             class MockResponse:
                 def __init__(self, content, status_code=200):
@@ -96,7 +95,7 @@ class TestDiesel(unittest.IsolatedAsyncioTestCase):
             return MockResponse("")
 
         self.mock_diesel_requests = patch.object(
-            requests, "get", side_effect=mock_diesel_request
+            liqui_utils, "http_get", side_effect=mock_diesel_request
         ).start()
         self.addCleanup(self.mock_diesel_requests.stop)
 
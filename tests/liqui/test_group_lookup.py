@@ -13,6 +13,7 @@ import requests
 import discord
 
 from data_bridge import Data
+from liqui import liqui_utils
 
 
 class MockRequest:
@@ -62,12 +63,16 @@ class TestGroupLookup(unittest.IsolatedAsyncioTestCase):
                     status_code=self.forced_status_code,
                 )
 
-        self.mock_requests_get = patch.object(requests, "get", new=mock_request).start()
+        self.mock_requests_get = patch.object(
+            liqui_utils, "http_get", new=mock_request
+        ).start()
         self.mock_requests_post = patch.object(
             requests, "post", new=mock_request
         ).start()
-        self.addCleanup(self.mock_requests_get)
-        self.addCleanup(self.mock_requests_post)
+        patch.dict(
+            liqui_utils.RATE_LIMITS, common_utils.unlimited_rate_limits()
+        ).start()
+        self.addCleanup(patch.stopall)
 
     async def skip_test_group_lookup(self):
         mock_channel = mock.Mock(spec=discord.TextChannel)
@@ -89,7 +94,9 @@ class TestGroupLookup(unittest.IsolatedAsyncioTestCase):
             return None
 
         bad_url = "bad url"
-        mock_request = patch.object(requests, "get", new=mock_liquipedia).start()
+        mock_request = patch.object(
+            liqui_utils, "http_get", new=mock_liquipedia
+        ).start()
         self.addCleanup(mock_request)
 
         mock_channel = mock.Mock(spec=discord.TextChannel)
@@ -0,0 +1,412 @@
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.realpath(__file__)) + "/../..")
+
+import asyncio
+import json
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+import requests
+
+from instrumentation import Instrumentation
+from liqui import liqui_utils
+from liqui.liquipedia_page import LiquipediaPage
+from liqui.page_content_cache import PageContentCache
+from liqui.page_id_cache import PageIdCache, normalize_page_title
+from liqui.rate_limiter import TokenBucket
+from ..common import common_utils
+
+BRACKET_URL = "https://liquipedia.net/rocketleague/Rocket_League_Championship_Series/2021-22/Winter"
+# Revision the bracket page mock was parsed from.
+BRACKET_REVID = 1094950
+
+
+# When the bracket page mock was last re-rendered.
+BRACKET_TOUCHED = "2022-04-03T20:42:18Z"
+
+
+def revision_probe(pageid: str) -> str:
+    return f"https://liquipedia.net/rocketleague/api.php?action=query&format=json&prop=info&pageids={pageid}"
+
+
+def revision_probe_response(
+    pageid: str, revid: int, touched: str = BRACKET_TOUCHED
+) -> str:
+    return json.dumps(
+        {
+            "query": {
+                "pages": {
+                    pageid: {
+                        "pageid": int(pageid),
+                        "lastrevid": revid,
+                        "touched": touched,
+                    }
+                }
+            }
+        }
+    )
+
+
+class TestLiquiUtils(unittest.TestCase):
+    def setUp(self):
+        PageIdCache._singleton = PageIdCache()
+        PageContentCache._singleton = PageContentCache()
+        self.requests = []
+        self.responses = dict(common_utils.common_proxies)
+
+        def fake_get(url):
+            self.requests.append(url)
+            response = self.responses[url]
+            if response.startswith("{"):
+                return common_utils.MockRequest(response)
+            with open(response, encoding="utf8") as f:
+                return common_utils.MockRequest(f.read())
+
+        patcher = patch.object(liqui_utils, "http_get", side_effect=fake_get)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = patch.dict(
+            liqui_utils.RATE_LIMITS, common_utils.unlimited_rate_limits()
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        PageIdCache._singleton = None
+        PageContentCache._singleton = None
+
+    def test_unchanged_page_is_only_probed(self):
+        self.responses[revision_probe("113085")] = revision_probe_response(
+            "113085", BRACKET_REVID
+        )
+
+        html = asyncio.run(liqui_utils.load_page_html(BRACKET_URL))
+        cached_html = asyncio.run(liqui_utils.load_page_html(BRACKET_URL + "/"))
+
+        self.assertEqual(cached_html, html)
+        self.assertEqual(
+            self.requests,
+            [
+                common_utils.page_id_query_from_url(BRACKET_URL),
+                revision_probe("113085"),
+                common_utils.page_content_from_id("113085"),
+                revision_probe("113085"),
+            ],
+        )
+
+    def test_edited_page_is_fetched_again(self):
+        self.responses[revision_probe("113085")] = revision_probe_response(
+            "113085", BRACKET_REVID
+        )
+        asyncio.run(liqui_utils.load_page_html(BRACKET_URL))
+        self.responses[revision_probe("113085")] = revision_probe_response(
+            "113085", BRACKET_REVID + 1
+        )
+        asyncio.run(liqui_utils.load_page_html(BRACKET_URL))
+
+        self.assertEqual(
+            self.requests[1:],
+            [
+                revision_probe("113085"),
+                common_utils.page_content_from_id("113085"),
+                revision_probe("113085"),
+                common_utils.page_content_from_id("113085"),
+            ],
+        )
+
+    def test_rerendered_page_is_fetched_again(self):
+        self.responses[revision_probe("113085")] = revision_probe_response(
+            "113085", BRACKET_REVID
+        )
+        asyncio.run(liqui_utils.load_page_html(BRACKET_URL))
+        # A template the page uses was edited, so the page re-rendered without a new revid.
+        self.responses[revision_probe("113085")] = revision_probe_response(
+            "113085", BRACKET_REVID, touched="2022-04-04T09:00:00Z"
+        )
+        asyncio.run(liqui_utils.load_page_html(BRACKET_URL))
+
+        self.assertEqual(
+            self.requests[-2:],
+            [revision_probe("113085"), common_utils.page_content_from_id("113085")],
+        )
+
+    def test_failed_probe_falls_back_to_fetch(self):
+        self.responses[revision_probe("113085")] = revision_probe_response(
+            "113085", BRACKET_REVID
+        )
+        asyncio.run(liqui_utils.load_page_html(BRACKET_URL))
+        del self.responses[revision_probe("113085")]
+        # No probe response, so the probe raises.
+        html = asyncio.run(liqui_utils.load_page_html(BRACKET_URL))
+
+        self.assertTrue(len(html) > 0)
+        self.assertEqual(self.requests[-1], common_utils.page_content_from_id("113085"))
+
+    def test_missing_page_invalidates_cached_id(self):
+        PageIdCache.singleton().put(
+            "Rocket_League_Championship_Series/2021-22/Winter", "999"
+        )
+        self.responses[common_utils.page_content_from_id("999")] = json.dumps(
+            {"error": {"code": "nosuchpageid", "info": "There is no page with ID 999."}}
+        )
+
+        content = asyncio.run(liqui_utils.load_page_html(BRACKET_URL))
+
+        self.assertTrue(len(content) > 0)
+        # Probe and content of the stale id, then the fresh id and its content.
+        self.assertEqual(len(self.requests), 4)
+        self.assertEqual(
+            PageIdCache.singleton().get(
+                "Rocket_League_Championship_Series/2021-22/Winter"
+            ),
+            "113085",
+        )
+
+
+class TestHttpSession(unittest.TestCase):
+    def setUp(self):
+        PageIdCache._singleton = PageIdCache()
+        PageContentCache._singleton = PageContentCache()
+        self.rate_limits = {
+            "parse": TokenBucket("parse", capacity=2, refill_seconds=30),
+            "query": TokenBucket("query", capacity=5, refill_seconds=2),
+        }
+        patcher = patch.dict(liqui_utils.RATE_LIMITS, self.rate_limits)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        PageIdCache._singleton = None
+        PageContentCache._singleton = None
+
+    def test_session_is_shared_and_pooled(self):
+        session = liqui_utils.http_session()
+
+        self.assertIs(liqui_utils.http_session(), session)
+        self.assertEqual(session.headers["Accept-Encoding"], "gzip")
+        adapter = session.get_adapter("https://liquipedia.net/rocketleague/api.php")
+        self.assertEqual(adapter._pool_maxsize, liqui_utils.HTTP_POOL_SIZE)
+
+    def test_page_fetches_reuse_session_with_timeout(self):
+        def fake_get(session, request, timeout=None):
+            if request == revision_probe("113085"):
+                return common_utils.MockRequest(
+                    revision_probe_response("113085", BRACKET_REVID)
+                )
+            with open(common_utils.common_proxies[request], encoding="utf8") as f:
+                return common_utils.MockRequest(f.read())
+
+        with patch.object(
+            requests.Session, "get", autospec=True, side_effect=fake_get
+        ) as session_get:
+            content = asyncio.run(liqui_utils.load_page_html(BRACKET_URL))
+
+        self.assertTrue(len(content) > 0)
+        # Page id, version probe and page content.
+        self.assertEqual(session_get.call_count, 3)
+        self.assertEqual(
+            {c.args[0] for c in session_get.call_args_list},
+            {liqui_utils.http_session()},
+        )
+        self.assertEqual(
+            session_get.call_args.kwargs["timeout"], liqui_utils.HTTP_TIMEOUT_SECONDS
+        )
+
+    def test_liquipedia_requests_are_rate_limited_by_budget(self):
+        with patch.object(liqui_utils, "_get_json", return_value={}), patch.object(
+            TokenBucket, "acquire", autospec=True, return_value=0.0
+        ) as acquire:
+            asyncio.run(liqui_utils.liquipedia_get_json(revision_probe("123")))
+            asyncio.run(
+                liqui_utils.liquipedia_get_json(
+                    common_utils.page_content_from_id("123")
+                )
+            )
+
+        self.assertEqual(
+            [c.args[0] for c in acquire.call_args_list],
+            [self.rate_limits["query"], self.rate_limits["parse"]],
+        )
+
+
+class TestAsyncFetch(unittest.IsolatedAsyncioTestCase):
+    async def test_event_loop_runs_during_fetch_and_parse(self):
+        async def slow_page(url):
+            await liqui_utils.run_in_worker(time.sleep, 0.2)
+            return "<div class='teamcard'>G2</div>"
+
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticker = asyncio.create_task(tick())
+        with patch.object(liqui_utils, "load_page_html", side_effect=slow_page):
+            page = await liqui_utils.fetch_page(BRACKET_URL)
+        ticker.cancel()
+
+        self.assertEqual(page.soup.select("div.teamcard")[0].text, "G2")
+        self.assertGreater(ticks, 5)
+
+    async def test_concurrent_fetches_of_a_page_share_one_fetch(self):
+        async def slow_page(url):
+            await asyncio.sleep(0.1)
+            return "<div>bracket</div>"
+
+        with patch.object(
+            liqui_utils, "load_page_html", side_effect=slow_page
+        ) as get_page:
+            pages = await asyncio.gather(
+                liqui_utils.fetch_page_html(BRACKET_URL),
+                liqui_utils.fetch_page_html(BRACKET_URL + "#Playoffs"),
+                liqui_utils.fetch_page_html(BRACKET_URL.replace("Winter", "Fall")),
+            )
+
+        self.assertEqual(pages, ["<div>bracket</div>"] * 3)
+        self.assertEqual(get_page.call_count, 2)
+        self.assertEqual(liqui_utils._in_flight, {})
+
+    async def test_lookups_share_one_parse_per_revision(self):
+        Instrumentation._singleton = Instrumentation()
+        self.addCleanup(setattr, Instrumentation, "_singleton", None)
+        patcher = patch.dict(liqui_utils._parsed_pages, clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        revisions = [
+            "<div class='teamcard'>G2</div>",
+            "<div class='teamcard'>NRG</div>",
+        ]
+
+        async def latest_revision(url):
+            return revisions[0]
+
+        with patch.object(liqui_utils, "load_page_html", side_effect=latest_revision):
+            first, second = await asyncio.gather(
+                liqui_utils.fetch_page(BRACKET_URL),
+                liqui_utils.fetch_page(BRACKET_URL),
+            )
+            third = await liqui_utils.fetch_page(BRACKET_URL + "/")
+            revisions.pop(0)
+            edited = await liqui_utils.fetch_page(BRACKET_URL)
+
+        self.assertIs(first, second)
+        self.assertIs(first, third)
+        self.assertIsNot(first, edited)
+        self.assertEqual(edited.soup.text, "NRG")
+        self.assertEqual(
+            Instrumentation.singleton().snapshot()["liqui.parse"]["calls"], 2
+        )
+
+    async def test_sections_are_extracted_off_the_event_loop(self):
+        patcher = patch.dict(liqui_utils._parsed_pages, clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        loop_thread = threading.get_ident()
+        extracted_on = []
+        extract = LiquipediaPage.extract
+
+        def record_thread(page, sections):
+            extracted_on.append(threading.get_ident())
+            extract(page, sections)
+
+        async def page_html(url):
+            return "<div class='teamcard'><b><a href='/rl/G2'>G2</a></b></div>"
+
+        with patch.object(
+            liqui_utils, "load_page_html", side_effect=page_html
+        ), patch.object(LiquipediaPage, "extract", record_thread):
+            page = await liqui_utils.fetch_page(BRACKET_URL, ("teams", "prize_rows"))
+
+        self.assertNotIn(loop_thread, extracted_on)
+        # Handlers only read the cached plain data.
+        self.assertEqual(page.__dict__["teams"][0].name, "G2")
+        # A failed section raises where it's read, not in fetch_page().
+        with self.assertRaises(IndexError):
+            page.prize_rows
+
+    async def test_pages_can_be_parsed_with_another_parser(self):
+        patcher = patch.dict(liqui_utils._parsed_pages, clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        async def page_html(url):
+            return "<div class='teamcard'>G2</div>"
+
+        with patch.object(liqui_utils, "load_page_html", side_effect=page_html):
+            default = await liqui_utils.fetch_page(BRACKET_URL)
+            lxml = await liqui_utils.fetch_page(BRACKET_URL, features="lxml")
+            lxml_again = await liqui_utils.fetch_page(BRACKET_URL, features="lxml")
+
+        self.assertEqual(default.features, "html.parser")
+        self.assertEqual(lxml.features, "lxml")
+        self.assertIs(lxml, lxml_again)
+        self.assertIs(default.parsed_with("lxml"), lxml)
+        self.assertEqual(lxml.soup.select("div.teamcard")[0].text, "G2")
+
+    async def test_rate_limit_waits_do_not_hold_workers(self):
+        rate_limits = common_utils.unlimited_rate_limits()
+        rate_limits["parse"] = TokenBucket("parse", capacity=1, refill_seconds=60)
+        parse = common_utils.page_content_from_id("123")
+
+        with patch.dict(liqui_utils.RATE_LIMITS, rate_limits), patch.object(
+            liqui_utils, "_get_json", return_value={"ok": True}
+        ):
+            await liqui_utils.liquipedia_get_json(parse)
+            waiters = [
+                asyncio.create_task(liqui_utils.liquipedia_get_json(parse))
+                for _ in range(liqui_utils.LIQUI_WORKERS)
+            ]
+            await asyncio.sleep(0)
+
+            probe = liqui_utils.liquipedia_get_json(revision_probe("123"))
+            self.assertEqual(await asyncio.wait_for(probe, 5), {"ok": True})
+            for waiter in waiters:
+                waiter.cancel()
+            await asyncio.gather(*waiters, return_exceptions=True)
+
+
+class TestPageIdCache(unittest.TestCase):
+    def test_normalize_page_title(self):
+        self.assertEqual(
+            normalize_page_title(
+                "rocket_League_Championship_Series/2024%20Worlds/#Bracket"
+            ),
+            "Rocket_League_Championship_Series/2024_Worlds",
+        )
+
+    def test_persists_across_restarts(self):
+        with tempfile.TemporaryDirectory() as directory:
+            PageIdCache(directory).put("RLCS/2024", "123")
+            PageIdCache(directory).put("RLCS/2025", "456")
+
+            cache = PageIdCache(directory)
+            self.assertEqual(cache.get("RLCS/2024"), "123")
+            cache.invalidate("RLCS/2024")
+            self.assertIsNone(PageIdCache(directory).get("RLCS/2024"))
+            self.assertEqual(PageIdCache(directory).get("RLCS/2025"), "456")
+
+
+class TestPageContentCache(unittest.TestCase):
+    def test_drops_least_recently_used(self):
+        cache = PageContentCache(max_pages=2)
+        cache.put("1", (10, 1), "one")
+        cache.put("2", (20, 2), "two")
+        cache.get("1")
+        cache.put("3", (30, 3), "three")
+
+        self.assertEqual(cache.get("1"), ((10, 1), "one"))
+        self.assertIsNone(cache.get("2"))
+        cache.invalidate("3")
+        self.assertIsNone(cache.get("3"))
+
+
+if __name__ == "__main__":
+    unittest.main()
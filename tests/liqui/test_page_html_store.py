@@ -0,0 +1,98 @@
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.realpath(__file__)) + "/../..")
+
+import tempfile
+import unittest
+
+from liqui.page_content_cache import PageContentCache
+from liqui.page_html_store import PageHtmlStore
+
+DAY = 24 * 60 * 60
+
+
+class FakeClock(object):
+    def __init__(self):
+        self.now = 1_700_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestPageHtmlStore(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.clock = FakeClock()
+
+    def store(self, **kwargs):
+        return PageHtmlStore(self.directory.name, clock=self.clock, **kwargs)
+
+    def test_survives_restarts_compressed(self):
+        html = "<div class='teamcard'>G2</div>" * 1000
+        self.store().put("113085", (10, 1), html)
+
+        self.assertEqual(self.store().get("113085"), ((10, 1), html))
+        self.assertIsNone(self.store().get("999"))
+        self.assertLess(self.store().size_bytes(), len(html) / 10)
+
+    def test_newer_revision_replaces_older(self):
+        store = self.store()
+        store.put("1", (10, 1), "old")
+        store.put("1", (11, 1), "new")
+        store.put("1", (9, 1), "older")
+
+        self.assertEqual(store.get("1"), ((11, 1), "new"))
+        self.assertEqual(os.listdir(self.directory.name), ["1-11-1.html.gz"])
+
+    def test_rerendered_page_replaces_older(self):
+        store = self.store()
+        store.put("1", (10, 1), "old")
+        store.put("1", (10, 2), "rerendered")
+
+        self.assertEqual(self.store().get("1"), ((10, 2), "rerendered"))
+        self.assertEqual(os.listdir(self.directory.name), ["1-10-2.html.gz"])
+
+    def test_unused_pages_expire(self):
+        store = self.store(ttl_seconds=DAY)
+        store.put("1", (10, 1), "one")
+        store.put("2", (20, 1), "two")
+
+        self.clock.now += DAY / 2
+        store.get("1")
+        self.clock.now += DAY / 2 + 1
+
+        self.assertEqual(store.get("1"), ((10, 1), "one"))
+        self.assertIsNone(store.get("2"))
+        self.clock.now += DAY + 1
+        self.assertIsNone(self.store(ttl_seconds=DAY).get("1"))
+        self.assertEqual(os.listdir(self.directory.name), [])
+
+    def test_size_cap_drops_least_recently_used(self):
+        store = self.store()
+        store.put("1", (10, 1), "one")
+        page_bytes = store.size_bytes()
+        store = self.store(max_bytes=2 * page_bytes)
+        self.clock.now += 1
+        store.put("2", (20, 1), "two")
+        self.clock.now += 1
+        store.get("1")
+        self.clock.now += 1
+        store.put("3", (30, 1), "six")
+
+        self.assertEqual(store.get("1"), ((10, 1), "one"))
+        self.assertIsNone(store.get("2"))
+        self.assertEqual(store.get("3"), ((30, 1), "six"))
+
+    def test_content_cache_reads_back_from_store(self):
+        PageContentCache(store=self.store()).put("1", (10, 1), "one")
+
+        restarted = PageContentCache(store=self.store())
+        self.assertEqual(restarted.get("1"), ((10, 1), "one"))
+        restarted.invalidate("1")
+        self.assertIsNone(PageContentCache(store=self.store()).get("1"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -7,9 +7,9 @@ sys.path.append(os.path.dirname(os.path.realpath(__file__)) + "/../..")
 
 import unittest
 from unittest.mock import AsyncMock, MagicMock, patch
-from bs4 import BeautifulSoup
 
 from liqui import prizepool_lookup
+from liqui.liquipedia_page import LiquipediaPage
 import global_settings
 
 
@@ -24,6 +24,7 @@ class TestPrizepoolLookup(unittest.IsolatedAsyncioTestCase):
 
         # Mock liqui_utils
         self.liqui_utils_patch = patch("liqui.prizepool_lookup.liqui_utils").start()
+        self.liqui_utils_patch.fetch_page = AsyncMock()
 
         # Mock stdout
         self.print_to_channel_patch = patch(
@@ -96,7 +97,7 @@ class TestPrizepoolLookup(unittest.IsolatedAsyncioTestCase):
             </div>
         </div>
         """
-        self.liqui_utils_patch.get_page_html_from_url.return_value = mock_html
+        self.liqui_utils_patch.fetch_page.return_value = LiquipediaPage(mock_html)
 
         await prizepool_lookup.handle_prizepool_lookup(liquipedia_url, channel)
 
@@ -106,8 +107,8 @@ class TestPrizepoolLookup(unittest.IsolatedAsyncioTestCase):
         )
 
         # Verify RLEB parsing was used
-        self.liqui_utils_patch.get_page_html_from_url.assert_called_once_with(
-            liquipedia_url
+        self.liqui_utils_patch.fetch_page.assert_called_once_with(
+            liquipedia_url, ("prize_rows",)
         )
 
         # Verify markdown was printed
@@ -141,12 +142,12 @@ class TestPrizepoolLookup(unittest.IsolatedAsyncioTestCase):
             </tr>
         </table>
         """
-        self.liqui_utils_patch.get_page_html_from_url.return_value = mock_html
+        self.liqui_utils_patch.fetch_page.return_value = LiquipediaPage(mock_html)
 
         await prizepool_lookup.handle_prizepool_lookup(liquipedia_url, channel)
 
         # Verify RLEB parsing was attempted (shouldn't crash)
-        self.liqui_utils_patch.get_page_html_from_url.assert_called_once()
+        self.liqui_utils_patch.fetch_page.assert_called_once()
 
     async def test_handle_prizepool_lookup_with_partial_rows(self):
         """Test prizepool lookup handles partial rows (tied placements)."""
@@ -182,7 +183,7 @@ class TestPrizepoolLookup(unittest.IsolatedAsyncioTestCase):
             </div>
         </div>
         """
-        self.liqui_utils_patch.get_page_html_from_url.return_value = mock_html
+        self.liqui_utils_patch.fetch_page.return_value = LiquipediaPage(mock_html)
 
         await prizepool_lookup.handle_prizepool_lookup(liquipedia_url, channel)
 
@@ -227,7 +228,7 @@ class TestPrizepoolLookup(unittest.IsolatedAsyncioTestCase):
             </div>
         </div>
         """
-        self.liqui_utils_patch.get_page_html_from_url.return_value = mock_html
+        self.liqui_utils_patch.fetch_page.return_value = LiquipediaPage(mock_html)
 
         await prizepool_lookup.handle_prizepool_lookup(liquipedia_url, channel)
 
@@ -268,7 +269,7 @@ class TestPrizepoolLookup(unittest.IsolatedAsyncioTestCase):
             {teams_html}
         </div>
         """
-        self.liqui_utils_patch.get_page_html_from_url.return_value = mock_html
+        self.liqui_utils_patch.fetch_page.return_value = LiquipediaPage(mock_html)
 
         await prizepool_lookup.handle_prizepool_lookup(liquipedia_url, channel)
 
@@ -289,14 +290,9 @@ class TestPrizepoolLookup(unittest.IsolatedAsyncioTestCase):
 
         # Mock page loading error
         error_message = "Failed to load page"
-        self.liqui_utils_patch.get_page_html_from_url.side_effect = Exception(
-            error_message
-        )
+        self.liqui_utils_patch.fetch_page.side_effect = Exception(error_message)
 
-        # Note: The actual code has a bug where it doesn't return after catching the exception,
-        # causing it to try to parse None. We'll test that the error handling code is reached.
-        with self.assertRaises(TypeError):  # BeautifulSoup will fail on None
-            await prizepool_lookup.handle_prizepool_lookup(liquipedia_url, channel)
+        await prizepool_lookup.handle_prizepool_lookup(liquipedia_url, channel)
 
         # Verify error was sent to channel
         channel.send.assert_any_call(
@@ -308,6 +304,7 @@ class TestPrizepoolLookup(unittest.IsolatedAsyncioTestCase):
             f"MVP: Couldn't load {liquipedia_url}!\nError: {error_message}"
         )
         self.log_error_patch.assert_called_once()
+        self.print_to_channel_patch.assert_not_called()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,99 @@
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.realpath(__file__)) + "/../..")
+
+import asyncio
+import unittest
+
+from instrumentation import Instrumentation
+from liqui.rate_limiter import RateLimitExceeded, TokenBucket
+
+
+class FakeClock(object):
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    async def sleep(self, seconds):
+        self.sleeps.append(seconds)
+
+
+class TestTokenBucket(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.instrumentation = Instrumentation()
+        self.bucket = TokenBucket(
+            "parse",
+            capacity=2,
+            refill_seconds=30,
+            max_waiting=2,
+            instrumentation=self.instrumentation,
+            clock=self.clock,
+            sleep=self.clock.sleep,
+        )
+
+    async def test_bursts_then_waits_in_order(self):
+        waits = [await self.bucket.acquire() for _ in range(4)]
+
+        self.assertEqual(waits, [0.0, 0.0, 30.0, 60.0])
+        self.assertEqual(self.clock.sleeps, [30.0, 60.0])
+        stats = self.instrumentation.snapshot()["liqui.rate_limit.parse"]
+        self.assertEqual(stats["calls"], 4)
+
+    async def test_refills_over_time_up_to_capacity(self):
+        await self.bucket.acquire()
+        await self.bucket.acquire()
+
+        self.clock.now = 15.0
+        self.assertEqual(await self.bucket.acquire(), 15.0)
+
+        self.clock.now = 1000.0
+        self.assertEqual(
+            [await self.bucket.acquire() for _ in range(3)], [0.0, 0.0, 30.0]
+        )
+
+    async def test_queue_depth_is_gauged_and_capped(self):
+        await self.bucket.acquire()
+        await self.bucket.acquire()
+        release = asyncio.Event()
+
+        async def blocking_sleep(seconds):
+            await release.wait()
+
+        self.bucket._sleep = blocking_sleep
+        waiters = [asyncio.create_task(self.bucket.acquire()) for _ in range(2)]
+        await asyncio.sleep(0)
+
+        gauge = "liqui.rate_limit.parse.queue_depth"
+        self.assertEqual(self.instrumentation.gauges()[gauge], 2)
+        with self.assertRaises(RateLimitExceeded):
+            await self.bucket.acquire()
+        release.set()
+        self.assertEqual(await asyncio.gather(*waiters), [30.0, 60.0])
+        self.assertEqual(self.instrumentation.gauges()[gauge], 0)
+
+    async def test_cancelled_wait_returns_its_token(self):
+        await self.bucket.acquire()
+        await self.bucket.acquire()
+
+        async def never(seconds):
+            await asyncio.Event().wait()
+
+        self.bucket._sleep = never
+        waiter = asyncio.create_task(self.bucket.acquire())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await waiter
+
+        self.bucket._sleep = self.clock.sleep
+        self.assertEqual(await self.bucket.acquire(), 30.0)
+        self.assertEqual(self.bucket._waiting, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
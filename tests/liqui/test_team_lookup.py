@@ -10,6 +10,7 @@ from unittest.mock import patch, AsyncMock
 
 from ..common import common_utils
 from data_bridge import Data
+from liqui import liqui_utils
 
 import requests
 import discord
@@ -55,12 +56,16 @@ class TestTeamLookup(unittest.IsolatedAsyncioTestCase):
                     status_code=self.forced_status_code,
                 )
 
-        self.mock_requests_get = patch.object(requests, "get", new=mock_request).start()
+        self.mock_requests_get = patch.object(
+            liqui_utils, "http_get", new=mock_request
+        ).start()
         self.mock_requests_post = patch.object(
             requests, "post", new=mock_request
         ).start()
-        self.addCleanup(self.mock_requests_get)
-        self.addCleanup(self.mock_requests_post)
+        patch.dict(
+            liqui_utils.RATE_LIMITS, common_utils.unlimited_rate_limits()
+        ).start()
+        self.addCleanup(patch.stopall)
 
     async def test_team_lookup(self):
         mock_channel = mock.Mock(spec=discord.TextChannel)
@@ -0,0 +1,84 @@
+# Dumb hack to be able to access source code files on both windows and linux
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.realpath(__file__)) + "/..")
+
+import unittest
+
+from error_reporter import ErrorReporter, fingerprint
+
+
+class TestErrorReporter(unittest.TestCase):
+    def test_fingerprint_ignores_numbers(self):
+        self.assertEqual(
+            fingerprint("[REDDIT]: 503 on post 1abc2 at 0x7f3a"),
+            fingerprint("[REDDIT]:  503 on post 9abc8 at 0x11ff"),
+        )
+        self.assertNotEqual(fingerprint("reddit down"), fingerprint("discord down"))
+
+    def test_repeats_coalesce_into_one_summary(self):
+        reporter = ErrorReporter(window_seconds=60)
+        for i in range(100):
+            reporter.add(f"[REDDIT]: stream_modlog() -> 503 (attempt {i})", now=i / 10)
+
+        self.assertEqual(
+            reporter.take_messages(now=10),
+            ["[REDDIT]: stream_modlog() -> 503 (attempt 0)"],
+        )
+        self.assertEqual(reporter.take_messages(now=30), [])
+        self.assertEqual(
+            reporter.take_messages(now=60),
+            ["[repeated 99x in 60s] [REDDIT]: stream_modlog() -> 503 (attempt 0)"],
+        )
+        self.assertEqual(reporter.stats()["coalesced"], 99)
+
+        # After the window, the same error is reported again.
+        reporter.add("[REDDIT]: stream_modlog() -> 503 (attempt 100)", now=61)
+        self.assertEqual(len(reporter.take_messages(now=61)), 1)
+
+    def test_packs_errors_up_to_limit(self):
+        reporter = ErrorReporter(message_limit=26, max_messages=2)
+        for name in ["alpha", "beta", "gamma", "delta", "epsilon", "zeta"]:
+            reporter.add(f"{name} failed", now=0)
+        reporter.add("x" * 40, now=0)
+
+        self.assertEqual(
+            reporter.take_messages(now=0),
+            ["alpha failed\nbeta failed", "gamma failed\ndelta failed"],
+        )
+        self.assertEqual(
+            reporter.take_messages(now=0),
+            ["epsilon failed\nzeta failed", "x" * 23 + "..."],
+        )
+
+    def test_failed_messages_are_requeued_first(self):
+        reporter = ErrorReporter(max_messages=1)
+        reporter.add("first", now=0)
+        messages = reporter.take_messages(now=0)
+        reporter.add("second", now=0)
+
+        reporter.requeue(messages)
+
+        self.assertEqual(reporter.take_messages(now=0), ["first\nsecond"])
+
+    def test_requeue_into_full_backlog_drops_oldest(self):
+        reporter = ErrorReporter(max_messages=2, message_limit=5, backlog=3)
+        for name in ["a", "b"]:
+            reporter.add(f"{name} err", now=0)
+        messages = reporter.take_messages(now=0)
+        for name in ["c", "d"]:
+            reporter.add(f"{name} err", now=0)
+
+        reporter.requeue(messages)
+
+        # Only one of the failed messages fits, newer errors are never pushed out.
+        self.assertEqual(reporter.stats()["dropped"], 1)
+        self.assertEqual(
+            reporter.take_messages(now=0) + reporter.take_messages(now=0),
+            ["b err", "c err", "d err"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+# Dumb hack to be able to access source code files on both windows and linux
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.realpath(__file__)) + "/..")
+
+import asyncio
+import json
+import unittest
+
+from data_bridge import DataStub
+from instrumentation import Instrumentation, instrumented
+from test_data_stub import DataStubWithSampleData
+
+
+class TestInstrumentation(unittest.TestCase):
+    def setUp(self):
+        Instrumentation._singleton = None
+
+    def tearDown(self):
+        Instrumentation._singleton = None
+
+    def test_percentiles(self):
+        instrumentation = Instrumentation()
+        for ms in range(1, 101):
+            instrumentation.record("db.read_logs", ms / 1000, rows=2)
+        instrumentation.record("db.read_logs", 0.5, error=True)
+
+        stats = instrumentation.snapshot()["db.read_logs"]
+
+        self.assertEqual(
+            (stats["calls"], stats["errors"], stats["rows"]), (101, 1, 200)
+        )
+        self.assertEqual(stats["p50_ms"], 51)
+        self.assertEqual(stats["p95_ms"], 96)
+        self.assertEqual(stats["p99_ms"], 100)
+
+    def test_summary_and_dump(self):
+        instrumentation = Instrumentation()
+        instrumentation.record("db.fast", 0.001)
+        instrumentation.record("db.slow", 0.2)
+        instrumentation.record("liqui.fetch", 1.0)
+
+        summary = instrumentation.summary("db.")
+
+        self.assertEqual(len(summary), 2)
+        self.assertTrue(summary[0].startswith("slow: 1 calls, p50 200.0ms"))
+        dump = json.loads(instrumentation.dump({"data_backend": "DataStub"}))
+        self.assertEqual(dump["data_backend"], "DataStub")
+        self.assertEqual(set(dump["operations"]), {"db.fast", "db.slow", "liqui.fetch"})
+
+    def test_gauges(self):
+        instrumentation = Instrumentation()
+        instrumentation.gauge("liqui.rate_limit.query.queue_depth", 3)
+        instrumentation.gauge("liqui.rate_limit.query.queue_depth", 1)
+        instrumentation.gauge("db.pool", 2)
+
+        self.assertEqual(
+            instrumentation.gauges("liqui."), {"liqui.rate_limit.query.queue_depth": 1}
+        )
+        self.assertEqual(json.loads(instrumentation.dump())["gauges"]["db.pool"], 2)
+
+    def test_instrumented_records_rows_and_errors(self):
+        @instrumented("sync")
+        def rows(n):
+            if n < 0:
+                raise ValueError()
+            return list(range(n))
+
+        @instrumented("async")
+        async def one():
+            return "row"
+
+        rows(3)
+        with self.assertRaises(ValueError):
+            rows(-1)
+        asyncio.run(one())
+
+        snapshot = Instrumentation.singleton().snapshot()
+        self.assertEqual(
+            (
+                snapshot["sync"]["calls"],
+                snapshot["sync"]["rows"],
+                snapshot["sync"]["errors"],
+            ),
+            (2, 3, 1),
+        )
+        self.assertEqual(snapshot["async"]["rows"], 1)
+
+    def test_data_backends_are_instrumented(self):
+        DataStub.singleton().read_logs()
+        data = DataStubWithSampleData.singleton()
+        data.reset_to_sample_data()
+        aliases = data.read_all_aliases()
+        data.cache_stats()
+
+        snapshot = Instrumentation.singleton().snapshot("db.")
+        self.assertEqual(snapshot["db.read_logs"]["rows"], 0)
+        self.assertEqual(snapshot["db.read_all_aliases"]["rows"], len(aliases))
+        self.assertNotIn("db.cache_stats", snapshot)
+        self.assertNotIn("db._initialize", snapshot)
+
+
+if __name__ == "__main__":
+    unittest.main()
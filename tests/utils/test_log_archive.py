@@ -0,0 +1,110 @@
+# Dumb hack to be able to access source code files on both windows and linux
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.realpath(__file__)) + "/..")
+
+import gzip
+import tempfile
+import unittest
+import unittest.mock as mock
+from datetime import datetime, timedelta
+
+from log_archive import LogArchive
+
+START = datetime(2026, 1, 1)
+
+
+def log(i: int) -> tuple[datetime, str]:
+    return (START + timedelta(minutes=i), f"log {i}\nline {i % 3}")
+
+
+class TestLogArchive(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.archive = LogArchive(
+            self.directory.name, segment_bytes=1000, block_lines=4, max_segments=50
+        )
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_rotates_into_gzip_segments_with_index(self):
+        self.archive.append([log(i) for i in range(100)])
+        self.archive.append([log(i) for i in range(100, 110)])
+
+        segments = sorted(os.listdir(self.directory.name))
+        self.assertIn("segment-000001.log.gz", segments)
+        self.assertIn("segment-000001.idx", segments)
+        with gzip.open(os.path.join(self.directory.name, "segment-000001.log.gz")) as f:
+            self.assertEqual(f.read().decode().count("\n"), 100)
+
+        # The index survives a restart.
+        reopened = LogArchive(self.directory.name, block_lines=4)
+        self.assertEqual(reopened.oldest_time(), log(0)[0])
+        self.assertEqual(reopened.read(200), [log(i) for i in range(110)])
+
+    def test_read_newest_in_time_range(self):
+        for i in range(0, 300, 10):
+            self.archive.append([log(j) for j in range(i, i + 10)])
+            if i % 50 == 0:
+                self.archive.rotate()
+
+        self.assertEqual(self.archive.read(3), [log(297), log(298), log(299)])
+        self.assertEqual(
+            self.archive.read(3, end=log(150)[0]), [log(147), log(148), log(149)]
+        )
+        self.assertEqual(
+            self.archive.read(100, start=log(95)[0], end=log(98)[0]),
+            [log(95), log(96), log(97)],
+        )
+        self.assertEqual(
+            self.archive.read(2, "LINE 1", end=log(150)[0]), [log(145), log(148)]
+        )
+        self.assertEqual(self.archive.read(5, "log 1000"), [])
+
+    def test_only_decompresses_segments_in_range(self):
+        for i in range(0, 100, 10):
+            self.archive.append([log(j) for j in range(i, i + 10)])
+            self.archive.rotate()
+
+        with mock.patch("log_archive.gzip.open", wraps=gzip.open) as gzip_open:
+            logs = self.archive.read(100, start=log(42)[0], end=log(45)[0])
+
+        self.assertEqual(logs, [log(42), log(43), log(44)])
+        self.assertEqual(gzip_open.call_count, 1)
+
+    def test_reads_files_without_holding_lock(self):
+        self.archive.append([log(i) for i in range(10)])
+        self.archive.rotate()
+        self.archive.append([log(i) for i in range(10, 15)])
+        gzip_open = gzip.open
+
+        def append_while_decompressing(*args, **kwargs):
+            # Appends and rotations carry on while a read decompresses segments.
+            self.assertFalse(self.archive._lock.locked())
+            self.archive.append([log(i) for i in range(15, 20)])
+            self.archive.rotate()
+            return gzip_open(*args, **kwargs)
+
+        with mock.patch(
+            "log_archive.gzip.open", side_effect=append_while_decompressing
+        ):
+            logs = self.archive.read(100)
+
+        # Logs written after the read started aren't part of it.
+        self.assertEqual(logs, [log(i) for i in range(15)])
+        self.assertEqual(self.archive.read(100), [log(i) for i in range(20)])
+
+    def test_drops_oldest_segments(self):
+        archive = LogArchive(self.directory.name, max_segments=2)
+        for i in range(4):
+            archive.append([log(i)])
+            archive.rotate()
+
+        self.assertEqual(archive.oldest_time(), log(2)[0])
+        self.assertEqual(len(os.listdir(self.directory.name)), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
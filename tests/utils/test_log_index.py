@@ -0,0 +1,87 @@
+# Dumb hack to be able to access source code files on both windows and linux
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.realpath(__file__)) + "/..")
+
+import unittest
+from datetime import datetime
+
+from log_index import LogIndex, tokenize
+
+
+def log(i: int, message: str) -> tuple[datetime, str]:
+    return (datetime(2026, 1, 1, 0, 0, i), message)
+
+
+class TestLogIndex(unittest.TestCase):
+    def test_tokenize(self):
+        self.assertEqual(
+            tokenize("ERROR: Liquipedia 429 on /rlcs_2026"),
+            ["error", "liquipedia", "429", "on", "rlcs_2026"],
+        )
+
+    def test_latest_and_oldest_time(self):
+        index = LogIndex(capacity=3)
+        self.assertIsNone(index.oldest_time())
+        for i in range(5):
+            index.add(*log(i, f"log {i}"))
+
+        self.assertEqual(len(index), 3)
+        self.assertEqual(index.oldest_time(), log(2, "")[0])
+        self.assertEqual(index.latest(2), [log(3, "log 3"), log(4, "log 4")])
+        self.assertEqual(len(index.latest(10)), 3)
+
+    def test_search_returns_newest_matches_oldest_first(self):
+        index = LogIndex(capacity=10)
+        for i in range(6):
+            index.add(*log(i, f"{'Error' if i % 2 else 'Info'}: thread {i}"))
+
+        self.assertEqual(
+            index.search("error", 2),
+            [log(3, "Error: thread 3"), log(5, "Error: thread 5")],
+        )
+        self.assertEqual(
+            index.search("error: thread 1", 5), [log(1, "Error: thread 1")]
+        )
+        self.assertEqual(index.search("missing", 5), [])
+
+    def test_partial_words_scan(self):
+        index = LogIndex(capacity=10)
+        index.add(*log(0, "Reddit stream died"))
+        index.add(*log(1, "redditor joined"))
+
+        self.assertEqual(len(index.search("reddit", 5)), 2)
+        self.assertEqual(len(index.search("reddit stream", 5)), 1)
+        self.assertEqual(len(index.search("eddi", 5)), 2)
+        self.assertEqual(len(index.search("!!", 5)), 0)
+
+    def test_indexed_words_still_match_longer_words(self):
+        index = LogIndex(capacity=10)
+        index.add(*log(0, "REDDIT: ratelimit hit"))
+        index.add(*log(1, "ERRORS: 2"))
+        index.add(*log(2, "refresh rate 5s"))
+        index.add(*log(3, "ERROR: boom"))
+
+        self.assertEqual(
+            index.search("rate", 5),
+            [log(0, "REDDIT: ratelimit hit"), log(2, "refresh rate 5s")],
+        )
+        self.assertEqual(len(index.search("error", 5)), 2)
+        self.assertEqual(index.search("it: rate", 5), [log(0, "REDDIT: ratelimit hit")])
+        self.assertEqual(index.search("h rate 5", 5), [log(2, "refresh rate 5s")])
+        self.assertEqual(index.search("refresh ratelimit", 5), [])
+
+    def test_eviction_removes_postings(self):
+        index = LogIndex(capacity=2)
+        index.add(*log(0, "alpha"))
+        index.add(*log(1, "beta"))
+        index.add(*log(2, "gamma"))
+
+        self.assertNotIn("alpha", index._postings)
+        self.assertEqual(index.search("alpha", 5), [])
+        self.assertEqual(index.search("gamma", 5), [log(2, "gamma")])
+
+
+if __name__ == "__main__":
+    unittest.main()
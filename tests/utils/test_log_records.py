@@ -0,0 +1,90 @@
+# Dumb hack to be able to access source code files on both windows and linux
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.realpath(__file__)) + "/..")
+
+import unittest
+import unittest.mock as mock
+
+import global_settings
+from log_records import DEBUG, INFO, LogRecord, LogSampler
+
+
+class TestLogRecords(unittest.TestCase):
+    def test_message(self):
+        record = LogRecord(
+            INFO, "REDDIT", "Modmail - {id}", {"id": "abc", "state": "new"}
+        )
+        self.assertEqual(record.message(), "INFO: [REDDIT]: Modmail - abc state=new")
+        self.assertEqual(
+            LogRecord(DEBUG, "TASK CHECK", "{literal}").message(),
+            "DEBUG: [TASK CHECK]: {literal}",
+        )
+
+    def test_sampler_keeps_one_in_n_per_subsystem(self):
+        sampler = LogSampler({"REDDIT": 3})
+
+        self.assertEqual(
+            [sampler.sample("REDDIT") for _ in range(6)],
+            [True, False, False, True, False, False],
+        )
+        self.assertTrue(all(sampler.sample("DISCORD") for _ in range(3)))
+
+    def test_sampler_counts_each_call_site(self):
+        sampler = LogSampler({"TASK CHECK": 2})
+
+        # Two call sites logging every cycle each keep every other log.
+        self.assertEqual(
+            [
+                (
+                    sampler.sample("TASK CHECK", "found"),
+                    sampler.sample("TASK CHECK", "unscheduled"),
+                )
+                for _ in range(4)
+            ],
+            [(True, True), (False, False), (True, True), (False, False)],
+        )
+
+
+class TestStructuredLogging(unittest.TestCase):
+    def setUp(self):
+        self.log = mock.patch("global_settings._rleb_log").start()
+        self.addCleanup(mock.patch.stopall)
+        mock.patch.object(global_settings, "log_level", DEBUG).start()
+        mock.patch.object(
+            global_settings, "log_sampler", LogSampler({"REDDIT": 2})
+        ).start()
+
+    def test_debug_logs_are_sampled(self):
+        for i in range(4):
+            global_settings.rleb_log_debug("REDDIT", "Modmail - {id}", id=i)
+
+        self.assertEqual(
+            [c[0][0] for c in self.log.call_args_list],
+            ["DEBUG: [REDDIT]: Modmail - 0", "DEBUG: [REDDIT]: Modmail - 2"],
+        )
+
+    def test_debug_logs_are_sampled_per_call_site(self):
+        for i in range(2):
+            global_settings.rleb_log_debug("REDDIT", "Modmail - {id}", id=i)
+            global_settings.rleb_log_debug("REDDIT", "Inbox - {id}", id=i)
+
+        self.assertEqual(
+            [c[0][0] for c in self.log.call_args_list],
+            ["DEBUG: [REDDIT]: Modmail - 0", "DEBUG: [REDDIT]: Inbox - 0"],
+        )
+
+    def test_level_filter_skips_formatting(self):
+        global_settings.log_level = INFO
+        with mock.patch("global_settings.LogRecord") as record:
+            global_settings.rleb_log_debug("REDDIT", "Modmail - {id}", id=1)
+            record.assert_not_called()
+        self.log.assert_not_called()
+
+        global_settings.rleb_log(INFO, "REMINDME", "Sent {count}", count=2)
+        self.assertEqual(self.log.call_args[0][0], "INFO: [REMINDME]: Sent 2")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,147 @@
+# Dumb hack to be able to access source code files on both windows and linux
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.realpath(__file__)) + "/..")
+
+import asyncio
+import threading
+import unittest
+import unittest.mock as mock
+from datetime import datetime
+
+from data_bridge import Data
+from log_shipper import LogShipper
+from test_data_stub import DataStubWithSampleData
+
+
+def log(i: int) -> tuple[datetime, str]:
+    return (datetime(2026, 1, 1, 0, 0, i), f"log {i}")
+
+
+class TestLogShipper(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.data = DataStubWithSampleData.singleton()
+        self.data.reset_to_sample_data()
+        self.data.write_to_logs = mock.Mock()
+        self.data_patch = mock.patch(
+            "data_bridge.Data.singleton", return_value=self.data
+        )
+        self.data_patch.start()
+
+    async def asyncTearDown(self):
+        Data._singleton = None
+        self.data_patch.stop()
+
+    async def test_ships_in_batches(self):
+        shipper = LogShipper(capacity=100, batch_size=2)
+        for i in range(5):
+            shipper.enqueue(*log(i))
+
+        self.assertEqual(await shipper.ship(), 5)
+
+        self.assertEqual(
+            [c[0][0] for c in self.data.write_to_logs.call_args_list],
+            [[log(0), log(1)], [log(2), log(3)], [log(4)]],
+        )
+        self.assertEqual(shipper.stats()["shipped"], 5)
+        self.assertEqual(shipper.pending(), [])
+
+    async def test_drops_oldest_when_full(self):
+        shipper = LogShipper(capacity=3, batch_size=10)
+        for i in range(5):
+            shipper.enqueue(*log(i))
+
+        self.assertEqual(shipper.pending(), [log(2), log(3), log(4)])
+        self.assertEqual(shipper.stats()["dropped"], 2)
+
+    async def test_failed_batch_is_requeued_in_order(self):
+        shipper = LogShipper(capacity=3, batch_size=2)
+        for i in range(3):
+            shipper.enqueue(*log(i))
+        self.data.write_to_logs.side_effect = Exception("db down")
+
+        with self.assertRaises(Exception):
+            await shipper.ship()
+        shipper.enqueue(*log(3))
+
+        # The oldest failed log made room for the new one.
+        self.assertEqual(shipper.pending(), [log(1), log(2), log(3)])
+        self.assertEqual(shipper.stats()["failed_batches"], 1)
+        self.assertEqual(shipper.stats()["dropped"], 1)
+
+    async def test_flush_blocks_until_written(self):
+        shipper = LogShipper(capacity=100, batch_size=2)
+        for i in range(3):
+            shipper.enqueue(*log(i))
+
+        self.assertEqual(shipper.flush(), 3)
+        self.assertEqual(self.data.write_to_logs.call_count, 2)
+
+    async def test_archives_even_without_db(self):
+        archive = mock.Mock()
+        shipper = LogShipper(capacity=100, batch_size=2, archive=archive)
+        for i in range(3):
+            shipper.enqueue(*log(i))
+
+        self.assertEqual(await shipper.ship(to_db=False), 0)
+        shipper.enqueue(*log(3))
+        shipper.flush(to_db=False)
+
+        self.assertEqual(
+            [c[0][0] for c in archive.append.call_args_list],
+            [[log(0), log(1), log(2)], [log(3)]],
+        )
+        self.data.write_to_logs.assert_not_called()
+        self.assertEqual(shipper.stats()["archived"], 4)
+        self.assertEqual(shipper.pending(), [])
+
+    async def test_full_archive_buffer_counts_dropped_logs(self):
+        archive = mock.Mock()
+        shipper = LogShipper(capacity=3, batch_size=10, archive=archive)
+        for i in range(5):
+            shipper.enqueue(*log(i))
+
+        await shipper.ship(to_db=False)
+
+        archive.append.assert_called_once_with([log(2), log(3), log(4)])
+        self.assertEqual(shipper.stats()["archive_dropped"], 2)
+
+    async def test_archive_failure_does_not_block_db(self):
+        archive = mock.Mock()
+        archive.append.side_effect = OSError("disk full")
+        shipper = LogShipper(capacity=100, batch_size=2, archive=archive)
+        shipper.enqueue(*log(0))
+
+        self.assertEqual(await shipper.ship(), 1)
+        self.assertEqual(shipper.stats()["archive_failures"], 1)
+
+    async def test_full_batch_from_another_thread_wakes_shipper(self):
+        shipper = LogShipper(capacity=100, batch_size=2)
+        waiter = asyncio.create_task(shipper.wait_for_batch(60))
+        await asyncio.sleep(0)
+
+        thread = threading.Thread(
+            target=lambda: [shipper.enqueue(*log(i)) for i in range(2)]
+        )
+        thread.start()
+        thread.join()
+
+        await asyncio.wait_for(waiter, 1)
+
+    async def test_urgent_log_wakes_shipper(self):
+        shipper = LogShipper(capacity=100, batch_size=50)
+        waiter = asyncio.create_task(shipper.wait_for_batch(60))
+        await asyncio.sleep(0)
+
+        shipper.enqueue(*log(0))
+        await asyncio.sleep(0.01)
+        self.assertFalse(waiter.done())
+
+        shipper.enqueue(*log(1), urgent=True)
+        await asyncio.wait_for(waiter, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+# Dumb hack to be able to access source code files on both windows and linux
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.realpath(__file__)) + "/..")
+
+import asyncio
+import time
+import unittest
+import unittest.mock as mock
+
+from data_bridge import Data, Remindme
+from remindme_scheduler import RemindmeScheduler
+from test_data_stub import DataStubWithSampleData
+
+
+class TestRemindmeScheduler(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        RemindmeScheduler._singleton = None
+        self.data = DataStubWithSampleData.singleton()
+        self.data.reset_to_sample_data()
+        self.data_patch = mock.patch(
+            "data_bridge.Data.singleton", return_value=self.data
+        )
+        self.data_patch.start()
+
+    async def asyncTearDown(self):
+        RemindmeScheduler._singleton = None
+        Data._singleton = None
+        self.data_patch.stop()
+
+    async def test_load_reads_db_once(self):
+        self.data.write_remindme("user", "first", 100, 1)
+        self.data.read_remindmes = mock.Mock(wraps=self.data.read_remindmes)
+
+        scheduler = RemindmeScheduler.singleton()
+        await scheduler.load()
+        await scheduler.load()
+
+        self.data.read_remindmes.assert_called_once()
+        self.assertEqual(len(scheduler), 1)
+
+    def test_pops_due_remindmes_in_order(self):
+        scheduler = RemindmeScheduler()
+        scheduler.add(Remindme(1, "user", "late", 300, 1))
+        scheduler.add(Remindme(2, "user", "early", 100, 1))
+        scheduler.add(Remindme(3, "user", "middle", 200, 1))
+
+        self.assertEqual(scheduler.seconds_until_next(now=50), 50)
+        self.assertEqual(scheduler.pop_due(now=50), [])
+        self.assertEqual(
+            [r.message for r in scheduler.pop_due(now=250)], ["early", "middle"]
+        )
+        self.assertEqual(scheduler.seconds_until_next(now=250), 50)
+        self.assertEqual(len(scheduler), 1)
+
+    def test_removed_remindmes_are_skipped(self):
+        scheduler = RemindmeScheduler()
+        scheduler.add(Remindme(1, "user", "cancelled", 100, 1))
+        scheduler.add(Remindme(2, "user", "kept", 200, 1))
+
+        self.assertEqual(scheduler.remove(1).message, "cancelled")  # type: ignore
+        self.assertIsNone(scheduler.remove(1))
+        self.assertIsNone(scheduler.get(1))
+
+        self.assertEqual(scheduler.seconds_until_next(now=0), 200)
+        self.assertEqual([r.message for r in scheduler.pop_due(now=300)], ["kept"])
+        self.assertIsNone(scheduler.seconds_until_next())
+
+    async def test_schedule_and_cancel_write_through(self):
+        scheduler = RemindmeScheduler.singleton()
+        remindme = await scheduler.schedule("user", "msg", 60, 1)
+
+        self.assertEqual(self.data.read_remindme(remindme.remindme_id), remindme)
+        self.assertEqual(scheduler.get(remindme.remindme_id), remindme)
+
+        await scheduler.cancel(remindme.remindme_id)
+
+        self.assertIsNone(self.data.read_remindme(remindme.remindme_id))
+        self.assertIsNone(scheduler.get(remindme.remindme_id))
+
+    async def test_wait_is_woken_by_new_remindme(self):
+        scheduler = RemindmeScheduler()
+        scheduler.add(Remindme(1, "user", "far away", int(time.time()) + 3600, 1))
+
+        waiter = asyncio.create_task(scheduler.wait_for_next(3600))
+        await asyncio.sleep(0)
+        self.assertFalse(waiter.done())
+
+        scheduler.add(Remindme(2, "user", "now", int(time.time()), 1))
+        await asyncio.wait_for(waiter, 1)
+
+        self.assertEqual([r.message for r in scheduler.pop_due()], ["now"])
+
+    async def test_wait_returns_when_remindme_is_due(self):
+        scheduler = RemindmeScheduler()
+        scheduler.add(Remindme(1, "user", "soon", 0, 1))
+        with mock.patch("remindme_scheduler.time.time", return_value=-0.01):
+            await asyncio.wait_for(scheduler.wait_for_next(3600), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+# Dumb hack to be able to access source code files on both windows and linux
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.realpath(__file__)) + "/..")
+
+import unittest
+import unittest.mock as mock
+
+from data_bridge import Data
+from scheduled_post_tracker import SYNC_OVERLAP_SECONDS, ScheduledPostTracker
+from test_data_stub import DataStubWithSampleData
+
+WEEK = 7 * 86400
+
+
+class TestScheduledPostTracker(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        ScheduledPostTracker._singleton = None
+        self.data = DataStubWithSampleData.singleton()
+        self.data.reset_to_sample_data()
+        self.data_patch = mock.patch(
+            "data_bridge.Data.singleton", return_value=self.data
+        )
+        self.data_patch.start()
+
+    async def asyncTearDown(self):
+        ScheduledPostTracker._singleton = None
+        Data._singleton = None
+        self.data_patch.stop()
+
+    async def test_sync_reads_new_rows_incrementally(self):
+        self.data.read_already_warned_scheduled_posts = mock.Mock(return_value=[1])
+        tracker = ScheduledPostTracker()
+
+        await tracker.sync(now=WEEK + 1000)
+        await tracker.sync(now=WEEK + 2000)
+
+        self.assertEqual(
+            [
+                c[0][0]
+                for c in self.data.read_already_warned_scheduled_posts.call_args_list
+            ],
+            [1000, 1000 + WEEK - SYNC_OVERLAP_SECONDS],
+        )
+        self.assertTrue(tracker.is_warned(1))
+        self.assertFalse(tracker.is_confirmed(1))
+
+    async def test_marked_posts_are_written_in_one_batch(self):
+        self.data.write_already_confirmed_scheduled_posts = mock.Mock()
+        tracker = ScheduledPostTracker()
+
+        tracker.mark_confirmed(1, now=100)
+        tracker.mark_confirmed(2, now=200)
+        tracker.mark_confirmed(1, now=300)
+        await tracker.flush()
+        await tracker.flush()
+
+        self.data.write_already_confirmed_scheduled_posts.assert_called_once_with(
+            [(1, 100), (2, 200)]
+        )
+        self.assertTrue(tracker.is_confirmed(2))
+
+    async def test_failed_flush_is_retried(self):
+        self.data.write_already_warned_scheduled_posts = mock.Mock(
+            side_effect=[Exception("db down"), None]
+        )
+        tracker = ScheduledPostTracker()
+        tracker.mark_warned(1, now=100)
+
+        with self.assertRaises(Exception):
+            await tracker.flush()
+        tracker.mark_warned(2, now=200)
+        await tracker.flush()
+
+        self.data.write_already_warned_scheduled_posts.assert_called_with(
+            [(1, 100), (2, 200)]
+        )
+
+    def test_evicts_posts_outside_the_window(self):
+        tracker = ScheduledPostTracker(window_seconds=1000)
+        tracker.mark_warned(1, now=100)
+        tracker.mark_confirmed(2, now=900)
+
+        tracker.evict(now=1500)
+
+        self.assertFalse(tracker.is_warned(1))
+        self.assertTrue(tracker.is_confirmed(2))
+        self.assertEqual(len(tracker), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()